@@ -0,0 +1,262 @@
+"""
+Offline skill-tag and accessibility classifier.
+
+A small TF-IDF model trained from existing Job rows plus the seed data.
+Used by /api/ai/suggest-tags and as the fallback when Gemini is
+unavailable or the user is rate-limited.
+"""
+import logging
+import math
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+
+from .gemini import SKILL_CATEGORIES, ACCESSIBILITY_FLAGS
+
+logger = logging.getLogger(__name__)
+
+MODEL_TTL = 600  # Rebuild from the database every 10 minutes
+TRAINING_LIMIT = 5000  # Most recent jobs used for training
+MIN_LABEL_DOCS = 2  # Learned (non-category) tags need this many examples
+SKILL_THRESHOLD = 0.18
+FLAG_THRESHOLD = 0.22
+MAX_SKILL_TAGS = 3
+
+# Hand-picked keywords so the model is useful before any jobs exist.
+SKILL_KEYWORDS = {
+    'Teaching': ['teach', 'lesson', 'class', 'instruct', 'esl', 'english', 'explain'],
+    'Programming': ['code', 'coding', 'python', 'program', 'software', 'bug', 'script', 'app'],
+    'First Aid': ['first', 'aid', 'cpr', 'medical', 'injury', 'bandage'],
+    'Physical Labor': ['lift', 'lifting', 'carry', 'carrying', 'move', 'moving', 'furniture', 'box', 'shovel', 'haul'],
+    'Driving': ['drive', 'driving', 'ride', 'car', 'truck', 'pick', 'deliver', 'transport'],
+    'Cooking': ['cook', 'cooking', 'meal', 'bake', 'kitchen', 'recipe', 'food'],
+    'Cleaning': ['clean', 'cleaning', 'tidy', 'vacuum', 'wash', 'laundry', 'trash'],
+    'Gardening': ['garden', 'gardening', 'plant', 'weed', 'yard', 'lawn', 'mow', 'rake'],
+    'Photography': ['photo', 'photograph', 'photography', 'camera', 'picture'],
+    'Graphic Design': ['design', 'flyer', 'poster', 'logo', 'canva', 'graphic'],
+    'Event Planning': ['event', 'party', 'setup', 'gala', 'decorate', 'festival'],
+    'Animal Care': ['dog', 'cat', 'pet', 'animal', 'shelter', 'walk'],
+    'Mechanical': ['repair', 'fix', 'bike', 'tool', 'assemble', 'mechanic'],
+    'Communication': ['talk', 'conversation', 'call', 'outreach', 'phone', 'speak'],
+    'Organization': ['sort', 'organize', 'inventory', 'arrange', 'declutter'],
+    'Healthcare': ['health', 'nurse', 'clinic', 'medication', 'patient', 'elderly', 'senior'],
+    'Web Development': ['website', 'web', 'html', 'css', 'wordpress', 'login'],
+    'Marketing': ['marketing', 'promote', 'social', 'media', 'advertise', 'campaign'],
+    'Editing': ['edit', 'editing', 'proofread', 'essay', 'resume', 'writing'],
+    'Errands': ['errand', 'grocery', 'groceries', 'shopping', 'store', 'pharmacy', 'mail'],
+    'Tutoring': ['tutor', 'tutoring', 'homework', 'math', 'exam', 'study', 'calculus'],
+    'Music': ['music', 'guitar', 'piano', 'sing', 'band', 'instrument'],
+    'Childcare': ['child', 'children', 'kid', 'kids', 'babysit', 'babysitting', 'daycare'],
+}
+
+FLAG_KEYWORDS = {
+    'heavy_lifting': ['heavy', 'lift', 'lifting', 'carry', 'carrying', 'furniture', 'box', 'haul', 'shovel'],
+    'standing_long': ['stand', 'standing', 'booth', 'sort', 'cashier', 'usher'],
+    'driving_required': ['drive', 'driving', 'car', 'truck', 'ride', 'deliver', 'transport'],
+    'outdoor_work': ['outdoor', 'outside', 'yard', 'garden', 'snow', 'lawn', 'park', 'walk'],
+}
+
+STOPWORDS = frozenset(
+    'a an and are as at be by for from has have help i in is it my need needs of on or '
+    'our some someone that the their this to we with you your will can who'.split()
+)
+
+_TOKEN_RE = re.compile(r'[a-z]+')
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens with stopwords dropped and simple plurals stripped."""
+    tokens = []
+    for word in _TOKEN_RE.findall((text or '').lower()):
+        if word in STOPWORDS or len(word) < 2:
+            continue
+        if len(word) > 4 and word.endswith(('xes', 'shes', 'ches', 'sses')):
+            word = word[:-2]
+        elif len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+            word = word[:-1]
+        tokens.append(word)
+    return tokens
+
+
+def _canonical_tag(tag: str) -> str:
+    lookup = {c.lower(): c for c in SKILL_CATEGORIES}
+    return lookup.get(tag.strip().lower(), tag.strip())
+
+
+class TagClassifier:
+    """
+    Nearest-centroid TF-IDF classifier with an inverted index.
+
+    Each label gets a normalised centroid of its training documents; a
+    prediction is a sparse dot product walked through the token index,
+    so cost scales with the input length rather than the vocabulary.
+    """
+
+    def __init__(self, skill_docs, flag_docs):
+        documents = [tokens for tokens, _ in skill_docs] + [tokens for tokens, _ in flag_docs]
+        doc_freq = Counter()
+        for tokens in documents:
+            doc_freq.update(set(tokens))
+        total = max(1, len(documents))
+        self.idf = {term: math.log((1 + total) / (1 + df)) + 1 for term, df in doc_freq.items()}
+
+        self.skill_index = self._build_index(skill_docs, keep=self._keep_skill_label)
+        self.flag_index = self._build_index(flag_docs)
+        self.skill_keywords = {label: set(tokenize(' '.join(words))) for label, words in SKILL_KEYWORDS.items()}
+        self.flag_keywords = {label: set(tokenize(' '.join(words))) for label, words in FLAG_KEYWORDS.items()}
+
+    @staticmethod
+    def _keep_skill_label(label, count):
+        return label in SKILL_KEYWORDS or count >= MIN_LABEL_DOCS
+
+    def _vector(self, tokens):
+        counts = Counter(tokens)
+        vec = {term: tf * self.idf.get(term, 0.0) for term, tf in counts.items()}
+        norm = math.sqrt(sum(w * w for w in vec.values()))
+        if not norm:
+            return {}
+        return {term: w / norm for term, w in vec.items() if w}
+
+    def _build_index(self, labelled_docs, keep=None):
+        centroids = defaultdict(lambda: defaultdict(float))
+        label_counts = Counter()
+        for tokens, labels in labelled_docs:
+            vec = self._vector(tokens)
+            for label in labels:
+                label_counts[label] += 1
+                centroid = centroids[label]
+                for term, w in vec.items():
+                    centroid[term] += w
+
+        index = defaultdict(list)
+        for label, centroid in centroids.items():
+            if keep is not None and not keep(label, label_counts[label]):
+                continue
+            norm = math.sqrt(sum(w * w for w in centroid.values()))
+            if not norm:
+                continue
+            for term, w in centroid.items():
+                index[term].append((label, w / norm))
+        return dict(index)
+
+    def _scores(self, vec, index):
+        scores = defaultdict(float)
+        for term, w in vec.items():
+            for label, lw in index.get(term, ()):
+                scores[label] += w * lw
+        return scores
+
+    def predict(self, text: str) -> dict:
+        """Return {'skill_tags': [...], 'accessibility_flags': {...}} for free text."""
+        tokens = tokenize(text)
+        token_set = set(tokens)
+        vec = self._vector(tokens)
+
+        skill_scores = self._scores(vec, self.skill_index)
+        for label, words in self.skill_keywords.items():
+            if token_set & words:
+                skill_scores[label] += SKILL_THRESHOLD
+        ranked = sorted(
+            (item for item in skill_scores.items() if item[1] >= SKILL_THRESHOLD),
+            key=lambda item: item[1], reverse=True,
+        )
+        skill_tags = [label for label, _ in ranked[:MAX_SKILL_TAGS]]
+
+        flag_scores = self._scores(vec, self.flag_index)
+        flags = {}
+        for flag in ACCESSIBILITY_FLAGS:
+            hit = bool(token_set & self.flag_keywords[flag])
+            flags[flag] = hit or flag_scores.get(flag, 0.0) >= FLAG_THRESHOLD
+
+        return {'skill_tags': skill_tags, 'accessibility_flags': flags}
+
+
+def _job_text(title, short_description, description):
+    return ' '.join(filter(None, [title, short_description, description]))
+
+
+def _training_documents():
+    """Collect (tokens, labels) pairs from the seed data and Job rows."""
+    from matching.management.commands.seed_jobs import SAMPLE_JOBS
+    from matching.models import Job
+
+    skill_docs = []
+    flag_docs = []
+
+    for label, words in SKILL_KEYWORDS.items():
+        skill_docs.append((tokenize(' '.join(words)), [label]))
+    for label, words in FLAG_KEYWORDS.items():
+        flag_docs.append((tokenize(' '.join(words)), [label]))
+
+    rows = [
+        (_job_text(d['title'], d['short_description'], d['description']),
+         d['skill_tags'], d['accessibility_requirements'])
+        for d in SAMPLE_JOBS
+    ]
+    try:
+        rows.extend(
+            (_job_text(title, short, desc), tags or [], reqs or [])
+            for title, short, desc, tags, reqs in Job.objects.order_by('-created_at').values_list(
+                'title', 'short_description', 'description', 'skill_tags', 'accessibility_requirements',
+            )[:TRAINING_LIMIT]
+        )
+    except Exception:
+        logger.exception("Could not load jobs for tag classifier training")
+
+    for text, tags, reqs in rows:
+        tokens = tokenize(text)
+        labels = [_canonical_tag(t) for t in tags if isinstance(t, str) and t.strip()]
+        if labels:
+            skill_docs.append((tokens, labels))
+        flags = [r for r in reqs if r in ACCESSIBILITY_FLAGS]
+        if flags:
+            flag_docs.append((tokens, flags))
+
+    return skill_docs, flag_docs
+
+
+_model = None
+_model_built_at = 0.0
+_model_lock = threading.Lock()
+
+
+def get_classifier() -> TagClassifier:
+    """Return the process-wide classifier, retraining it when stale."""
+    global _model, _model_built_at
+    if _model is not None and time.monotonic() - _model_built_at < MODEL_TTL:
+        return _model
+    with _model_lock:
+        if _model is None or time.monotonic() - _model_built_at >= MODEL_TTL:
+            _model = TagClassifier(*_training_documents())
+            _model_built_at = time.monotonic()
+    return _model
+
+
+def reset_classifier():
+    """Drop the cached model so the next call retrains (used by tests)."""
+    global _model, _model_built_at
+    with _model_lock:
+        _model = None
+        _model_built_at = 0.0
+
+
+def suggest_tags(text: str) -> dict:
+    """Classify free text into skill tags and accessibility flags."""
+    return get_classifier().predict(text)
+
+
+def local_enhance(user_input: str) -> dict:
+    """Build an enhance-job result without calling the model."""
+    text = user_input.strip()
+    suggestion = suggest_tags(text)
+    title = text[:1].upper() + text[1:]
+    return {
+        'title': title[:80],
+        'description': title,
+        'short_description': title[:200],
+        'skill_tags': suggestion['skill_tags'],
+        'accessibility_flags': suggestion['accessibility_flags'],
+        'suggested_time': None,
+        'suggested_location': None,
+    }
@@ -5,6 +5,9 @@ import logging
 from django.conf import settings
 from django.core.cache import cache
 
+from core import metrics
+from core.instrumentation import cache_lookup
+
 try:
     from google import genai
 except ImportError:
@@ -12,6 +15,16 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Shared with the local classifier so both paths agree on the vocabulary.
+SKILL_CATEGORIES = [
+    'Teaching', 'Programming', 'First Aid', 'Physical Labor', 'Driving', 'Cooking',
+    'Cleaning', 'Gardening', 'Photography', 'Graphic Design', 'Event Planning',
+    'Animal Care', 'Mechanical', 'Communication', 'Organization', 'Healthcare',
+    'Web Development', 'Marketing', 'Editing', 'Errands', 'Tutoring', 'Music', 'Childcare',
+]
+
+ACCESSIBILITY_FLAGS = ['heavy_lifting', 'standing_long', 'driving_required', 'outdoor_work']
+
 SYSTEM_PROMPT = """You are a job posting assistant for a community help platform.
 Given a single sentence describing a task someone needs help with, generate a structured job posting.
 
@@ -32,7 +45,7 @@ You MUST respond with valid JSON only, no markdown, no extra text. Use this exac
 }
 
 Rules:
-- skill_tags: pick from common categories like Teaching, Programming, First Aid, Physical Labor, Driving, Cooking, Cleaning, Gardening, Photography, Graphic Design, Event Planning, Animal Care, Mechanical, Communication, Organization, Healthcare, Web Development, Marketing, Editing, Errands, Tutoring, Music, Childcare. Add new ones only if none fit.
+- skill_tags: pick from common categories like """ + ', '.join(SKILL_CATEGORIES) + """. Add new ones only if none fit.
 - accessibility_flags: set to true only if the task clearly requires that physical ability.
 - Be helpful and realistic. Infer reasonable details but don't fabricate specifics the user didn't mention."""
 
@@ -47,6 +60,7 @@ def enhance_job_description(user_input: str) -> dict:
     # Check cache
     key = _cache_key(user_input)
     cached = cache.get(key)
+    cache_lookup(cached is not None)
     if cached is not None:
         return cached
 
@@ -59,14 +73,15 @@ def enhance_job_description(user_input: str) -> dict:
 
     client = genai.Client(api_key=api_key)
 
-    response = client.models.generate_content(
-        model='gemini-2.0-flash',
-        contents=f"{SYSTEM_PROMPT}\n\nUser input: {user_input}",
-        config={
-            'response_mime_type': 'application/json',
-            'temperature': 0.7,
-        },
-    )
+    with metrics.timed(metrics.gemini_duration, operation='enhance'):
+        response = client.models.generate_content(
+            model='gemini-2.0-flash',
+            contents=f"{SYSTEM_PROMPT}\n\nUser input: {user_input}",
+            config={
+                'response_mime_type': 'application/json',
+                'temperature': 0.7,
+            },
+        )
 
     text = response.text.strip()
     result = json.loads(text)
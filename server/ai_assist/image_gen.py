@@ -6,6 +6,9 @@ import uuid
 from django.conf import settings
 from django.core.cache import cache
 
+from core import metrics
+from core.instrumentation import cache_lookup
+
 try:
     from google import genai
     from google.genai import types
@@ -29,6 +32,7 @@ def generate_job_image(prompt: str) -> str:
     # Check cache
     key = _cache_key(prompt)
     cached = cache.get(key)
+    cache_lookup(cached is not None)
     if cached is not None:
         return cached
 
@@ -46,13 +50,14 @@ def generate_job_image(prompt: str) -> str:
         "Style: flat vector illustration, warm colors, community-oriented, no text."
     )
 
-    response = client.models.generate_content(
-        model='gemini-2.5-flash-image',
-        contents=image_prompt,
-        config=types.GenerateContentConfig(
-            response_modalities=['IMAGE'],
-        ),
-    )
+    with metrics.timed(metrics.gemini_duration, operation='image'):
+        response = client.models.generate_content(
+            model='gemini-2.5-flash-image',
+            contents=image_prompt,
+            config=types.GenerateContentConfig(
+                response_modalities=['IMAGE'],
+            ),
+        )
 
     # Extract the image data from the response
     image_data = None
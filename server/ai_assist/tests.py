@@ -0,0 +1,61 @@
+from unittest import mock
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from authentication.models import User
+from .classifier import reset_classifier, suggest_tags, tokenize
+
+
+class ClassifierTests(TestCase):
+    def setUp(self):
+        reset_classifier()
+
+    def tearDown(self):
+        reset_classifier()
+
+    def test_tokenize_strips_plurals_and_stopwords(self):
+        self.assertEqual(tokenize('Carry the boxes and dogs'), ['carry', 'box', 'dog'])
+
+    def test_suggests_skill_tags(self):
+        result = suggest_tags('Tutor my kid in calculus before the exam')
+        self.assertIn('Tutoring', result['skill_tags'])
+
+    def test_suggests_accessibility_flags(self):
+        result = suggest_tags('Help me move heavy furniture with my truck')
+        self.assertTrue(result['accessibility_flags']['heavy_lifting'])
+        self.assertTrue(result['accessibility_flags']['driving_required'])
+        self.assertFalse(result['accessibility_flags']['outdoor_work'])
+
+    def test_unrelated_text_has_no_tags(self):
+        result = suggest_tags('zzz qqq')
+        self.assertEqual(result['skill_tags'], [])
+        self.assertFalse(any(result['accessibility_flags'].values()))
+
+
+class SuggestTagsViewTests(TestCase):
+    def setUp(self):
+        reset_classifier()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='poster@example.com', username='poster', password='StrongPass123!'
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_suggest_tags(self):
+        response = self.client.post('/api/ai/suggest-tags', {'text': 'Walk my dog in the park'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('Animal Care', response.data['skill_tags'])
+        self.assertTrue(response.data['accessibility_flags']['outdoor_work'])
+
+    def test_suggest_tags_requires_text(self):
+        response = self.client.post('/api/ai/suggest-tags', {}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_enhance_falls_back_when_model_unavailable(self):
+        with mock.patch('ai_assist.views.enhance_job_description', side_effect=ValueError('not configured')):
+            response = self.client.post('/api/ai/enhance-job', {'prompt': 'Pick up groceries for me'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['fallback'])
+        self.assertIn('Errands', response.data['result']['skill_tags'])
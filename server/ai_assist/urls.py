@@ -4,5 +4,6 @@ from . import views
 
 urlpatterns = [
     path('enhance-job', views.enhance_job, name='ai-enhance-job'),
+    path('suggest-tags', views.suggest_job_tags, name='ai-suggest-tags'),
     path('generate-image', views.generate_image, name='ai-generate-image'),
 ]
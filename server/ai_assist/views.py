@@ -6,11 +6,15 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from core import metrics
+from .classifier import local_enhance, suggest_tags
 from .gemini import enhance_job_description
 from .image_gen import generate_job_image
 
 logger = logging.getLogger(__name__)
 
+SUGGEST_TAGS_MAX_LENGTH = 2000
+
 RATE_LIMIT_MAX = 5
 RATE_LIMIT_WINDOW = 3600  # 1 hour
 
@@ -59,36 +63,63 @@ def enhance_job(request):
         )
 
     # Rate limiting
+    # Fall back to the local classifier instead of rejecting the request
     allowed, remaining = _check_rate_limit(request.user.id)
     if not allowed:
-        return Response(
-            {'error': 'Rate limit exceeded. Max 5 requests per hour.'},
-            status=status.HTTP_429_TOO_MANY_REQUESTS,
-        )
+        metrics.ai_rate_limited.labels('enhance').inc()
+        return Response({
+            'result': local_enhance(prompt),
+            'remaining_requests': 0,
+            'fallback': True,
+        })
 
     try:
         result = enhance_job_description(prompt)
     except ValueError as e:
         logger.error(f"Gemini config error: {e}")
-        return Response(
-            {'error': str(e)},
-            status=status.HTTP_503_SERVICE_UNAVAILABLE,
-        )
+        return Response({
+            'result': local_enhance(prompt),
+            'remaining_requests': remaining + 1,
+            'fallback': True,
+        })
     except Exception as e:
         logger.exception("Gemini API call failed")
-        return Response(
-            {'error': 'AI service temporarily unavailable. Please try again.'},
-            status=status.HTTP_503_SERVICE_UNAVAILABLE,
-        )
+        return Response({
+            'result': local_enhance(prompt),
+            'remaining_requests': remaining + 1,
+            'fallback': True,
+        })
 
     _increment_rate_limit(request.user.id)
 
     return Response({
         'result': result,
         'remaining_requests': remaining,
+        'fallback': False,
     })
 
 
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def suggest_job_tags(request):
+    """Suggest skill tags and accessibility flags with the local classifier."""
+    text = request.data.get('text', '').strip()
+
+    if not text:
+        return Response(
+            {'error': 'text is required'},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    if len(text) > SUGGEST_TAGS_MAX_LENGTH:
+        return Response(
+            {'error': f'text must be {SUGGEST_TAGS_MAX_LENGTH} characters or fewer'},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    return Response(suggest_tags(text))
+
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def generate_image(request):
@@ -110,6 +141,7 @@ def generate_image(request):
     key = _image_rate_limit_key(request.user.id)
     count = cache.get(key, 0)
     if count >= IMAGE_RATE_LIMIT_MAX:
+        metrics.ai_rate_limited.labels('image').inc()
         return Response(
             {'error': 'Rate limit exceeded. Max 3 image requests per hour.'},
             status=status.HTTP_429_TOO_MANY_REQUESTS,
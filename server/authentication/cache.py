@@ -0,0 +1,39 @@
+"""
+Short-lived cache of authenticated users.
+
+JWT requests would otherwise SELECT the user on every call and most
+matching views then fetch the profile separately. The user is loaded
+together with its matching_profile and kept for a few seconds; saves to
+either model evict the entry (see the signals modules).
+"""
+from django.conf import settings
+from django.core.cache import cache
+
+from core.instrumentation import cache_lookup
+from .models import User
+
+
+def _user_cache_key(user_id) -> str:
+    return f"authuser:{user_id}"
+
+
+def get_cached_user(user_id):
+    """Return the user with matching_profile preloaded, or None if missing."""
+    timeout = getattr(settings, 'AUTH_USER_CACHE_TIMEOUT', 30)
+    key = _user_cache_key(user_id)
+
+    if timeout:
+        user = cache.get(key)
+        cache_lookup(user is not None)
+        if user is not None:
+            return user
+
+    user = User.objects.select_related('matching_profile').filter(pk=user_id).first()
+    if user is not None and timeout:
+        cache.set(key, user, timeout=timeout)
+    return user
+
+
+def invalidate_user(user_id):
+    """Evict a cached user after the user or their profile changes."""
+    cache.delete(_user_cache_key(user_id))
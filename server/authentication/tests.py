@@ -1,6 +1,7 @@
 from django.test import TestCase
 from rest_framework.test import APIClient
 from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
 
 from .models import User
 
@@ -96,3 +97,44 @@ class MeTests(TestCase):
     def test_me_unauthenticated(self):
         response = self.client.get('/api/auth/me/')
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        from matching.models import UserProfile
+
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            username='testuser',
+            password='StrongPass123!',
+        )
+        self.profile = UserProfile.objects.create(user=self.user)
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def test_repeat_requests_skip_user_query(self):
+        self.client.get('/api/auth/me/')
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/auth/me/')
+        self.assertEqual(response.data['email'], 'test@example.com')
+
+    def test_profile_loaded_with_user(self):
+        self.client.get('/api/auth/me/')
+        # Location GET only needs the profile that came with the user
+        with self.assertNumQueries(0):
+            self.client.get('/api/matching/location')
+
+    def test_profile_update_invalidates_cache(self):
+        self.client.get('/api/matching/location')
+        self.profile.max_distance_miles = 50
+        self.profile.save()
+        response = self.client.get('/api/matching/location')
+        self.assertEqual(response.data['max_distance_miles'], 50)
+
+    def test_user_update_invalidates_cache(self):
+        self.client.get('/api/auth/me/')
+        self.user.first_name = 'Changed'
+        self.user.save()
+        response = self.client.get('/api/auth/me/')
+        self.assertEqual(response.data['first_name'], 'Changed')
@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-19 07:17
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0003_add_query_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="message",
+            index=models.Index(fields=["updated_at", "id"], name="msg_updated_idx"),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2 on 2026-10-19 08:02
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0004_export_indexes"),
+        ("matching", "0018_job_completed_status"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="conversation",
+            name="archived_job",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="conversations",
+                to="matching.archivedjob",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="conversation",
+            name="job",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="conversations",
+                to="matching.job",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="conversation",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    models.Q(("archived_job__isnull", True), ("job__isnull", False)),
+                    models.Q(("archived_job__isnull", False), ("job__isnull", True)),
+                    _connector="OR",
+                ),
+                name="conversation_one_job",
+            ),
+        ),
+    ]
@@ -2,12 +2,16 @@ from django.db import models
 
 from core.models import BaseModel
 from authentication.models import User
-from matching.models import Job
+from matching.models import ArchivedJob, Job
 
 
 class Conversation(BaseModel):
     """A chat conversation between a volunteer and job poster for a specific job."""
-    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='conversations')
+    # Exactly one of job / archived_job is set; matching.archive moves the link when the job is archived
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, null=True, blank=True, related_name='conversations')
+    archived_job = models.ForeignKey(
+        ArchivedJob, on_delete=models.CASCADE, null=True, blank=True, related_name='conversations'
+    )
     volunteer = models.ForeignKey(User, on_delete=models.CASCADE, related_name='volunteer_conversations')
     poster = models.ForeignKey(User, on_delete=models.CASCADE, related_name='poster_conversations')
     # Track when each participant last read the conversation
@@ -17,9 +21,34 @@ class Conversation(BaseModel):
     class Meta:
         unique_together = ('job', 'volunteer')
         ordering = ['-updated_at']
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(job__isnull=False, archived_job__isnull=True)
+                | models.Q(job__isnull=True, archived_job__isnull=False),
+                name='conversation_one_job',
+            ),
+        ]
+        indexes = [
+            # list_conversations: a participant's active inbox, most recent first
+            models.Index(
+                fields=['volunteer', '-updated_at'],
+                condition=models.Q(is_active=True),
+                name='conv_volunteer_inbox_idx',
+            ),
+            models.Index(
+                fields=['poster', '-updated_at'],
+                condition=models.Q(is_active=True),
+                name='conv_poster_inbox_idx',
+            ),
+        ]
 
     def __str__(self):
-        return f"Chat: {self.volunteer.username} <-> {self.poster.username} for {self.job.title}"
+        return f"Chat: {self.volunteer.username} <-> {self.poster.username} for {self.any_job.title}"
+
+    @property
+    def any_job(self):
+        """The live job, or its archived copy once matching.archive has moved it."""
+        return self.job if self.job_id else self.archived_job
 
 
 class Message(BaseModel):
@@ -30,6 +59,14 @@ class Message(BaseModel):
 
     class Meta:
         ordering = ['created_at']
+        indexes = [
+            # Message history and last message per conversation
+            models.Index(fields=['conversation', 'created_at'], name='msg_conversation_time_idx'),
+            # Unread counts: the other party's messages newer than last_read
+            models.Index(fields=['conversation', 'sender', 'created_at'], name='msg_unread_idx'),
+            # Incremental exports
+            models.Index(fields=['updated_at', 'id'], name='msg_updated_idx'),
+        ]
 
     def __str__(self):
         return f"{self.sender.username}: {self.content[:50]}"
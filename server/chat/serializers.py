@@ -1,7 +1,7 @@
 from rest_framework import serializers
 
 from .models import Conversation, Message
-from matching.serializers import JobMatchSerializer
+from matching.serializers import ArchivedJobSerializer, JobMatchSerializer
 
 
 class MessageSerializer(serializers.ModelSerializer):
@@ -15,7 +15,7 @@ class MessageSerializer(serializers.ModelSerializer):
 
 
 class ConversationSerializer(serializers.ModelSerializer):
-    job = JobMatchSerializer(read_only=True)
+    job = serializers.SerializerMethodField()
     volunteer_username = serializers.CharField(source='volunteer.username', read_only=True)
     volunteer_id = serializers.IntegerField(source='volunteer.id', read_only=True)
     poster_username = serializers.CharField(source='poster.username', read_only=True)
@@ -31,6 +31,11 @@ class ConversationSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at'
         ]
 
+    def get_job(self, obj):
+        if obj.job_id:
+            return JobMatchSerializer(obj.job, context=self.context).data
+        return ArchivedJobSerializer(obj.archived_job, context=self.context).data
+
     def get_last_message(self, obj):
         last = obj.messages.order_by('-created_at').first()
         if last:
@@ -6,6 +6,7 @@ from rest_framework.response import Response
 from django.db.models import Q
 from django.utils import timezone
 
+from core import metrics
 from .models import Conversation, Message
 from .serializers import ConversationSerializer, MessageSerializer, SendMessageSerializer
 
@@ -17,7 +18,7 @@ def list_conversations(request):
     conversations = Conversation.objects.filter(
         Q(volunteer=request.user) | Q(poster=request.user),
         is_active=True,
-    ).select_related('job', 'volunteer', 'poster').prefetch_related('messages')
+    ).select_related('job', 'archived_job', 'volunteer', 'poster').prefetch_related('messages')
 
     data = ConversationSerializer(conversations, many=True, context={'request': request}).data
     return Response(data)
@@ -83,6 +84,7 @@ def send_message(request, conversation_id):
 
     # Update conversation's updated_at to sort by most recent activity
     conversation.save()
+    metrics.chat_messages_sent.inc()
 
     return Response(MessageSerializer(message).data, status=status.HTTP_201_CREATED)
 
@@ -92,9 +94,10 @@ def send_message(request, conversation_id):
 def get_conversation_by_job(request, job_id):
     """Get or return info about a conversation for a specific job."""
     try:
-        conversation = Conversation.objects.get(
+        conversation = Conversation.objects.filter(
             Q(volunteer=request.user) | Q(poster=request.user),
-            job_id=job_id,
+        ).get(
+            Q(job_id=job_id) | Q(archived_job_id=job_id),  # Same id once the job is archived
             is_active=True,
         )
         return Response(ConversationSerializer(conversation, context={'request': request}).data)
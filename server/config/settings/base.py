@@ -31,6 +31,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.PrometheusMetricsMiddleware',
+    'core.middleware.RequestMetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
@@ -38,6 +40,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -70,9 +73,43 @@ DATABASES = {
         'PASSWORD': config('DB_PASSWORD', default='postgres'),
         'HOST': config('DB_HOST', default='localhost'),
         'PORT': config('DB_PORT', default='5432'),
+        # Keep connections open between requests instead of reconnecting every time
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+# Server-side pooling needs psycopg 3 (`pip install "psycopg[binary,pool]"`)
+# and replaces persistent connections, which Django does not allow together.
+if config('DB_POOL', default=False, cast=bool):
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': config('DB_POOL_MIN_SIZE', default=2, cast=int),
+            'max_size': config('DB_POOL_MAX_SIZE', default=10, cast=int),
+            'timeout': config('DB_POOL_TIMEOUT', default=10, cast=int),
+        },
+    }
+
+# Optional read replica; safe requests read from it via core.routers.ReplicaRouter.
+# Point DB_REPLICA_NAME at a second local database to try it without real replication.
+DB_REPLICA_HOST = config('DB_REPLICA_HOST', default='')
+DB_REPLICA_NAME = config('DB_REPLICA_NAME', default='')
+if DB_REPLICA_HOST or DB_REPLICA_NAME:
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'NAME': DB_REPLICA_NAME or DATABASES['default']['NAME'],
+        'HOST': DB_REPLICA_HOST or DATABASES['default']['HOST'],
+        'PORT': config('DB_REPLICA_PORT', default=DATABASES['default']['PORT']),
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['core.routers.ReplicaRouter']
+
+# Seconds a user keeps reading from the primary after a write. Pins live in
+# the Django cache, so multi-process deployments need a shared cache backend.
+REPLICA_PIN_SECONDS = config('REPLICA_PIN_SECONDS', default=5, cast=int)
+
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
     {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
@@ -102,7 +139,7 @@ AUTH_USER_MODEL = 'authentication.User'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'authentication.jwt.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.AllowAny',
@@ -111,6 +148,13 @@ REST_FRAMEWORK = {
     'PAGE_SIZE': 20,
 }
 
+# orjson-backed renderer; falls back to the stdlib encoder if orjson is missing
+if config('FAST_JSON_RENDERER', default=True, cast=bool):
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = (
+        'core.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    )
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
@@ -118,6 +162,50 @@ SIMPLE_JWT = {
     'BLACKLIST_AFTER_ROTATION': True,
 }
 
+# Per-request query/cache/latency instrumentation (core.instrumentation).
+# Requests over either threshold are logged as warnings.
+REQUEST_METRICS = config('REQUEST_METRICS', default=False, cast=bool)
+REQUEST_METRICS_SLOW_MS = config('REQUEST_METRICS_SLOW_MS', default=500, cast=int)
+REQUEST_METRICS_MAX_QUERIES = config('REQUEST_METRICS_MAX_QUERIES', default=30, cast=int)
+
+# Prometheus metrics at /metrics, off unless enabled (development.py turns
+# it on). Set METRICS_TOKEN to require "Authorization: Bearer <token>"
+# from the scraper.
+METRICS_ENABLED = config('METRICS_ENABLED', default=False, cast=bool)
+METRICS_TOKEN = config('METRICS_TOKEN', default='')
+
+# Largest batch accepted by POST /api/matching/jobs/bulk-create
+JOB_IMPORT_MAX_ROWS = config('JOB_IMPORT_MAX_ROWS', default=1000, cast=int)
+
+# Recurring jobs are materialized this many days ahead (materialize_recurring_jobs)
+RECURRENCE_HORIZON_DAYS = config('RECURRENCE_HORIZON_DAYS', default=14, cast=int)
+
+# Closed jobs untouched for this long move to the archive tables (archive_jobs)
+ARCHIVE_AFTER_DAYS = config('ARCHIVE_AFTER_DAYS', default=90, cast=int)
+
+# Upper bound on a cached candidate ranking; new interests evict it immediately
+CANDIDATES_CACHE_TIMEOUT = config('CANDIDATES_CACHE_TIMEOUT', default=300, cast=int)
+
+# New-job notifications (matching.notifications). Fan-out runs in a thread
+# pool after commit; at most NOTIFY_FANOUT_QUEUE jobs wait at once.
+NOTIFY_FANOUT_ENABLED = config('NOTIFY_FANOUT_ENABLED', default=True, cast=bool)
+NOTIFY_FANOUT_ASYNC = config('NOTIFY_FANOUT_ASYNC', default=True, cast=bool)
+NOTIFY_FANOUT_WORKERS = config('NOTIFY_FANOUT_WORKERS', default=2, cast=int)
+NOTIFY_FANOUT_QUEUE = config('NOTIFY_FANOUT_QUEUE', default=100, cast=int)
+NOTIFY_MIN_SCORE = config('NOTIFY_MIN_SCORE', default=60, cast=float)
+NOTIFY_MAX_RECIPIENTS = config('NOTIFY_MAX_RECIPIENTS', default=500, cast=int)
+NOTIFY_MAX_CANDIDATES = config('NOTIFY_MAX_CANDIDATES', default=5000, cast=int)
+
+# Coverage heatmap rollup (matching.coverage, rebuilt by build_coverage).
+# Fill rate covers shifts from the last COVERAGE_WINDOW_DAYS; cells with
+# fewer than COVERAGE_MIN_VOLUNTEERS volunteers withhold that count.
+COVERAGE_WINDOW_DAYS = config('COVERAGE_WINDOW_DAYS', default=30, cast=int)
+COVERAGE_MIN_VOLUNTEERS = config('COVERAGE_MIN_VOLUNTEERS', default=3, cast=int)
+COVERAGE_CACHE_TIMEOUT = config('COVERAGE_CACHE_TIMEOUT', default=3600, cast=int)
+
+# Seconds an authenticated user (with profile) stays cached; 0 disables
+AUTH_USER_CACHE_TIMEOUT = config('AUTH_USER_CACHE_TIMEOUT', default=30, cast=int)
+
 CORS_ALLOWED_ORIGINS = config(
     'CORS_ALLOWED_ORIGINS',
     default='http://localhost:3000',
@@ -1,3 +1,5 @@
+from decouple import config
+
 from .base import *
 
 DEBUG = True
@@ -7,3 +9,6 @@ ALLOWED_HOSTS = ['localhost', '127.0.0.1', '0.0.0.0']
 CORS_ALLOW_ALL_ORIGINS = True
 
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+
+REQUEST_METRICS = config('REQUEST_METRICS', default=True, cast=bool)
+METRICS_ENABLED = config('METRICS_ENABLED', default=True, cast=bool)
@@ -4,6 +4,8 @@ from django.contrib import admin
 from django.urls import path, include
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
+from core.views import export_dataset, prometheus_metrics
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
@@ -12,6 +14,9 @@ urlpatterns = [
     path('api/matching/', include('matching.urls')),
     path('api/ai/', include('ai_assist.urls')),
     path('api/chat/', include('chat.urls')),
+    path('api/debug/', include('core.urls')),
+    path('api/exports/<str:dataset>', export_dataset, name='export-dataset'),
+    path('metrics', prometheus_metrics, name='prometheus-metrics'),
 ]
 
 if settings.DEBUG:
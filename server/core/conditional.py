@@ -0,0 +1,62 @@
+"""
+ETag support for DRF function views.
+
+Views declare a cheap "version stamp" function (a few aggregate values such
+as max(updated_at) and row counts) and wrap themselves with conditional().
+When the client's If-None-Match matches, a 304 is returned before the view
+body runs, so serialization and badge computation are skipped entirely.
+
+Place @conditional below @permission_classes so authentication and
+permission checks still run first:
+
+    @api_view(['GET'])
+    @permission_classes([IsAuthenticated])
+    @conditional(my_stamp)
+    def my_view(request): ...
+"""
+import hashlib
+from functools import wraps
+
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views.decorators.http import condition
+
+# Bump when response shapes change so clients do not keep stale bodies
+ETAG_VERSION = 1
+
+SAFE_METHODS = ('GET', 'HEAD')
+
+
+def make_etag(*parts):
+    """Hash version-stamp values into a strong ETag string."""
+    raw = repr((ETAG_VERSION,) + parts).encode()
+    return f'"{hashlib.md5(raw, usedforsecurity=False).hexdigest()}"'
+
+
+def conditional(stamp_func):
+    """
+    Answer GET/HEAD with 304 Not Modified when stamp_func's ETag matches.
+
+    stamp_func(request, *args, **kwargs) returns a tuple of values that
+    changes whenever the response body would, or None when the resource
+    does not exist (the view then runs and handles it). Responses are
+    marked private and must be revalidated, since they are per-user.
+    """
+    def etag_func(request, *args, **kwargs):
+        parts = stamp_func(request, *args, **kwargs)
+        return None if parts is None else make_etag(*parts)
+
+    def decorator(view):
+        conditional_view = condition(etag_func=etag_func)(view)
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in SAFE_METHODS:
+                return view(request, *args, **kwargs)
+            response = conditional_view(request, *args, **kwargs)
+            patch_vary_headers(response, ('Authorization', 'Accept'))
+            patch_cache_control(response, private=True, no_cache=True)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,162 @@
+"""
+Streaming exports of jobs, completions, swipes and chat messages.
+
+Rows are read with values_list().iterator(chunk_size), which uses a
+server-side cursor on PostgreSQL, and encoded one row at a time into
+~64 KB chunks, so an export runs in constant memory whatever the table
+size. The export_data command and the staff-only /api/exports/<dataset>
+endpoint both go through Export.
+
+Filters:
+    since / until   created_at >= since and < until (a date range)
+    after           updated_at > after, for incremental exports
+
+Rows are ordered by (updated_at, id), so the largest updated_at written
+(Export.watermark) is the `after` for the next incremental run. Exports
+read from the replica when one is configured.
+"""
+import csv
+import json
+import uuid
+from collections import namedtuple
+from datetime import date, datetime, time
+
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from chat.models import Message
+from matching.models import Job, JobCompletion, MatchingInterest
+from .routers import PRIMARY_ALIAS, REPLICA_ALIAS, replica_configured
+
+FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+CHUNK_BYTES = 64 * 1024
+
+# annotations: extra columns pulled through a relation, {column: expression}
+Dataset = namedtuple('Dataset', ['model', 'columns', 'annotations'], defaults=[None])
+
+DATASETS = {
+    'jobs': Dataset(Job, (
+        'id', 'poster_id', 'title', 'status', 'latitude', 'longitude', 'location_label',
+        'shift_start', 'shift_end', 'skill_tags', 'accessibility_requirements',
+        'is_active', 'created_at', 'updated_at',
+    )),
+    'completions': Dataset(JobCompletion, (
+        'id', 'user_id', 'job_id', 'completed', 'was_urgent', 'had_accessibility',
+        'skill_tags_snapshot', 'is_active', 'created_at', 'updated_at',
+    )),
+    'interests': Dataset(MatchingInterest, (
+        'id', 'user_id', 'job_id', 'interested', 'is_active', 'created_at', 'updated_at',
+    )),
+    'messages': Dataset(Message, (
+        'id', 'conversation_id', 'job_id', 'sender_id', 'content', 'is_active', 'created_at', 'updated_at',
+    ), {'job_id': Coalesce('conversation__job_id', 'conversation__archived_job_id')}),
+}
+
+
+def parse_bound(value):
+    """Parse an ISO date or datetime; naive values are in the current time zone."""
+    if value in (None, ''):
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        parsed = parse_datetime(value)
+        if parsed is None:
+            day = parse_date(value)
+            if day is None:
+                raise ValueError(f'Invalid date or datetime: {value!r}')
+            parsed = datetime.combine(day, time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def _plain(value):
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _csv_value(value):
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, separators=(',', ':'))
+    return _plain(value)
+
+
+class _LineBuffer:
+    """File-like target for csv.writer that hands back each written row."""
+
+    def write(self, value):
+        return value
+
+
+class Export:
+    """
+    Iterable of encoded chunks (str) for one dataset.
+
+    Raises ValueError for an unknown dataset or format, or unparsable bounds.
+    """
+
+    def __init__(self, dataset, fmt='ndjson', since=None, until=None, after=None, chunk_size=2000):
+        if dataset not in DATASETS:
+            raise ValueError(f'Unknown dataset {dataset!r}; choose from {", ".join(DATASETS)}')
+        if fmt not in FORMATS:
+            raise ValueError(f'Unknown format {fmt!r}; choose from {", ".join(FORMATS)}')
+        self.dataset = DATASETS[dataset]
+        self.fmt = fmt
+        self.content_type = FORMATS[fmt]
+        self.since = parse_bound(since)
+        self.until = parse_bound(until)
+        self.after = parse_bound(after)
+        self.chunk_size = chunk_size
+        self.rows = 0
+        self.watermark = self.after
+
+    def queryset(self):
+        alias = REPLICA_ALIAS if replica_configured() else PRIMARY_ALIAS
+        queryset = self.dataset.model.objects.using(alias)
+        if self.dataset.annotations:
+            queryset = queryset.annotate(**self.dataset.annotations)
+        if self.since:
+            queryset = queryset.filter(created_at__gte=self.since)
+        if self.until:
+            queryset = queryset.filter(created_at__lt=self.until)
+        if self.after:
+            queryset = queryset.filter(updated_at__gt=self.after)
+        return queryset.order_by('updated_at', 'id').values_list(*self.dataset.columns)
+
+    def lines(self):
+        columns = self.dataset.columns
+        updated_index = columns.index('updated_at')
+        rows = self.queryset().iterator(chunk_size=self.chunk_size)
+
+        writer = csv.writer(_LineBuffer())
+        if self.fmt == 'csv':
+            yield writer.writerow(columns)
+
+        for row in rows:
+            self.rows += 1
+            self.watermark = row[updated_index]
+            if self.fmt == 'csv':
+                yield writer.writerow([_csv_value(value) for value in row])
+            else:
+                record = {column: _plain(value) for column, value in zip(columns, row)}
+                yield json.dumps(record, separators=(',', ':'), ensure_ascii=False) + '\n'
+
+    def __iter__(self):
+        buffer, size = [], 0
+        for line in self.lines():
+            buffer.append(line)
+            size += len(line)
+            if size >= CHUNK_BYTES:
+                yield ''.join(buffer)
+                buffer, size = [], 0
+        if buffer:
+            yield ''.join(buffer)
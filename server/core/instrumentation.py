@@ -0,0 +1,169 @@
+"""
+Per-request query, cache and latency instrumentation.
+
+core.middleware.RequestMetricsMiddleware creates a RequestStats for each
+request, installs it as an execute_wrapper on every database connection
+and publishes it in a ContextVar so read-through caches can report hits
+and misses via cache_lookup(). When the request finishes, the numbers go
+into per-view histograms (see registry) and a Server-Timing header.
+
+With REQUEST_METRICS off the middleware is not loaded at all and
+cache_lookup() only does a ContextVar lookup.
+"""
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+
+_current_stats = ContextVar('request_stats', default=None)
+
+# Upper bounds; the last bucket catches everything above
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+
+class RequestStats:
+    """Counters for one request. Callable so it can be a connection execute_wrapper."""
+    __slots__ = ('queries', 'db_seconds', 'cache_hits', 'cache_misses', 'started')
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.started = time.perf_counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_seconds += time.perf_counter() - start
+            self.queries += 1
+
+    @property
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    @property
+    def db_ms(self):
+        return self.db_seconds * 1000
+
+
+def set_current_stats(stats):
+    return _current_stats.set(stats)
+
+
+def reset_current_stats(token):
+    _current_stats.reset(token)
+
+
+def current_stats():
+    return _current_stats.get()
+
+
+def cache_lookup(hit):
+    """Report a read-through cache hit or miss for the current request, if instrumented."""
+    stats = _current_stats.get()
+    if stats is not None:
+        if hit:
+            stats.cache_hits += 1
+        else:
+            stats.cache_misses += 1
+
+
+class Histogram:
+    """Fixed-bucket histogram; counts[i] holds observations <= bounds[i] (last is overflow)."""
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, pct):
+        """Approximate percentile: the upper bound of the bucket holding it."""
+        if not self.total:
+            return None
+        rank = pct / 100 * self.total
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self):
+        return {
+            'count': self.total,
+            'mean': round(self.sum / self.total, 2) if self.total else None,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'max': round(self.max, 2),
+            'buckets': dict(zip([*map(str, self.bounds), '+Inf'], self.counts)),
+        }
+
+
+class ViewMetrics:
+    def __init__(self):
+        self.total_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.db_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.queries = Histogram(QUERY_BUCKETS)
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+
+class Registry:
+    """In-process histograms keyed by view name. Each worker process keeps its own."""
+
+    def __init__(self):
+        self._views = {}
+        self._lock = threading.Lock()
+
+    def record(self, view_name, stats, total_ms):
+        with self._lock:
+            metrics = self._views.get(view_name)
+            if metrics is None:
+                metrics = self._views[view_name] = ViewMetrics()
+            metrics.total_ms.observe(total_ms)
+            metrics.db_ms.observe(stats.db_ms)
+            metrics.queries.observe(stats.queries)
+            metrics.cache_hits += stats.cache_hits
+            metrics.cache_misses += stats.cache_misses
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                name: {
+                    'total_ms': m.total_ms.snapshot(),
+                    'db_ms': m.db_ms.snapshot(),
+                    'queries': m.queries.snapshot(),
+                    'cache_hits': m.cache_hits,
+                    'cache_misses': m.cache_misses,
+                }
+                for name, m in sorted(self._views.items())
+            }
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+
+
+registry = Registry()
+
+
+def server_timing(stats, total_ms):
+    """Format stats as a Server-Timing header value."""
+    return (
+        f'db;dur={stats.db_ms:.1f};desc="{stats.queries} queries", '
+        f'cache;desc="{stats.cache_hits} hits {stats.cache_misses} misses", '
+        f'total;dur={total_ms:.1f}'
+    )
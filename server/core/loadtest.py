@@ -0,0 +1,239 @@
+"""
+Scenario generation and replay for HTTP load tests (see the loadtest command).
+
+A scenario is a JSON-serialisable plan: sessions with a start offset drawn
+from a Poisson process at the requested arrival rate, a kind, an account
+and a per-session seed. Replaying it drives a running server over HTTP,
+one thread per active session, and records latency per URL name. Paths
+are built with reverse(), so they always follow config/urls.py.
+
+Accounts are the ones matching.synthetic creates (volunteer<n>@example.com
+and poster<n>@example.com, password synthetic.PASSWORD); "newcomer"
+sessions register fresh accounts.
+"""
+import random
+import statistics
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.urls import reverse
+
+from matching.management.commands.seed_jobs import BASE_LAT, BASE_LNG
+from matching.synthetic import PASSWORD
+
+# (kind, weight)
+SESSION_MIX = [('volunteer', 60), ('poster', 25), ('browser', 10), ('newcomer', 5)]
+
+# A handful of points ~1.4 miles apart, so the server's geocode cache
+# (keyed on 2 decimal places) absorbs Nominatim lookups after warm-up
+LOCATIONS = [
+    (round(BASE_LAT + dy * 0.02, 2), round(BASE_LNG + dx * 0.02, 2))
+    for dy in (-1, 0, 1) for dx in (-1, 0, 1)
+]
+
+NEWCOMER_PASSWORD = 'LoadTest!Pass2024'
+
+
+def generate_scenario(rate, duration, users, posters, seed=42):
+    """Plan sessions arriving at `rate` per second for `duration` seconds."""
+    rng = random.Random(seed)
+    kinds = [kind for kind, weight in SESSION_MIX for _ in range(weight)]
+    sessions = []
+    at = rng.expovariate(rate)
+    while at < duration:
+        kind = rng.choice(kinds)
+        if kind == 'poster':
+            account = f'poster{rng.randrange(posters)}'
+        elif kind == 'newcomer':
+            account = f'load{seed}x{len(sessions)}'
+        else:
+            account = f'volunteer{rng.randrange(users)}'
+        sessions.append({'at': round(at, 3), 'kind': kind, 'account': account, 'seed': rng.getrandbits(32)})
+        at += rng.expovariate(rate)
+    return {'seed': seed, 'rate': rate, 'duration': duration, 'sessions': sessions}
+
+
+class Stats:
+    """Thread-safe per-endpoint latency samples and status counts."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.start_lag = []
+        self.failed_sessions = Counter()
+
+    def record(self, name, ms, status):
+        with self._lock:
+            self.samples[name].append(ms)
+            self.statuses[name][status] += 1
+
+    def record_lag(self, seconds):
+        with self._lock:
+            self.start_lag.append(seconds)
+
+    def record_failure(self, kind):
+        with self._lock:
+            self.failed_sessions[kind] += 1
+
+    def summary(self, elapsed):
+        rows = {}
+        for name, samples in sorted(self.samples.items()):
+            ordered = sorted(samples)
+            errors = sum(count for status, count in self.statuses[name].items()
+                         if status == 'error' or status >= 400)
+            rows[name] = {
+                'requests': len(samples),
+                'errors': errors,
+                'rps': round(len(samples) / elapsed, 2),
+                'mean_ms': round(statistics.mean(samples), 2),
+                'p50_ms': round(ordered[int(0.50 * (len(ordered) - 1))], 2),
+                'p95_ms': round(ordered[int(0.95 * (len(ordered) - 1))], 2),
+                'p99_ms': round(ordered[int(0.99 * (len(ordered) - 1))], 2),
+                'statuses': {str(k): v for k, v in self.statuses[name].items()},
+            }
+        return rows
+
+
+class ApiClient:
+    """requests.Session bound to one account; every call is timed under its URL name."""
+
+    def __init__(self, base_url, stats, timeout):
+        self.base_url = base_url.rstrip('/')
+        self.stats = stats
+        self.timeout = timeout
+        self.http = requests.Session()
+        self.token = None
+
+    def call(self, method, name, kwargs=None, json=None):
+        url = self.base_url + reverse(name, kwargs=kwargs)
+        headers = {'Authorization': f'Bearer {self.token}'} if self.token else {}
+        start = time.perf_counter()
+        try:
+            response = self.http.request(method, url, json=json, headers=headers, timeout=self.timeout)
+        except requests.RequestException:
+            self.stats.record(name, (time.perf_counter() - start) * 1000, 'error')
+            return None
+        self.stats.record(name, (time.perf_counter() - start) * 1000, response.status_code)
+        if response.status_code >= 400 or not response.content:
+            return None
+        return response.json()
+
+    def login(self, email, password):
+        data = self.call('POST', 'auth-login', json={'email': email, 'password': password})
+        self.token = data['access'] if data else None
+        return self.token is not None
+
+
+class SessionRunner:
+    """Runs the steps for one planned session."""
+
+    def __init__(self, session, api, think):
+        self.session = session
+        self.api = api
+        self.rng = random.Random(session['seed'])
+        self.think = think
+
+    def pause(self):
+        if self.think:
+            time.sleep(self.rng.uniform(0, self.think))
+
+    def run(self):
+        getattr(self, f'run_{self.session["kind"]}')()
+        self.api.http.close()
+
+    def _login(self):
+        return self.api.login(f'{self.session["account"]}@example.com', PASSWORD)
+
+    def _chat(self):
+        conversations = self.api.call('GET', 'list-conversations') or []
+        if conversations:
+            conversation_id = self.rng.choice(conversations)['id']
+            self.api.call('GET', 'get-messages', {'conversation_id': conversation_id})
+            for _ in range(self.rng.randint(1, 3)):
+                self.pause()
+                self.api.call('POST', 'send-message', {'conversation_id': conversation_id},
+                              json={'content': 'Sounds good, see you there!'})
+
+    def run_volunteer(self):
+        if not self._login():
+            return
+        self.api.call('GET', 'profile')
+        if self.rng.random() < 0.3:
+            lat, lng = self.rng.choice(LOCATIONS)
+            self.api.call('PUT', 'location', json={'latitude': lat, 'longitude': lng})
+        self.pause()
+        feed = self.api.call('GET', 'matching-jobs') or []
+        # Swipe burst through the top of the feed
+        for job in feed[:self.rng.randint(3, 10)]:
+            self.api.call('POST', 'matching-interest',
+                          json={'job_id': job['id'], 'interested': self.rng.random() < 0.35})
+        self.pause()
+        self.api.call('GET', 'my-interested-jobs')
+        self._chat()
+
+    def run_poster(self):
+        if not self._login():
+            return
+        jobs = self.api.call('GET', 'my-posted-jobs') or []
+        for job in self.rng.sample(jobs, min(len(jobs), 2)):
+            self.pause()
+            interested = self.api.call('GET', 'job-interested-users', {'job_id': job['id']}) or []
+            if interested:
+                volunteer = self.rng.choice(interested)
+                self.api.call('POST', 'confirm-volunteer', {'job_id': job['id']},
+                              json={'user_id': volunteer['user_id']})
+        self._chat()
+
+    def run_browser(self):
+        if not self._login():
+            return
+        me = self.api.call('GET', 'auth-me')
+        self.api.call('GET', 'profile')
+        if me:
+            self.api.call('GET', 'user-badges', {'user_id': me['id']})
+        self.pause()
+        self.api.call('GET', 'my-accepted-jobs')
+        self.api.call('GET', 'matching-jobs')
+
+    def run_newcomer(self):
+        account = self.session['account']
+        email = f'{account}@example.com'
+        self.api.call('POST', 'auth-register',
+                      json={'email': email, 'username': account, 'password': NEWCOMER_PASSWORD})
+        if not self.api.login(email, NEWCOMER_PASSWORD):
+            return
+        lat, lng = self.rng.choice(LOCATIONS)
+        self.api.call('PUT', 'location', json={'latitude': lat, 'longitude': lng})
+        self.api.call('GET', 'profile')
+        self.api.call('GET', 'matching-jobs')
+
+
+def replay(scenario, base_url, concurrency, think=0.0, timeout=30):
+    """
+    Start each session at its planned offset. Returns (stats, elapsed).
+
+    When all `concurrency` threads are busy, sessions wait for a free one;
+    that wait shows up as start lag and means the client, not only the
+    server, is the bottleneck.
+    """
+    stats = Stats()
+    started = time.perf_counter()
+
+    def run(session):
+        stats.record_lag(time.perf_counter() - started - session['at'])
+        try:
+            SessionRunner(session, ApiClient(base_url, stats, timeout), think).run()
+        except Exception:  # Unexpected response shape; keep the other sessions going
+            stats.record_failure(session['kind'])
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for session in scenario['sessions']:
+            delay = session['at'] - (time.perf_counter() - started)
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(run, session)
+    return stats, time.perf_counter() - started
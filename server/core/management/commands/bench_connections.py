@@ -0,0 +1,102 @@
+"""
+Compare per-request latency with and without database connection reuse.
+
+Usage:
+    python manage.py bench_connections
+    python manage.py bench_connections --requests 500 --path /api/matching/location
+
+Each request is wrapped in close_old_connections() exactly like Django's
+request handler does, so CONN_MAX_AGE=0 pays a full connect/disconnect per
+request while persistent mode reuses one connection. Run it against the
+Postgres database you want to size; SQLite connects too cheaply to show
+a meaningful difference.
+"""
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connections
+from django.test import Client, override_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from authentication.models import User
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark request latency with and without persistent DB connections'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help='Requests per mode')
+        parser.add_argument('--path', default='/api/auth/me/', help='GET endpoint to call')
+        parser.add_argument('--email', help='User to authenticate as (default: first active user)')
+        parser.add_argument('--max-age', type=int, default=600, help='CONN_MAX_AGE for the persistent mode')
+
+    def handle(self, *args, **options):
+        users = User.objects.filter(is_active=True)
+        if options['email']:
+            users = users.filter(email=options['email'])
+        user = users.order_by('pk').first()
+        if user is None:
+            raise CommandError('No user to authenticate as. Run seed_demo first or pass --email.')
+
+        db = connections['default']
+        if db.settings_dict.get('OPTIONS', {}).get('pool'):
+            self.stdout.write(self.style.WARNING(
+                'DB_POOL is enabled, so both modes reuse pooled connections. '
+                'Run once with DB_POOL=False for the unpooled baseline.'
+            ))
+
+        token = str(RefreshToken.for_user(user).access_token)
+        host = next((h for h in settings.ALLOWED_HOSTS if h != '*' and not h.startswith('.')), 'localhost')
+        client = Client(HTTP_AUTHORIZATION=f'Bearer {token}', HTTP_HOST=host)
+        original_max_age = db.settings_dict['CONN_MAX_AGE']
+
+        results = {}
+        # Bypass the auth user cache so every request reaches the database
+        with override_settings(AUTH_USER_CACHE_TIMEOUT=0):
+            try:
+                for label, max_age in [('new connection per request', 0),
+                                       (f'persistent (CONN_MAX_AGE={options["max_age"]})', options['max_age'])]:
+                    db.close()
+                    db.settings_dict['CONN_MAX_AGE'] = max_age
+                    results[label] = self._run(client, options['path'], options['requests'])
+            finally:
+                db.close()
+                db.settings_dict['CONN_MAX_AGE'] = original_max_age
+
+        self.stdout.write(f'{options["requests"]} x GET {options["path"]} as {user.email} '
+                          f'({db.vendor})\n')
+        self.stdout.write(f'{"mode":<40} {"mean":>8} {"p50":>8} {"p95":>8} {"p99":>8}  (ms)')
+        for label, samples in results.items():
+            self.stdout.write(
+                f'{label:<40} {statistics.mean(samples):>8.2f} {_percentile(samples, 50):>8.2f} '
+                f'{_percentile(samples, 95):>8.2f} {_percentile(samples, 99):>8.2f}'
+            )
+
+        baseline, persistent = (statistics.mean(s) for s in results.values())
+        self.stdout.write(self.style.SUCCESS(
+            f'\nPersistent connections save {baseline - persistent:.2f} ms per request on average.'
+        ))
+
+    def _run(self, client, path, count):
+        # Warm-up request so URL resolution and imports are not measured
+        client.get(path)
+        close_old_connections()
+
+        samples = []
+        for _ in range(count):
+            start = time.perf_counter()
+            close_old_connections()  # request_started
+            response = client.get(path)
+            close_old_connections()  # request_finished
+            samples.append((time.perf_counter() - start) * 1000)
+            if response.status_code >= 400:
+                raise CommandError(f'GET {path} returned {response.status_code}')
+        return samples
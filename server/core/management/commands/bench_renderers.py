@@ -0,0 +1,116 @@
+"""
+Compare DRF's JSONRenderer with core.renderers.ORJSONRenderer.
+
+Usage:
+    python manage.py bench_renderers
+    python manage.py bench_renderers --items 100 --rounds 2000
+
+Payloads are synthetic but shaped like real responses: feed cards as built
+by matching.feed, and conversation rows carrying raw UUID/datetime values
+the way SerializerMethodFields and plain-dict views return them. No
+database is needed.
+"""
+import random
+import statistics
+import time
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from core import renderers
+from core.renderers import ORJSONRenderer
+
+
+def _feed_payload(count, rng):
+    now = timezone.now()
+    cards = []
+    for i in range(count):
+        start = now + timedelta(hours=rng.randint(1, 200))
+        cards.append({
+            'id': str(uuid.UUID(int=rng.getrandbits(128))),
+            'title': f'Volunteer shift #{i}',
+            'short_description': 'Help sort donated food items at the food bank.',
+            'description': 'Help sort donated canned goods and produce. ' * rng.randint(2, 8),
+            'skill_tags': rng.sample(['Teaching', 'Cooking', 'Driving', 'Errands', 'Teamwork'], 2),
+            'location_label': 'East Lansing, MI',
+            'shift_start': start.isoformat().replace('+00:00', 'Z'),
+            'shift_end': (start + timedelta(hours=2)).isoformat().replace('+00:00', 'Z'),
+            'is_urgent': rng.random() < 0.3,
+            'distance_display': f'~{rng.randint(1, 9)} mi',
+            'poster_username': f'poster_{rng.randint(1, 500)}',
+            'accessibility_requirements': rng.sample(['heavy_lifting', 'standing_long', 'outdoor_work'], 1),
+            'status': 'open',
+            'image': '',
+            'score': round(rng.uniform(20, 100), 2),
+            'distance': round(rng.uniform(0.5, 25), 1),
+        })
+    return cards
+
+
+def _conversation_payload(count, rng):
+    now = timezone.now()
+    return [
+        {
+            'id': uuid.UUID(int=rng.getrandbits(128)),
+            'volunteer_id': rng.randint(1, 10000),
+            'poster_id': rng.randint(1, 10000),
+            'last_message': {
+                'content': 'See you tomorrow at 2pm!',
+                'sender_username': 'volunteer_demo',
+                'created_at': now - timedelta(minutes=rng.randint(1, 10000), microseconds=rng.randint(0, 999999)),
+            },
+            'unread_count': rng.randint(0, 5),
+            'created_at': now - timedelta(days=rng.randint(1, 30)),
+            'updated_at': now - timedelta(minutes=rng.randint(1, 600)),
+        }
+        for _ in range(count)
+    ]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the stdlib and orjson JSON renderers on feed-like payloads'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--items', type=int, default=50, help='Rows per payload')
+        parser.add_argument('--rounds', type=int, default=1000, help='Renders per renderer')
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        if renderers.orjson is None:
+            raise CommandError('orjson is not installed; ORJSONRenderer would use the stdlib path.')
+
+        rng = random.Random(options['seed'])
+        payloads = {
+            'feed cards': _feed_payload(options['items'], rng),
+            'conversations': _conversation_payload(options['items'], rng),
+        }
+        candidates = {'JSONRenderer': JSONRenderer(), 'ORJSONRenderer': ORJSONRenderer()}
+
+        self.stdout.write(f'{options["rounds"]} renders of {options["items"]} rows each\n')
+        self.stdout.write(f'{"payload":<16} {"renderer":<16} {"bytes":>8} {"mean":>9} {"p95":>9}  (µs)')
+        for name, payload in payloads.items():
+            outputs = {}
+            means = {}
+            for label, renderer in candidates.items():
+                outputs[label] = renderer.render(payload)
+                samples = []
+                for _ in range(options['rounds']):
+                    start = time.perf_counter()
+                    renderer.render(payload)
+                    samples.append((time.perf_counter() - start) * 1e6)
+                samples.sort()
+                means[label] = statistics.mean(samples)
+                p95 = samples[int(0.95 * (len(samples) - 1))]
+                self.stdout.write(
+                    f'{name:<16} {label:<16} {len(outputs[label]):>8} {means[label]:>9.1f} {p95:>9.1f}'
+                )
+
+            same = outputs['JSONRenderer'] == outputs['ORJSONRenderer']
+            speedup = means['JSONRenderer'] / means['ORJSONRenderer']
+            style = self.style.SUCCESS if same else self.style.ERROR
+            self.stdout.write(style(
+                f'{name:<16} {speedup:.1f}x faster, output {"identical" if same else "DIFFERS"}\n'
+            ))
@@ -0,0 +1,121 @@
+"""
+Drive a running server with realistic user sessions.
+
+Usage:
+    python manage.py loadtest --prepare                  # synthetic accounts + jobs
+    python manage.py loadtest --rate 5 --duration 60     # against localhost:8000
+    python manage.py loadtest --save-scenario plan.json  # plan only, no requests
+    python manage.py loadtest --replay plan.json --base-url http://127.0.0.1:8001
+
+Sessions arrive as a Poisson process at --rate per second (open model, so
+a slow server gets more concurrent sessions rather than fewer requests).
+Kinds, see core.loadtest:
+
+    volunteer   login, profile, maybe location, feed, swipe burst, interests, chat
+    poster      login, posted jobs, interested users, confirm a volunteer, chat
+    browser     login, me, profile, own badges, accepted jobs, feed
+    newcomer    register, login, set location, profile, feed
+
+Run the server with the same settings (database) this command uses so
+--prepare seeds the accounts the sessions log in with. Use gunicorn with
+several workers to measure scaling; runserver is single-process.
+"""
+import json
+import statistics
+
+from django.core.management.base import BaseCommand, CommandError
+
+from authentication.models import User
+from core import loadtest
+from matching import synthetic
+
+
+class Command(BaseCommand):
+    help = 'Replay realistic API sessions against a running server and report per-endpoint latency'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://localhost:8000')
+        parser.add_argument('--rate', type=float, default=5, help='Session arrivals per second')
+        parser.add_argument('--duration', type=float, default=60, help='Seconds of arrivals')
+        parser.add_argument('--concurrency', type=int, default=50, help='Max sessions in flight')
+        parser.add_argument('--think', type=float, default=0.5, help='Max random pause between steps (s)')
+        parser.add_argument('--timeout', type=float, default=30, help='Per-request timeout (s)')
+        parser.add_argument('--users', type=int, default=1000, help='Volunteer accounts to draw from')
+        parser.add_argument('--posters', type=int, default=50, help='Poster accounts to draw from')
+        parser.add_argument('--jobs', type=int, default=1000, help='Jobs to create with --prepare')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--prepare', action='store_true',
+                            help='Create the synthetic accounts and jobs if missing, then exit')
+        parser.add_argument('--save-scenario', help='Write the generated plan to this file and exit')
+        parser.add_argument('--replay', help='Replay a previously saved plan')
+        parser.add_argument('--output', help='Write the results as JSON')
+
+    def handle(self, *args, **options):
+        if options['prepare']:
+            return self._prepare(options)
+
+        if options['replay']:
+            with open(options['replay']) as f:
+                scenario = json.load(f)
+        else:
+            scenario = loadtest.generate_scenario(
+                options['rate'], options['duration'], options['users'], options['posters'], options['seed'],
+            )
+        if options['save_scenario']:
+            with open(options['save_scenario'], 'w') as f:
+                json.dump(scenario, f)
+            self.stdout.write(f'Wrote {len(scenario["sessions"])} sessions to {options["save_scenario"]}')
+            return
+
+        if not scenario['sessions']:
+            raise CommandError('The scenario has no sessions; raise --rate or --duration.')
+        self.stdout.write(
+            f'Replaying {len(scenario["sessions"])} sessions over {scenario["duration"]}s '
+            f'against {options["base_url"]} (concurrency {options["concurrency"]})...'
+        )
+        stats, elapsed = loadtest.replay(
+            scenario, options['base_url'], options['concurrency'], options['think'], options['timeout'],
+        )
+        rows = stats.summary(elapsed)
+        self._report(rows, stats, elapsed)
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump({
+                    'base_url': options['base_url'],
+                    'scenario': {k: scenario[k] for k in ('seed', 'rate', 'duration')},
+                    'sessions': len(scenario['sessions']),
+                    'elapsed_s': round(elapsed, 2),
+                    'failed_sessions': dict(stats.failed_sessions),
+                    'endpoints': rows,
+                }, f, indent=2)
+            self.stdout.write(f'Wrote {options["output"]}')
+
+    def _prepare(self, options):
+        if User.objects.filter(email='volunteer0@example.com').exists():
+            self.stdout.write('Synthetic accounts already exist.')
+            return
+        synthetic.generate(jobs=options['jobs'], users=options['users'],
+                           posters=options['posters'], seed=options['seed'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {options["users"]} volunteers, {options["posters"]} posters and '
+            f'{options["jobs"]} jobs (password {synthetic.PASSWORD}).'
+        ))
+
+    def _report(self, rows, stats, elapsed):
+        total = sum(row['requests'] for row in rows.values())
+        errors = sum(row['errors'] for row in rows.values())
+        self.stdout.write(f'\n{"endpoint":<24} {"reqs":>6} {"err":>5} {"rps":>7} '
+                          f'{"p50":>8} {"p95":>8} {"p99":>8}  (ms)')
+        for name, row in rows.items():
+            line = (f'{name:<24} {row["requests"]:>6} {row["errors"]:>5} {row["rps"]:>7.1f} '
+                    f'{row["p50_ms"]:>8.1f} {row["p95_ms"]:>8.1f} {row["p99_ms"]:>8.1f}')
+            self.stdout.write(self.style.WARNING(line) if row['errors'] else line)
+
+        self.stdout.write(f'\n{total} requests in {elapsed:.1f}s = {total / elapsed:.1f} req/s, {errors} errors')
+        if stats.start_lag:
+            lag = statistics.mean(stats.start_lag)
+            self.stdout.write(f'Mean session start lag {lag * 1000:.0f} ms'
+                              + (' (client saturated: raise --concurrency)' if lag > 1 else ''))
+        if stats.failed_sessions:
+            self.stdout.write(self.style.ERROR(f'Aborted sessions: {dict(stats.failed_sessions)}'))
@@ -0,0 +1,111 @@
+"""
+Prometheus metrics, served at /metrics.
+
+Under gunicorn each worker is a separate process, so metrics are written
+to PROMETHEUS_MULTIPROC_DIR (set up by gunicorn.conf.py) and render()
+aggregates every worker's files. Without that variable the in-process
+default registry is used, which is right for runserver and tests.
+
+prometheus_client is optional: when it is missing every metric below is
+a no-op and the endpoint returns 404.
+"""
+import os
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+
+try:
+    import prometheus_client
+    from prometheus_client import multiprocess
+except ImportError:
+    prometheus_client = None
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SCORING_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5)
+UPSTREAM_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+class _NoopMetric:
+    def labels(self, *args, **kwargs):
+        return self
+
+    def inc(self, amount=1):
+        pass
+
+    def observe(self, amount):
+        pass
+
+
+def _counter(name, documentation, labelnames=()):
+    if prometheus_client is None:
+        return _NoopMetric()
+    return prometheus_client.Counter(name, documentation, labelnames)
+
+
+def _histogram(name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+    if prometheus_client is None:
+        return _NoopMetric()
+    return prometheus_client.Histogram(name, documentation, labelnames, buckets=buckets)
+
+
+http_requests = _counter(
+    'http_requests_total', 'HTTP responses by view and status', ['method', 'view', 'status'])
+http_request_duration = _histogram(
+    'http_request_duration_seconds', 'Request latency by view', ['method', 'view'])
+
+feed_candidates_scanned = _counter(
+    'matching_feed_candidates_scanned_total', 'Jobs loaded and scored for matched_jobs')
+feed_jobs_returned = _counter(
+    'matching_feed_jobs_returned_total', 'Jobs returned to clients by matched_jobs')
+scoring_duration = _histogram(
+    'matching_scoring_duration_seconds', 'Time spent scoring and ranking one feed request',
+    buckets=SCORING_BUCKETS)
+
+geocode_cache = _counter(
+    'geocode_cache_lookups_total', 'Reverse geocode cache lookups', ['result'])
+geocode_upstream_duration = _histogram(
+    'geocode_upstream_duration_seconds', 'Nominatim request latency', ['operation', 'outcome'],
+    buckets=UPSTREAM_BUCKETS)
+
+gemini_duration = _histogram(
+    'gemini_request_duration_seconds', 'Gemini API call latency', ['operation', 'outcome'],
+    buckets=UPSTREAM_BUCKETS)
+ai_rate_limited = _counter(
+    'ai_rate_limited_total', 'AI requests rejected or downgraded by the per-user rate limit', ['endpoint'])
+
+chat_messages_sent = _counter('chat_messages_sent_total', 'Chat messages sent')
+
+notifications_created = _counter(
+    'notifications_created_total', 'Notification inbox entries created', ['kind'])
+fanout_duration = _histogram(
+    'notification_fanout_duration_seconds', 'Finding, scoring and notifying volunteers for one job',
+    ['outcome'])
+fanout_dropped = _counter(
+    'notification_fanout_dropped_total', 'Fan-outs skipped because the queue was full')
+
+
+@contextmanager
+def timed(histogram, **labels):
+    """Observe the block's duration, labelled outcome=ok|error."""
+    start = time.perf_counter()
+    outcome = 'error'
+    try:
+        yield
+        outcome = 'ok'
+    finally:
+        histogram.labels(outcome=outcome, **labels).observe(time.perf_counter() - start)
+
+
+def enabled():
+    return prometheus_client is not None and getattr(settings, 'METRICS_ENABLED', False)
+
+
+def render():
+    """Return (body, content_type) in the Prometheus text format."""
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+    return prometheus_client.generate_latest(registry), prometheus_client.CONTENT_TYPE_LATEST
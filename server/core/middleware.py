@@ -0,0 +1,95 @@
+import logging
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from . import instrumentation, metrics
+from .routers import RoutingState, pin_to_primary, reset_routing_state, set_routing_state
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class ReplicaRoutingMiddleware:
+    """Let ReplicaRouter send safe requests to the replica and pin writers to the primary."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        unsafe = request.method not in SAFE_METHODS
+        token = set_routing_state(RoutingState(request, use_primary=unsafe))
+        try:
+            response = self.get_response(request)
+        finally:
+            reset_routing_state(token)
+
+        user = getattr(request, 'user', None)
+        if unsafe and response.status_code < 400 and user is not None and user.is_authenticated:
+            pin_to_primary(user.pk)
+        return response
+
+
+class RequestMetricsMiddleware:
+    """
+    Count queries, DB time and cache hits per request (see core.instrumentation).
+
+    Adds a Server-Timing header, records per-view histograms and logs
+    requests slower than REQUEST_METRICS_SLOW_MS or running more than
+    REQUEST_METRICS_MAX_QUERIES queries. Not loaded unless REQUEST_METRICS
+    is on.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'REQUEST_METRICS', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.slow_ms = getattr(settings, 'REQUEST_METRICS_SLOW_MS', 500)
+        self.max_queries = getattr(settings, 'REQUEST_METRICS_MAX_QUERIES', 30)
+
+    def __call__(self, request):
+        stats = instrumentation.RequestStats()
+        token = instrumentation.set_current_stats(stats)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(stats))
+                response = self.get_response(request)
+        finally:
+            instrumentation.reset_current_stats(token)
+
+        total_ms = stats.elapsed_ms
+        match = request.resolver_match
+        view_name = (match.view_name or match.route) if match else '<unresolved>'
+        instrumentation.registry.record(view_name, stats, total_ms)
+        response['Server-Timing'] = instrumentation.server_timing(stats, total_ms)
+
+        if total_ms > self.slow_ms or stats.queries > self.max_queries:
+            logger.warning(
+                '%s %s (%s): %.1f ms, %d queries in %.1f ms, cache %d hits / %d misses',
+                request.method, request.path, view_name, total_ms,
+                stats.queries, stats.db_ms, stats.cache_hits, stats.cache_misses,
+            )
+        return response
+
+
+class PrometheusMetricsMiddleware:
+    """Record request counts and latency per view for /metrics (see core.metrics)."""
+
+    def __init__(self, get_response):
+        if not metrics.enabled():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        response = self.get_response(request)
+        match = request.resolver_match
+        view_name = (match.view_name or match.route) if match else '<unresolved>'
+        metrics.http_request_duration.labels(request.method, view_name).observe(time.perf_counter() - start)
+        metrics.http_requests.labels(request.method, view_name, response.status_code).inc()
+        return response
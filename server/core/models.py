@@ -11,3 +11,15 @@ class BaseModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class ArchiveModel(models.Model):
+    """Archived copy of a BaseModel row: same id and timestamps, copied rather than generated."""
+    id = models.UUIDField(primary_key=True, editable=False)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    is_active = models.BooleanField(default=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        abstract = True
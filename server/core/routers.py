@@ -0,0 +1,113 @@
+"""
+Primary/replica database routing.
+
+Reads go to the 'replica' alias only while a request with a safe method
+is being handled (see core.middleware.ReplicaRoutingMiddleware). Anything
+else - writes, unsafe methods, transactions, management commands, and
+users who made a successful unsafe request within the last
+REPLICA_PIN_SECONDS - uses 'default', so a user always reads their own
+writes.
+"""
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+PRIMARY_ALIAS = 'default'
+REPLICA_ALIAS = 'replica'
+
+_routing_state = ContextVar('db_routing_state', default=None)
+
+
+def _pin_key(user_id) -> str:
+    return f"dbpin:{user_id}"
+
+
+def pin_to_primary(user_id):
+    """Send this user's reads to the primary for the next few seconds."""
+    cache.set(_pin_key(user_id), 1, timeout=getattr(settings, 'REPLICA_PIN_SECONDS', 5))
+
+
+def is_pinned(user_id) -> bool:
+    return cache.get(_pin_key(user_id)) is not None
+
+
+def replica_configured() -> bool:
+    return REPLICA_ALIAS in settings.DATABASES
+
+
+class RoutingState:
+    """Per-request routing decision, resolved lazily once the user is known."""
+
+    def __init__(self, request, use_primary=False):
+        self.request = request
+        self.use_primary = use_primary
+        self._pin_checked = False
+
+    def identify(self, user_id):
+        """Record who is making the request, switching to the primary if pinned."""
+        if not self._pin_checked:
+            self._pin_checked = True
+            self.use_primary = self.use_primary or is_pinned(user_id)
+
+    def reads_from_primary(self) -> bool:
+        if self.use_primary:
+            return True
+        if not self._pin_checked:
+            # DRF authenticates inside the view, so the user is only known
+            # once the first query after authentication is routed.
+            user = getattr(self.request, 'user', None)
+            if user is not None and user.is_authenticated:
+                self.identify(user.pk)
+        return self.use_primary
+
+
+def set_routing_state(state):
+    return _routing_state.set(state)
+
+
+def reset_routing_state(token):
+    _routing_state.reset(token)
+
+
+def get_routing_state():
+    return _routing_state.get()
+
+
+def identify_user(user_id):
+    """Tell the router who the current request belongs to, before the user is loaded."""
+    state = _routing_state.get()
+    if state is not None:
+        state.identify(user_id)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if not replica_configured():
+            return None
+        state = _routing_state.get()
+        if state is None or state.reads_from_primary():
+            return PRIMARY_ALIAS
+        if connections[PRIMARY_ALIAS].in_atomic_block:
+            return PRIMARY_ALIAS
+        return REPLICA_ALIAS
+
+    def db_for_write(self, model, **hints):
+        # Also consulted when assigning relations, so treat it as a hint
+        # that the request may write rather than proof that it did.
+        state = _routing_state.get()
+        if state is not None:
+            state.use_primary = True
+        return PRIMARY_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {PRIMARY_ALIAS, REPLICA_ALIAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == REPLICA_ALIAS:
+            return False
+        return None
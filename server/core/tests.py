@@ -0,0 +1,333 @@
+import csv
+import io
+import json
+import os
+import tempfile
+import uuid
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock, skipIf
+
+import requests
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import LiveServerTestCase, RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from matching import synthetic
+from chat.models import Message
+from matching.models import Job, JobAcceptance, MatchingInterest
+from . import instrumentation, loadtest, metrics
+from .renderers import ORJSONRenderer
+from .routers import (
+    ReplicaRouter, RoutingState, identify_user, is_pinned, pin_to_primary,
+    reset_routing_state, set_routing_state,
+)
+
+
+@mock.patch('core.routers.replica_configured', return_value=True)
+class ReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.router = ReplicaRouter()
+        self.factory = RequestFactory()
+
+    def _route(self, request, use_primary=False):
+        token = set_routing_state(RoutingState(request, use_primary=use_primary))
+        self.addCleanup(reset_routing_state, token)
+
+    def test_reads_outside_requests_use_primary(self, _):
+        self.assertEqual(self.router.db_for_read(Job), 'default')
+
+    def test_safe_request_reads_replica(self, _):
+        self._route(self.factory.get('/'))
+        self.assertEqual(self.router.db_for_read(Job), 'replica')
+
+    def test_unsafe_request_reads_primary(self, _):
+        self._route(self.factory.post('/'), use_primary=True)
+        self.assertEqual(self.router.db_for_read(Job), 'default')
+
+    def test_write_switches_request_to_primary(self, _):
+        self._route(self.factory.get('/'))
+        self.assertEqual(self.router.db_for_write(Job), 'default')
+        self.assertEqual(self.router.db_for_read(Job), 'default')
+
+    def test_pinned_user_reads_primary(self, _):
+        pin_to_primary(42)
+        self._route(self.factory.get('/'))
+        identify_user(42)
+        self.assertEqual(self.router.db_for_read(Job), 'default')
+
+    def test_other_user_still_reads_replica(self, _):
+        pin_to_primary(42)
+        self._route(self.factory.get('/'))
+        identify_user(7)
+        self.assertEqual(self.router.db_for_read(Job), 'replica')
+
+    def test_replica_is_never_migrated(self, _):
+        self.assertFalse(self.router.allow_migrate('replica', 'matching'))
+        self.assertIsNone(self.router.allow_migrate('default', 'matching'))
+
+
+class ReplicaRoutingMiddlewareTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@example.com', username='testuser', password='StrongPass123!'
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_write_pins_user(self):
+        self.client.patch('/api/matching/profile', {'max_distance_miles': 40}, format='json')
+        self.assertTrue(is_pinned(self.user.pk))
+
+    def test_read_does_not_pin_user(self):
+        self.client.get('/api/matching/location')
+        self.assertFalse(is_pinned(self.user.pk))
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    data = {
+        'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+        'created_at': datetime(2026, 3, 1, 14, 30, 5, 123456, tzinfo=dt_timezone.utc),
+        'label': gettext_lazy('Open'),
+        'amount': Decimal('12.50'),
+        'score': 87.25,
+        'tags': ['Teaching', 'Café', '\u2028'],
+        'nested': {1: None, 'ok': True},
+    }
+
+    def test_matches_drf_json_renderer(self):
+        self.assertEqual(ORJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+    def test_falls_back_without_orjson(self):
+        with mock.patch('core.renderers.orjson', None):
+            self.assertEqual(ORJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+    def test_indent_uses_stdlib_path(self):
+        rendered = ORJSONRenderer().render({'a': 1}, 'application/json; indent=2')
+        self.assertEqual(rendered, b'{\n  "a": 1\n}')
+
+    def test_none_renders_empty(self):
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+
+@override_settings(REQUEST_METRICS=True)
+class RequestMetricsMiddlewareTests(TestCase):
+    def setUp(self):
+        instrumentation.registry.reset()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@example.com', username='testuser', password='StrongPass123!'
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_server_timing_and_histograms(self):
+        response = self.client.get('/api/matching/jobs/my-posted')
+        self.assertRegex(response['Server-Timing'], r'db;dur=[\d.]+;desc="[1-9]\d* queries"')
+        self.assertIn('total;dur=', response['Server-Timing'])
+
+        metrics = instrumentation.registry.snapshot()['my-posted-jobs']
+        self.assertEqual(metrics['total_ms']['count'], 1)
+        self.assertGreater(metrics['queries']['max'], 0)
+
+    def test_query_heavy_request_is_logged(self):
+        with override_settings(REQUEST_METRICS_MAX_QUERIES=0):
+            with self.assertLogs('core.middleware', 'WARNING') as logs:
+                self.client.get('/api/matching/jobs/my-posted')
+        self.assertIn('my-posted-jobs', logs.output[0])
+
+    @override_settings(REQUEST_METRICS=False)
+    def test_disabled_adds_nothing(self):
+        response = APIClient().get('/api/matching/location')
+        self.assertNotIn('Server-Timing', response)
+        self.assertEqual(instrumentation.registry.snapshot(), {})
+
+    def test_cache_lookups_are_counted(self):
+        stats = instrumentation.RequestStats()
+        token = instrumentation.set_current_stats(stats)
+        try:
+            instrumentation.cache_lookup(True)
+            instrumentation.cache_lookup(False)
+            instrumentation.cache_lookup(False)
+        finally:
+            instrumentation.reset_current_stats(token)
+        instrumentation.cache_lookup(True)  # Outside a request: ignored
+        self.assertEqual((stats.cache_hits, stats.cache_misses), (1, 2))
+
+    def test_metrics_endpoint_is_admin_only(self):
+        self.assertEqual(self.client.get('/api/debug/request-metrics').status_code, 403)
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get('/api/debug/request-metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('request-metrics', instrumentation.registry.snapshot())
+
+
+class HistogramTests(SimpleTestCase):
+    def test_buckets_and_percentiles(self):
+        histogram = instrumentation.Histogram((10, 100))
+        for value in [1, 5, 50, 500]:
+            histogram.observe(value)
+        self.assertEqual(histogram.counts, [2, 1, 1])
+        self.assertEqual(histogram.percentile(50), 10)
+        self.assertEqual(histogram.percentile(100), 500)
+
+
+@skipIf(metrics.prometheus_client is None, 'prometheus_client is not installed')
+@override_settings(METRICS_ENABLED=True)
+class PrometheusMetricsTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@example.com', username='testuser', password='StrongPass123!'
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def _sample(self, name, labels=None):
+        return metrics.prometheus_client.REGISTRY.get_sample_value(name, labels or {}) or 0
+
+    def test_request_and_feed_metrics(self):
+        requests_before = self._sample(
+            'http_requests_total', {'method': 'GET', 'view': 'matching-jobs', 'status': '200'})
+        feeds_before = self._sample('matching_scoring_duration_seconds_count')
+
+        self.client.get('/api/matching/jobs')
+
+        self.assertEqual(self._sample(
+            'http_requests_total', {'method': 'GET', 'view': 'matching-jobs', 'status': '200'}),
+            requests_before + 1)
+        self.assertEqual(self._sample('matching_scoring_duration_seconds_count'), feeds_before + 1)
+
+        response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'http_request_duration_seconds_bucket', response.content)
+        self.assertIn(b'matching_feed_candidates_scanned_total', response.content)
+
+    @override_settings(METRICS_TOKEN='s3cret')
+    def test_token_required_when_configured(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer s3cret')
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(METRICS_ENABLED=False)
+    def test_disabled_endpoint_404s(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 404)
+
+    def test_multiprocess_mode_reads_shared_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with mock.patch.dict(os.environ, {'PROMETHEUS_MULTIPROC_DIR': directory}):
+                body, content_type = metrics.render()
+        self.assertTrue(content_type.startswith('text/plain'))
+        self.assertEqual(body, b'')  # No worker has written to the new directory yet
+
+
+class ExportTests(TestCase):
+    def setUp(self):
+        synthetic.generate(jobs=20, users=4, posters=2, seed=3)
+        self.admin = User.objects.create_user(
+            email='admin@example.com', username='admin', password='StrongPass123!', is_staff=True
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def _get(self, path):
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        return b''.join(response.streaming_content).decode()
+
+    def test_ndjson_streams_every_row(self):
+        body = self._get('/api/exports/messages')
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(len(rows), Message.objects.count())
+        message = Message.objects.select_related('conversation').get(id=rows[0]['id'])
+        self.assertEqual(rows[0]['job_id'], str(message.conversation.job_id))
+        self.assertEqual([row['updated_at'] for row in rows], sorted(row['updated_at'] for row in rows))
+
+    def test_csv_has_header_and_json_lists(self):
+        body = self._get('/api/exports/jobs?fmt=csv')
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(len(rows), Job.objects.count())
+        job = Job.objects.get(id=rows[0]['id'])
+        self.assertEqual(json.loads(rows[0]['skill_tags']), job.skill_tags)
+
+    def test_watermark_returns_only_newer_rows(self):
+        interest = MatchingInterest.objects.order_by('updated_at').first()
+        watermark = MatchingInterest.objects.order_by('-updated_at').first().updated_at
+        interest.interested = not interest.interested
+        interest.save()
+
+        body = self._get(f'/api/exports/interests?after={watermark.isoformat().replace("+", "%2B")}')
+        self.assertEqual([json.loads(line)['id'] for line in body.splitlines()], [str(interest.id)])
+
+    def test_watermark_sees_retractions(self):
+        interest = MatchingInterest.objects.filter(interested=True, job__is_active=True).first()
+        JobAcceptance.objects.get_or_create(user=interest.user, job=interest.job, defaults={'status': 'pending'})
+        JobAcceptance.objects.filter(user=interest.user, job=interest.job).update(status='pending')
+        watermark = MatchingInterest.objects.order_by('-updated_at').first().updated_at
+
+        volunteer = APIClient()
+        volunteer.force_authenticate(user=interest.user)
+        self.assertEqual(volunteer.post(f'/api/matching/jobs/{interest.job_id}/retract').status_code, 200)
+
+        body = self._get(f'/api/exports/interests?after={watermark.isoformat().replace("+", "%2B")}')
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([(row['id'], row['interested']) for row in rows], [(str(interest.id), False)])
+
+    def test_errors_and_permissions(self):
+        self.assertEqual(self.client.get('/api/exports/badges').status_code, 400)
+        self.assertEqual(self.client.get('/api/exports/jobs?since=yesterday').status_code, 400)
+        self.client.force_authenticate(user=User.objects.get(email='volunteer0@example.com'))
+        self.assertEqual(self.client.get('/api/exports/jobs').status_code, 403)
+
+    def test_command_date_range_and_state_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            state, output = os.path.join(tmp, 'jobs.watermark'), os.path.join(tmp, 'jobs.ndjson')
+            call_command('export_data', 'jobs', '--output', output, '--state', state, stderr=io.StringIO())
+            with open(output) as f:
+                self.assertEqual(len(f.readlines()), Job.objects.count())
+            with open(state) as f:
+                self.assertEqual(f.read(), Job.objects.order_by('-updated_at').first().updated_at.isoformat())
+
+            out = io.StringIO()
+            call_command('export_data', 'jobs', '--state', state, stdout=out, stderr=io.StringIO())
+            self.assertEqual(out.getvalue(), '')
+
+        out = io.StringIO()
+        call_command('export_data', 'completions', '--since', '2000-01-01', '--until', '2000-01-02',
+                     stdout=out, stderr=io.StringIO())
+        self.assertEqual(out.getvalue(), '')
+
+
+class LoadTestScenarioTests(SimpleTestCase):
+    def test_scenario_is_deterministic(self):
+        first = loadtest.generate_scenario(rate=5, duration=20, users=100, posters=5, seed=7)
+        second = loadtest.generate_scenario(rate=5, duration=20, users=100, posters=5, seed=7)
+        self.assertEqual(first, second)
+        # Poisson arrivals: ~100 expected
+        self.assertTrue(60 < len(first['sessions']) < 140)
+        self.assertTrue(all(0 <= s['at'] < 20 for s in first['sessions']))
+
+
+class LoadTestReplayTests(LiveServerTestCase):
+    def test_replay_against_live_server(self):
+        synthetic.generate(jobs=30, users=5, posters=2, seed=1)
+        scenario = {'seed': 1, 'rate': 1, 'duration': 1, 'sessions': [
+            {'at': 0, 'kind': kind, 'account': account, 'seed': i}
+            for i, (kind, account) in enumerate([
+                ('volunteer', 'volunteer0'), ('poster', 'poster0'), ('browser', 'volunteer1'),
+            ])
+        ]}
+        with mock.patch('matching.geocoding.requests.get', side_effect=requests.ConnectionError):
+            stats, _ = loadtest.replay(scenario, self.live_server_url, concurrency=1)
+
+        rows = stats.summary(1)
+        self.assertFalse(stats.failed_sessions)
+        self.assertEqual(rows['auth-login']['statuses'], {'200': 3})
+        self.assertIn('matching-jobs', rows)
+        self.assertIn('my-posted-jobs', rows)
+        self.assertEqual(sum(row['errors'] for row in rows.values()), 0)
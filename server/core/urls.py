@@ -0,0 +1,7 @@
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path('request-metrics', views.request_metrics, name='request-metrics'),
+]
@@ -0,0 +1,51 @@
+from django.conf import settings
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from . import metrics
+from .exports import Export
+from .instrumentation import registry
+
+
+@api_view(['GET', 'DELETE'])
+@permission_classes([IsAdminUser])
+def request_metrics(request):
+    """Per-view latency/query histograms collected by this worker process."""
+    if request.method == 'DELETE':
+        registry.reset()
+    return Response(registry.snapshot())
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def export_dataset(request, dataset):
+    """
+    Stream a dataset as NDJSON (default) or CSV.
+
+    Query params: fmt=ndjson|csv, since/until (created_at range) and after
+    (updated_at watermark from the previous export). `fmt` rather than
+    `format`, which DRF reserves for renderer selection.
+    """
+    params = request.query_params
+    try:
+        export = Export(dataset, fmt=params.get('fmt', 'ndjson'), since=params.get('since'),
+                        until=params.get('until'), after=params.get('after'))
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    response = StreamingHttpResponse(export, content_type=export.content_type)
+    response['Content-Disposition'] = f'attachment; filename="{dataset}.{export.fmt}"'
+    return response
+
+
+def prometheus_metrics(request):
+    """Prometheus scrape endpoint. Plain Django view: no JWT or content negotiation."""
+    if not metrics.enabled():
+        raise Http404
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    if token and request.headers.get('Authorization') != f'Bearer {token}':
+        return HttpResponse(status=403)
+    body, content_type = metrics.render()
+    return HttpResponse(body, content_type=content_type)
@@ -0,0 +1,24 @@
+"""
+Gunicorn settings (loaded automatically from the working directory).
+
+Workers write Prometheus metrics to PROMETHEUS_MULTIPROC_DIR so /metrics
+can aggregate across processes (see core.metrics). The directory is
+emptied when the master starts and dead workers' live data is dropped.
+"""
+import os
+import shutil
+
+PROMETHEUS_MULTIPROC_DIR = os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', '/tmp/prometheus_multiproc')
+
+
+def on_starting(server):
+    shutil.rmtree(PROMETHEUS_MULTIPROC_DIR, ignore_errors=True)
+    os.makedirs(PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+
+
+def child_exit(server, worker):
+    try:
+        from prometheus_client import multiprocess
+    except ImportError:
+        return
+    multiprocess.mark_process_dead(worker.pid)
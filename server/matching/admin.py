@@ -1,6 +1,9 @@
 from django.contrib import admin
 
-from .models import Job, UserProfile, MatchingInterest, Badge, JobCompletion, JobAcceptance
+from .models import (
+    ArchivedJob, Job, JobRecurrence, UserProfile, MatchingInterest, Badge, JobCompletion, JobAcceptance,
+    Notification,
+)
 
 admin.site.register(Job)
 admin.site.register(UserProfile)
@@ -8,3 +11,6 @@ admin.site.register(MatchingInterest)
 admin.site.register(Badge)
 admin.site.register(JobCompletion)
 admin.site.register(JobAcceptance)
+admin.site.register(JobRecurrence)
+admin.site.register(ArchivedJob)
+admin.site.register(Notification)
@@ -0,0 +1,97 @@
+"""
+Move closed jobs out of the live tables.
+
+A job is archivable once it is soft-deleted or filled/completed/cancelled/expired
+and has not changed for ARCHIVE_AFTER_DAYS. It moves to ArchivedJob with
+the same id, together with its MatchingInterest and JobAcceptance rows,
+one batch per transaction. The feed, swipe and sweeper indexes then only
+cover jobs that can still change.
+
+Chat conversations are not moved: their link is switched from the job to
+its archived copy (same id), so chat history and get_conversation_by_job
+keep working. JobCompletion rows are never moved (their job FK has no
+database constraint), so badges are unaffected.
+my_posted_jobs, my_accepted_jobs and my_interested_jobs append the
+archived rows, so users' history reads the same before and after.
+"""
+import logging
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from chat.models import Conversation
+
+from .models import (
+    ArchivedJob, ArchivedJobAcceptance, ArchivedMatchingInterest, Job, JobAcceptance, MatchingInterest,
+)
+
+logger = logging.getLogger(__name__)
+
+CLOSED_STATUSES = ('filled', 'completed', 'cancelled', 'expired')
+
+# (live model, archive model) for the rows that move with a job
+MOVED_WITH_JOB = (
+    (MatchingInterest, ArchivedMatchingInterest),
+    (JobAcceptance, ArchivedJobAcceptance),
+)
+
+
+def archivable_jobs(before):
+    return Job.objects.filter(
+        Q(is_active=False) | Q(status__in=CLOSED_STATUSES),
+        updated_at__lt=before,
+    )
+
+
+def _copy(obj, archive_model):
+    fields = [f.attname for f in archive_model._meta.concrete_fields if f.name != 'archived_at']
+    return archive_model(**{name: getattr(obj, name) for name in fields})
+
+
+def _archive_batch(before, batch_size):
+    with transaction.atomic():
+        # Lock the batch so no interest, acceptance or conversation is attached while it moves
+        jobs = list(
+            archivable_jobs(before).order_by('updated_at').select_for_update(of=('self',))[:batch_size]
+        )
+        if not jobs:
+            return 0, {}
+        ids = [job.id for job in jobs]
+        ArchivedJob.objects.bulk_create([_copy(job, ArchivedJob) for job in jobs])
+        # One statement: the right-hand job_id is read before it is cleared
+        conversations = Conversation.objects.filter(job_id__in=ids).update(archived_job_id=F('job_id'), job=None)
+
+        moved = {}
+        for model, archive_model in MOVED_WITH_JOB:
+            rows = model.objects.filter(job_id__in=ids)
+            archive_model.objects.bulk_create([_copy(row, archive_model) for row in rows])
+            moved[model._meta.model_name], _ = rows.delete()
+        moved['conversation'] = conversations
+        Job.objects.filter(id__in=ids).delete()
+        return len(jobs), moved
+
+
+def archive_jobs(older_than_days=None, batch_size=500, dry_run=False):
+    """Archive every eligible job; returns {'job': n, 'matchinginterest': n, 'jobacceptance': n, 'conversation': n}."""
+    days = older_than_days if older_than_days is not None else settings.ARCHIVE_AFTER_DAYS
+    before = timezone.now() - timezone.timedelta(days=days)
+    if dry_run:
+        ids = archivable_jobs(before).values('id')
+        counts = {'job': archivable_jobs(before).count()}
+        for model, _ in MOVED_WITH_JOB:
+            counts[model._meta.model_name] = model.objects.filter(job_id__in=ids).count()
+        counts['conversation'] = Conversation.objects.filter(job_id__in=ids).count()
+        return counts
+
+    counts = {'job': 0, **{model._meta.model_name: 0 for model, _ in MOVED_WITH_JOB}, 'conversation': 0}
+    while True:
+        archived, moved = _archive_batch(before, batch_size)
+        if not archived:
+            break
+        counts['job'] += archived
+        for name, count in moved.items():
+            counts[name] += count
+    logger.info('Archived %s', counts)
+    return counts
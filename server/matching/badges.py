@@ -1,3 +1,4 @@
+from django.db.models import Count, Max
 from django.utils import timezone
 
 from .models import Badge, JobCompletion, UserProfile
@@ -24,6 +25,9 @@ TRACKS = {
 }
 
 
+LEVEL_NAMES = dict(Badge.LEVEL_CHOICES)
+
+
 def _level_from_count(count, thresholds):
     """Return (level, progress_count) based on thresholds."""
     level = 0
@@ -41,8 +45,25 @@ def _months_active(user):
     return delta.days / 30.0
 
 
-def compute_badges(user):
-    """Recompute all 4 badge tracks for a user. Returns list of badge dicts."""
+def badges_version(user):
+    """
+    Cheap stamp that changes whenever compute_badges(user) output would.
+
+    Counts come from JobCompletion rows (any insert/update bumps the max
+    updated_at) and the anchor track only moves with whole months active.
+    """
+    stats = JobCompletion.objects.filter(user=user).aggregate(count=Count('id'), latest=Max('updated_at'))
+    return stats['count'], stats['latest'], int(_months_active(user))
+
+
+def compute_badges(user, persist=True):
+    """
+    Recompute all 4 badge tracks for a user. Returns list of badge dicts.
+
+    With persist=False nothing is written, so read-only requests (and
+    read replicas) can serve badges; the stored Badge rows and profile
+    reliability stats are refreshed whenever a completion is recorded.
+    """
     completions = JobCompletion.objects.filter(user=user, completed=True)
 
     # Specialist: completed jobs that had skill tags
@@ -81,26 +102,30 @@ def compute_badges(user):
         else:
             next_threshold = config['thresholds'][-1]
 
-        badge, _ = Badge.objects.update_or_create(
-            user=user,
-            track=track,
-            defaults={
-                'level': level,
-                'progress': int(count),
-                'title': title,
-            },
-        )
+        if persist:
+            Badge.objects.update_or_create(
+                user=user,
+                track=track,
+                defaults={
+                    'level': level,
+                    'progress': int(count),
+                    'title': title,
+                },
+            )
 
         results.append({
             'track': track,
             'level': level,
-            'level_name': badge.get_level_display(),
+            'level_name': LEVEL_NAMES[level],
             'progress': int(count),
             'next_threshold': next_threshold if level < 3 else None,
             'title': title,
             'description': config['description'],
         })
 
+    if not persist:
+        return results
+
     # Update UserProfile reliability stats
     total_completed = completions.count()
     total_dropped = JobCompletion.objects.filter(user=user, completed=False).count()
@@ -0,0 +1,62 @@
+"""
+Ranked interested volunteers for a poster's job.
+
+All interested volunteers and their profiles are loaded in one query and
+scored in one pass with scoring.rank_candidates. The serialized ranking
+is cached per job under a version read from the database (count and
+latest updated_at of the job's interests), so any new, changed or
+deleted interest misses the cache in every worker process, not just the
+one that handled the swipe. CANDIDATES_CACHE_TIMEOUT bounds how stale
+profile-derived parts (reliability, location) can get.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+
+from core.instrumentation import cache_lookup
+
+from .geocoding import format_distance
+from .models import MatchingInterest, UserProfile
+from .scoring import rank_candidates
+from .serializers import RankedCandidateSerializer
+
+
+def cache_key(job_id):
+    """Key for the job's current interests; changes whenever one is added, saved or deleted."""
+    version = MatchingInterest.objects.filter(job_id=job_id).aggregate(count=Count('id'), latest=Max('updated_at'))
+    latest = version['latest'].timestamp() if version['latest'] else 0
+    return f"candidates:{job_id}:{version['count']}:{latest}"
+
+
+def ranked_candidates(job):
+    """Return the full ranking as a list of dicts (cached)."""
+    key = cache_key(job.id)
+    data = cache.get(key)
+    cache_lookup(data is not None)
+    if data is not None:
+        return data
+
+    interests = MatchingInterest.objects.filter(job=job, interested=True).select_related(
+        'user', 'user__matching_profile',
+    )
+    by_user, profiles = {}, []
+    for interest in interests:
+        try:
+            profile = interest.user.matching_profile
+        except UserProfile.DoesNotExist:
+            profile = UserProfile(user=interest.user)
+        by_user[interest.user_id] = interest
+        profiles.append(profile)
+
+    rows = []
+    for profile, score, distance in rank_candidates(job, profiles):
+        interest = by_user[profile.user_id]
+        interest.profile = profile
+        interest.score = score
+        located = profile.latitude is not None and job.latitude is not None
+        interest.distance_display = format_distance(distance) if located else None
+        rows.append(interest)
+
+    data = list(RankedCandidateSerializer(rows, many=True).data)
+    cache.set(key, data, timeout=settings.CANDIDATES_CACHE_TIMEOUT)
+    return data
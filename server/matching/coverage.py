@@ -0,0 +1,142 @@
+"""
+Coverage heatmap: open jobs, active volunteers and fill rate per grid cell.
+
+`manage.py build_coverage` (run on a schedule, e.g. every 15 minutes)
+aggregates jobs and located profiles into BASE_CELL_DEGREES cells with
+one GROUP BY per table, sums those into the coarser zoom levels and
+swaps the CoverageCell rollup in a single transaction. The staff
+endpoint only reads the rollup, cached per zoom level and keyed by the
+rollup's computed_at, so every worker process picks up a rebuild on its
+next request (the command runs in its own process and cannot clear their
+caches).
+
+Privacy follows geocoding: coordinates never leave the server. The
+finest cell is 0.1 degrees (~7 miles, city scale, ten times the ~1km
+geocode_cell that labels share), responses only carry cell corners, and
+volunteer counts below COVERAGE_MIN_VOLUNTEERS are withheld so a cell
+can't single anyone out. Withholding happens on the base cells before
+they are summed: a withheld cell adds nothing to its parents, so its
+count can't be recovered by subtracting the visible children from a
+coarser zoom.
+"""
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.db.models.functions import Floor
+from django.utils import timezone
+
+from core.instrumentation import cache_lookup
+
+from .models import CoverageCell, Job, UserProfile
+from .serializers import CoverageCellSerializer
+
+BASE_CELL_DEGREES = 0.1
+BASE_COLUMNS = int(360 / BASE_CELL_DEGREES)
+# zoom level -> cell side in base cells (0 is the whole-region view)
+ZOOM_LEVELS = {0: 10, 1: 5, 2: 1}
+
+COUNTERS = ('open_jobs', 'filled_jobs', 'unfilled_jobs', 'active_volunteers')
+
+
+def cell_degrees(zoom):
+    return ZOOM_LEVELS[zoom] * BASE_CELL_DEGREES
+
+
+def rollup_version(zoom):
+    """computed_at of the current rollup (every row shares it), or None before the first build."""
+    return CoverageCell.objects.filter(zoom=zoom).values_list('computed_at', flat=True).first()
+
+
+def cache_key(zoom, version):
+    return f"coverage:{zoom}:{version.timestamp() if version else 0}"
+
+
+def _base_cells(queryset, **counts):
+    """{(row, col): {counter: n}} for located rows, grouped in the database."""
+    grouped = queryset.filter(latitude__isnull=False, longitude__isnull=False).annotate(
+        cell_row=Floor((F('latitude') + 90) / BASE_CELL_DEGREES),
+        cell_col=Floor((F('longitude') + 180) / BASE_CELL_DEGREES),
+    ).values('cell_row', 'cell_col').annotate(**counts).order_by()
+    return [
+        ((int(group['cell_row']), int(group['cell_col']) % BASE_COLUMNS), {name: group[name] for name in counts})
+        for group in grouped
+    ]
+
+
+def _visible(volunteers):
+    """The volunteer count a base cell may contribute to a coarser zoom: 0 if withheld."""
+    return 0 if volunteers < settings.COVERAGE_MIN_VOLUNTEERS else volunteers
+
+
+def aggregate(now=None):
+    """Return {zoom: {(row, col): {counter: n}}} from the live tables."""
+    now = now or timezone.now()
+    since = now - timezone.timedelta(days=settings.COVERAGE_WINDOW_DAYS)
+    is_open = Q(status='open', shift_end__gt=now)
+    filled = Q(status__in=('filled', 'completed'), shift_start__gte=since)
+    unfilled = Q(status='expired', shift_start__gte=since)
+
+    base = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+    jobs = Job.objects.filter(is_open | filled | unfilled, is_active=True)
+    for cell, counts in _base_cells(
+        jobs,
+        open_jobs=Count('id', filter=is_open),
+        filled_jobs=Count('id', filter=filled),
+        unfilled_jobs=Count('id', filter=unfilled),
+    ):
+        base[cell].update(counts)
+    profiles = UserProfile.objects.filter(user__is_active=True)
+    for cell, counts in _base_cells(profiles, active_volunteers=Count('id')):
+        base[cell].update(counts)
+
+    # Coarser zooms sum base cells whose small volunteer counts are already withheld
+    shared = {
+        cell: dict(counts, active_volunteers=_visible(counts['active_volunteers'])) for cell, counts in base.items()
+    }
+    levels = {}
+    for zoom, factor in ZOOM_LEVELS.items():
+        cells = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+        for (row, col), counts in (base if factor == 1 else shared).items():
+            totals = cells[row // factor, col // factor]
+            for name in COUNTERS:
+                totals[name] += counts[name]
+        levels[zoom] = cells
+    return levels
+
+
+def rebuild(now=None):
+    """Recompute the rollup for every zoom level; returns {zoom: cells written}."""
+    now = now or timezone.now()
+    levels = aggregate(now)
+    rows = [
+        CoverageCell(zoom=zoom, row=row, col=col, computed_at=now, **counts)
+        for zoom, cells in levels.items()
+        for (row, col), counts in cells.items()
+    ]
+    with transaction.atomic():
+        CoverageCell.objects.all().delete()
+        CoverageCell.objects.bulk_create(rows, batch_size=2000)
+    return {zoom: len(cells) for zoom, cells in levels.items()}
+
+
+def heatmap(zoom):
+    """The serialized heatmap for one zoom level (cached)."""
+    version = rollup_version(zoom)
+    key = cache_key(zoom, version)
+    data = cache.get(key)
+    cache_lookup(data is not None)
+    if data is not None:
+        return data
+
+    cells = list(CoverageCell.objects.filter(zoom=zoom).order_by('row', 'col'))
+    data = {
+        'zoom': zoom,
+        'cell_degrees': cell_degrees(zoom),
+        'computed_at': version,
+        'cells': list(CoverageCellSerializer(cells, many=True, context={'degrees': cell_degrees(zoom)}).data),
+    }
+    cache.set(key, data, timeout=settings.COVERAGE_CACHE_TIMEOUT)
+    return data
@@ -0,0 +1,76 @@
+"""
+Lean query and serialization path for the matched_jobs feed.
+
+Candidates are loaded as tuples holding only the columns scoring needs;
+card columns (including the long description) are fetched afterwards for
+the top-ranked jobs only, and cards are built as plain dicts. The output
+is identical to JobMatchSerializer plus the injected score/distance keys.
+"""
+from django.utils import timezone
+from rest_framework import serializers
+
+from .geocoding import format_distance
+from .models import Job
+
+CANDIDATE_FIELDS = (
+    'id', 'latitude', 'longitude', 'shift_start',
+    'skill_tags', 'skill_mask', 'accessibility_requirements', 'accessibility_mask',
+)
+
+CARD_FIELDS = (
+    'id', 'title', 'short_description', 'description', 'skill_tags', 'location_label',
+    'shift_start', 'shift_end', 'poster__username', 'accessibility_requirements',
+    'status', 'image',
+)
+
+# Reuse DRF's formatting so timestamps match JobMatchSerializer exactly
+_datetime_field = serializers.DateTimeField()
+
+
+class FeedCandidate:
+    """The subset of Job attributes used by scoring.Scorer."""
+    __slots__ = CANDIDATE_FIELDS
+
+    def __init__(self, row):
+        for name, value in zip(CANDIDATE_FIELDS, row):
+            setattr(self, name, value)
+
+
+def load_candidates(queryset):
+    """Return FeedCandidates for a Job queryset without building model instances."""
+    return [FeedCandidate(row) for row in queryset.values_list(*CANDIDATE_FIELDS)]
+
+
+def build_cards(scored):
+    """Turn ranked [(candidate, score, distance)] into feed card dicts."""
+    rows = {
+        row['id']: row
+        for row in Job.objects.filter(id__in=[c.id for c, _, _ in scored]).values(*CARD_FIELDS)
+    }
+    now = timezone.now()
+
+    results = []
+    for candidate, score, distance in scored:
+        row = rows.get(candidate.id)
+        if row is None:  # Deleted between the two queries
+            continue
+        shift_start = row['shift_start']
+        results.append({
+            'id': str(row['id']),
+            'title': row['title'],
+            'short_description': row['short_description'],
+            'description': row['description'],
+            'skill_tags': row['skill_tags'],
+            'location_label': row['location_label'],
+            'shift_start': _datetime_field.to_representation(shift_start),
+            'shift_end': _datetime_field.to_representation(row['shift_end']),
+            'is_urgent': max(0, (shift_start - now).total_seconds() / 3600) <= 24,
+            'distance_display': format_distance(distance) if distance is not None else None,
+            'poster_username': row['poster__username'],
+            'accessibility_requirements': row['accessibility_requirements'],
+            'status': row['status'],
+            'image': row['image'],
+            'score': score,
+            'distance': round(distance, 1) if distance else None,
+        })
+    return results
@@ -6,15 +6,23 @@ import logging
 import requests
 from django.core.cache import cache
 
+from core import metrics
+from core.instrumentation import cache_lookup
+
 logger = logging.getLogger(__name__)
 
 NOMINATIM_URL = "https://nominatim.openstreetmap.org/reverse"
 CACHE_TIMEOUT = 86400  # 24 hours
 
 
+def geocode_cell(lat: float, lng: float) -> tuple[float, float]:
+    """The ~1km cell a coordinate falls in; points in one cell share a label."""
+    return round(lat, 2), round(lng, 2)
+
+
 def _cache_key(lat: float, lng: float) -> str:
     """Generate cache key for coordinates (rounded to ~1km precision)."""
-    return f"geocode:{round(lat, 2)}:{round(lng, 2)}"
+    return "geocode:{}:{}".format(*geocode_cell(lat, lng))
 
 
 def reverse_geocode(lat: float, lng: float) -> str:
@@ -30,25 +38,28 @@ def reverse_geocode(lat: float, lng: float) -> str:
     # Check cache first
     cache_key = _cache_key(lat, lng)
     cached = cache.get(cache_key)
+    cache_lookup(cached is not None)
+    metrics.geocode_cache.labels('hit' if cached is not None else 'miss').inc()
     if cached is not None:
         return cached
 
     try:
-        response = requests.get(
-            NOMINATIM_URL,
-            params={
-                'lat': lat,
-                'lon': lng,
-                'format': 'json',
-                'addressdetails': 1,
-                'zoom': 10,  # City-level detail
-            },
-            headers={
-                'User-Agent': 'VolunteerMatchmaker/1.0',
-            },
-            timeout=5,
-        )
-        response.raise_for_status()
+        with metrics.timed(metrics.geocode_upstream_duration, operation='reverse'):
+            response = requests.get(
+                NOMINATIM_URL,
+                params={
+                    'lat': lat,
+                    'lon': lng,
+                    'format': 'json',
+                    'addressdetails': 1,
+                    'zoom': 10,  # City-level detail
+                },
+                headers={
+                    'User-Agent': 'VolunteerMatchmaker/1.0',
+                },
+                timeout=5,
+            )
+            response.raise_for_status()
         data = response.json()
 
         address = data.get('address', {})
@@ -127,20 +138,21 @@ def forward_geocode(query: str) -> tuple[float, float, str] | None:
         return None
 
     try:
-        response = requests.get(
-            "https://nominatim.openstreetmap.org/search",
-            params={
-                'q': query,
-                'format': 'json',
-                'limit': 1,
-                'addressdetails': 1,
-            },
-            headers={
-                'User-Agent': 'VolunteerMatchmaker/1.0',
-            },
-            timeout=5,
-        )
-        response.raise_for_status()
+        with metrics.timed(metrics.geocode_upstream_duration, operation='forward'):
+            response = requests.get(
+                "https://nominatim.openstreetmap.org/search",
+                params={
+                    'q': query,
+                    'format': 'json',
+                    'limit': 1,
+                    'addressdetails': 1,
+                },
+                headers={
+                    'User-Agent': 'VolunteerMatchmaker/1.0',
+                },
+                timeout=5,
+            )
+            response.raise_for_status()
         results = response.json()
 
         if not results:
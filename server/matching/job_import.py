@@ -0,0 +1,88 @@
+"""
+Batch job creation for organizations that post many shifts at once.
+
+Used by POST /api/matching/jobs/bulk-create and the import_jobs command.
+Every row is validated with JobCreateSerializer, each ~1 km geocode cell
+is reverse-geocoded once however many rows fall in it, and the valid rows
+are inserted with one bulk_create inside a transaction.
+
+By default a batch is all-or-nothing: any invalid row means nothing is
+created and every row's errors are returned. With partial=True the valid
+rows are created and the invalid ones reported.
+"""
+from collections import namedtuple
+
+from django.db import transaction
+from django.utils import timezone
+
+from . import tags
+from .geocoding import geocode_cell, reverse_geocode
+from .models import Job
+from .serializers import JobCreateSerializer
+
+# jobs: [(row_index, Job)] in input order; errors: [{'row': index, 'errors': {...}}]
+ImportResult = namedtuple('ImportResult', ['jobs', 'errors'])
+
+
+def flags_to_requirements(flags):
+    """Convert {heavy_lifting: true, ...} dict to ['heavy_lifting', ...] list."""
+    if not flags or not isinstance(flags, dict):
+        return []
+    return [key for key, val in flags.items() if val]
+
+
+def build_job(data, poster, location_label=''):
+    """Unsaved Job from JobCreateSerializer.validated_data, with default shift times."""
+    shift_start = data.get('shift_start') or timezone.now() + timezone.timedelta(hours=24)
+    shift_end = data.get('shift_end') or shift_start + timezone.timedelta(hours=2)
+    return Job(
+        title=data['title'],
+        description=data['description'],
+        short_description=data['short_description'],
+        poster=poster,
+        skill_tags=data.get('skill_tags', []),
+        accessibility_requirements=flags_to_requirements(data.get('accessibility_flags', {})),
+        latitude=data.get('latitude'),
+        longitude=data.get('longitude'),
+        location_label=location_label,
+        image=data.get('image', ''),
+        shift_start=shift_start,
+        shift_end=shift_end,
+    )
+
+
+def import_jobs(rows, poster, partial=False, dry_run=False):
+    """Validate, geocode and insert `rows` (dicts in create_job's format) for `poster`."""
+    valid, errors = [], []
+    for index, row in enumerate(rows):
+        serializer = JobCreateSerializer(data=row)
+        if serializer.is_valid():
+            valid.append((index, serializer.validated_data))
+        else:
+            errors.append({'row': index, 'errors': serializer.errors})
+
+    if errors and not partial:
+        return ImportResult([], errors)
+
+    labels = {}
+    for _, data in valid:
+        lat, lng = data.get('latitude'), data.get('longitude')
+        if lat is not None and lng is not None:
+            cell = geocode_cell(lat, lng)
+            if cell not in labels:
+                labels[cell] = reverse_geocode(lat, lng)
+
+    jobs = []
+    for index, data in valid:
+        lat, lng = data.get('latitude'), data.get('longitude')
+        label = labels[geocode_cell(lat, lng)] if lat is not None and lng is not None else ''
+        job = build_job(data, poster, label)
+        # bulk_create skips Job.save, which keeps the masks in sync
+        job.skill_mask = tags.skill_mask(job.skill_tags)
+        job.accessibility_mask = tags.accessibility_mask(job.accessibility_requirements)
+        jobs.append((index, job))
+
+    if jobs and not dry_run:
+        with transaction.atomic():
+            Job.objects.bulk_create([job for _, job in jobs])
+    return ImportResult(jobs, errors)
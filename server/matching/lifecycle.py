@@ -0,0 +1,62 @@
+"""
+Job lifecycle sweeps, run on a schedule by `manage.py sweep_jobs`.
+
+    open jobs whose shift_end has passed        -> status 'expired'
+    pending acceptances whose shift has started,
+    or whose job is no longer open              -> status 'expired'
+
+Each transition is a series of UPDATEs over at most `batch_size` primary
+keys, so no single statement holds row locks on a large slice of the
+table. QuerySet.update() skips auto_now, so updated_at is set explicitly:
+the ETag stamps and incremental exports rely on it.
+"""
+import logging
+
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Job, JobAcceptance
+
+logger = logging.getLogger(__name__)
+
+
+def _next_ids(queryset, batch_size):
+    return list(queryset.values_list('pk', flat=True)[:batch_size])
+
+
+def _update_in_batches(queryset, batch_size, dry_run, **values):
+    if dry_run:
+        return queryset.count()
+    total = 0
+    while True:
+        ids = _next_ids(queryset, batch_size)
+        if not ids:
+            return total
+        # Re-apply the filter: a row confirmed or closed since the SELECT is left alone
+        total += queryset.filter(pk__in=ids).update(**values)
+
+
+def expire_jobs(now=None, batch_size=1000, dry_run=False):
+    now = now or timezone.now()
+    stale = Job.objects.filter(status='open', shift_end__lte=now)
+    return _update_in_batches(stale, batch_size, dry_run, status='expired', updated_at=now)
+
+
+def expire_acceptances(now=None, batch_size=1000, dry_run=False):
+    now = now or timezone.now()
+    stale = JobAcceptance.objects.filter(status='pending').filter(
+        Q(job__shift_start__lte=now) | ~Q(job__status='open') | Q(job__is_active=False)
+    )
+    return _update_in_batches(stale, batch_size, dry_run, status='expired', updated_at=now)
+
+
+def sweep(now=None, batch_size=1000, dry_run=False):
+    """Run every transition; returns {name: rows changed (or matched, for dry runs)}."""
+    now = now or timezone.now()
+    # Jobs first, so acceptances on jobs expired in this run are caught too
+    counts = {
+        'jobs_expired': expire_jobs(now, batch_size, dry_run),
+        'acceptances_expired': expire_acceptances(now, batch_size, dry_run),
+    }
+    logger.info('Lifecycle sweep%s: %s', ' (dry run)' if dry_run else '', counts)
+    return counts
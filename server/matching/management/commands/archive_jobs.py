@@ -0,0 +1,40 @@
+"""
+Move closed jobs (and their interests/acceptances) to the archive tables.
+Their chat conversations are relinked to the archived job.
+
+Usage:
+    python manage.py archive_jobs
+    python manage.py archive_jobs --older-than-days 30 --dry-run
+
+Archives soft-deleted, filled, completed, cancelled and expired jobs untouched for
+--older-than-days (ARCHIVE_AFTER_DAYS by default), one --batch-size
+transaction at a time. Meant to run nightly after sweep_jobs. See
+matching.archive.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from matching.archive import archive_jobs
+
+
+class Command(BaseCommand):
+    help = 'Archive closed jobs out of the live tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--older-than-days', type=int, help='Only jobs not updated for this many days')
+        parser.add_argument('--batch-size', type=int, default=500, help='Jobs per transaction')
+        parser.add_argument('--dry-run', action='store_true', help='Count eligible rows without moving them')
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        counts = archive_jobs(
+            older_than_days=options['older_than_days'],
+            batch_size=options['batch_size'],
+            dry_run=options['dry_run'],
+        )
+        for name, count in counts.items():
+            self.stdout.write(f'{name:<18} {count:>8}')
+        self.stdout.write(self.style.SUCCESS(
+            f'{"Dry run" if options["dry_run"] else "Archive"} finished in {time.perf_counter() - start:.2f}s'
+        ))
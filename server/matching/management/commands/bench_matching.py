@@ -0,0 +1,218 @@
+"""
+Benchmark the matching pipeline on synthetic data.
+
+Usage:
+    python manage.py bench_matching
+    python manage.py bench_matching --jobs 1000 10000 100000 --users 1000 100000
+    python manage.py bench_matching --output bench.json
+    python manage.py bench_matching --compare bench.json --threshold 0.2
+
+Runs in a throwaway test database (in-memory for SQLite, test_<NAME> for
+Postgres), so the development data is never touched, and makes no
+network calls. For every jobs x users combination the data is generated
+with matching.synthetic and the following are timed:
+
+    calculate_score   one user-job pair, in memory
+    score_jobs        load and score every open job for one user (no bounding box)
+    matched_jobs      the full feed view
+    compute_badges    persist=False, as the read endpoints call it
+    swipe_interest    the swipe view (writes interest + acceptance)
+
+Results include p50/p95/p99 latency and per-call query counts. --output
+writes them as JSON; --compare flags operations whose p50 or p95 grew by
+more than --threshold against a previous run and exits non-zero.
+"""
+import json
+import platform
+import random
+import statistics
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, setup_databases, teardown_databases
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from matching import synthetic
+from matching.badges import compute_badges
+from matching.feed import load_candidates
+from matching.models import Job, UserProfile
+from matching.scoring import calculate_score, score_jobs
+from matching.views import matched_jobs, swipe_interest
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _summary(samples, queries):
+    return {
+        'calls': len(samples),
+        'mean_ms': round(statistics.mean(samples), 4),
+        'p50_ms': round(_percentile(samples, 50), 4),
+        'p95_ms': round(_percentile(samples, 95), 4),
+        'p99_ms': round(_percentile(samples, 99), 4),
+        'queries': round(statistics.mean(queries), 2) if queries else 0,
+    }
+
+
+def _measure(func, iterations, count_queries=True):
+    """Call func(i) `iterations` times; return the latency/query summary."""
+    func(0)  # Warm-up: imports, URL/serializer setup, first-touch caches
+    samples, queries = [], []
+    for i in range(iterations):
+        if count_queries:
+            with CaptureQueriesContext(connection) as ctx:
+                start = time.perf_counter()
+                func(i)
+                samples.append((time.perf_counter() - start) * 1000)
+            queries.append(len(ctx))
+        else:
+            start = time.perf_counter()
+            func(i)
+            samples.append((time.perf_counter() - start) * 1000)
+    return _summary(samples, queries)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark scoring, the feed, badges and swipes on synthetic data'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--jobs', type=int, nargs='+', default=[1000, 10000])
+        parser.add_argument('--users', type=int, nargs='+', default=[1000])
+        parser.add_argument('--iterations', type=int, default=100, help='Calls per operation')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--output', help='Write results to this JSON file')
+        parser.add_argument('--compare', help='Previous JSON results to check for regressions')
+        parser.add_argument('--threshold', type=float, default=0.2,
+                            help='Allowed relative p50/p95 increase before flagging (default 0.2)')
+
+    def handle(self, *args, **options):
+        baseline = None
+        if options['compare']:
+            with open(options['compare']) as f:
+                baseline = json.load(f)
+
+        self.stdout.write('Creating benchmark database...')
+        old_config = setup_databases(verbosity=0, interactive=False, aliases={'default'})
+        try:
+            runs = []
+            for jobs in options['jobs']:
+                for users in options['users']:
+                    call_command('flush', interactive=False, verbosity=0)
+                    runs.append(self._run(jobs, users, options))
+        finally:
+            teardown_databases(old_config, verbosity=0)
+
+        results = {
+            'created_at': datetime.now(dt_timezone.utc).isoformat(),
+            'database': connection.vendor,
+            'python': platform.python_version(),
+            'seed': options['seed'],
+            'iterations': options['iterations'],
+            'runs': runs,
+        }
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(results, f, indent=2)
+            self.stdout.write(f'Wrote {options["output"]}')
+
+        if baseline is not None:
+            regressions = self._compare(baseline, results, options['threshold'])
+            if regressions:
+                raise CommandError(f'{regressions} operation(s) regressed beyond {options["threshold"]:.0%}')
+            self.stdout.write(self.style.SUCCESS('No regressions against baseline.'))
+
+    def _run(self, job_count, user_count, options):
+        iterations = options['iterations']
+        rng = random.Random(options['seed'])
+
+        start = time.perf_counter()
+        synthetic.generate(jobs=job_count, users=user_count, seed=options['seed'])
+        self.stdout.write(
+            f'\n{job_count} jobs / {user_count} users '
+            f'(generated in {time.perf_counter() - start:.1f}s)'
+        )
+
+        profiles = list(
+            UserProfile.objects.select_related('user').filter(latitude__isnull=False)[:iterations]
+        )
+        jobs = list(Job.objects.filter(status='open'))
+        factory = APIRequestFactory()
+
+        def request_for(profile, request):
+            force_authenticate(request, user=profile.user)
+            return request
+
+        def pick(i):
+            return profiles[i % len(profiles)]
+
+        def feed(i):
+            response = matched_jobs(request_for(pick(i), factory.get('/api/matching/jobs')))
+            assert response.status_code == 200, response.status_code
+
+        def swipe(i):
+            profile = pick(i)
+            job = rng.choice(jobs)
+            request = factory.post('/api/matching/interest', {'job_id': str(job.id), 'interested': True},
+                                   format='json')
+            response = swipe_interest(request_for(profile, request))
+            assert response.status_code == 200, response.status_code
+
+        def load_and_score(i):
+            profile = pick(i)
+            score_jobs(profile, load_candidates(Job.objects.filter(status='open', is_active=True)),
+                       radius=profile.max_distance_miles)
+
+        results = {
+            'calculate_score': _measure(
+                lambda i: calculate_score(pick(i), jobs[i % len(jobs)]),
+                iterations * 10, count_queries=False,
+            ),
+            'score_jobs': _measure(load_and_score, max(1, iterations // 10)),
+            'matched_jobs': _measure(feed, iterations),
+            'compute_badges': _measure(lambda i: compute_badges(pick(i).user, persist=False), iterations),
+            'swipe_interest': _measure(swipe, iterations),
+        }
+
+        self.stdout.write(f'{"operation":<16} {"calls":>6} {"p50":>9} {"p95":>9} {"p99":>9} {"queries":>8}  (ms)')
+        for name, summary in results.items():
+            self.stdout.write(
+                f'{name:<16} {summary["calls"]:>6} {summary["p50_ms"]:>9.3f} {summary["p95_ms"]:>9.3f} '
+                f'{summary["p99_ms"]:>9.3f} {summary["queries"]:>8}'
+            )
+        return {'jobs': job_count, 'users': user_count, 'results': results}
+
+    def _compare(self, baseline, current, threshold):
+        previous = {(run['jobs'], run['users']): run['results'] for run in baseline.get('runs', [])}
+        if baseline.get('database') != current['database']:
+            self.stdout.write(self.style.WARNING(
+                f'Baseline ran on {baseline.get("database")}, this run on {current["database"]}.'
+            ))
+
+        regressions = 0
+        self.stdout.write('\nComparison with baseline (p50 / p95 change):')
+        for run in current['runs']:
+            old_results = previous.get((run['jobs'], run['users']))
+            if old_results is None:
+                continue
+            for name, summary in run['results'].items():
+                old = old_results.get(name)
+                if not old:
+                    continue
+                changes = [
+                    (summary[key] - old[key]) / old[key] if old[key] else 0
+                    for key in ('p50_ms', 'p95_ms')
+                ]
+                regressed = any(change > threshold for change in changes)
+                regressions += regressed
+                line = (f'{run["jobs"]} jobs / {run["users"]} users  {name:<16} '
+                        f'{changes[0]:+.0%} / {changes[1]:+.0%}')
+                if summary['queries'] > old['queries']:
+                    line += f'  queries {old["queries"]} -> {summary["queries"]}'
+                self.stdout.write(self.style.ERROR(line) if regressed else line)
+        return regressions
@@ -0,0 +1,25 @@
+"""
+Rebuild the coverage heatmap rollup (matching.coverage).
+
+Usage:
+    python manage.py build_coverage
+
+Meant to run on a schedule (cron, every 15 minutes or so); the staff
+heatmap endpoint serves whatever the last run wrote.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from matching.coverage import rebuild
+
+
+class Command(BaseCommand):
+    help = 'Aggregate open jobs, fill rate and active volunteers per heatmap cell'
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        written = rebuild()
+        for zoom, cells in written.items():
+            self.stdout.write(f'zoom {zoom:<3} {cells:>8} cells')
+        self.stdout.write(self.style.SUCCESS(f'Coverage rebuilt in {time.perf_counter() - start:.2f}s'))
@@ -0,0 +1,69 @@
+"""
+Import a CSV of shifts as jobs for one poster.
+
+Usage:
+    python manage.py import_jobs shifts.csv --poster org@example.com
+    python manage.py import_jobs shifts.csv --poster org@example.com --dry-run
+    python manage.py import_jobs shifts.csv --poster org@example.com --partial
+
+Columns (header row required; blank cells use create_job's defaults):
+    title, description, short_description   required
+    skill_tags                              separated by ';'
+    accessibility                           flags separated by ';', e.g. heavy_lifting;standing_long
+    latitude, longitude, shift_start, shift_end, image
+
+Rows go through matching.job_import, the same path as the bulk-create
+endpoint. Errors are reported by CSV line number. Without --partial
+nothing is imported if any row is invalid.
+"""
+import csv
+
+from django.core.management.base import BaseCommand, CommandError
+
+from authentication.models import User
+from matching.job_import import import_jobs
+
+LIST_SEPARATOR = ';'
+
+
+def _row_to_payload(row):
+    payload = {key: value.strip() for key, value in row.items() if key and value and value.strip()}
+    if 'skill_tags' in payload:
+        payload['skill_tags'] = [tag.strip() for tag in payload['skill_tags'].split(LIST_SEPARATOR) if tag.strip()]
+    if 'accessibility' in payload:
+        flags = payload.pop('accessibility').split(LIST_SEPARATOR)
+        payload['accessibility_flags'] = {flag.strip(): True for flag in flags if flag.strip()}
+    return payload
+
+
+class Command(BaseCommand):
+    help = 'Bulk-create jobs from a CSV file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV file')
+        parser.add_argument('--poster', required=True, help='Email of the posting account')
+        parser.add_argument('--partial', action='store_true', help='Import valid rows even if others fail')
+        parser.add_argument('--dry-run', action='store_true', help='Validate and geocode without saving')
+
+    def handle(self, *args, **options):
+        try:
+            poster = User.objects.get(email=options['poster'])
+        except User.DoesNotExist:
+            raise CommandError(f'No user with email {options["poster"]}')
+
+        with open(options['path'], newline='', encoding='utf-8-sig') as f:
+            rows = [_row_to_payload(row) for row in csv.DictReader(f)]
+        if not rows:
+            raise CommandError('No rows to import.')
+
+        result = import_jobs(rows, poster, partial=options['partial'], dry_run=options['dry_run'])
+        for error in result.errors:
+            # +2: header line, 1-based line numbers
+            self.stderr.write(f'line {error["row"] + 2}: {dict(error["errors"])}')
+
+        verb = 'Validated' if options['dry_run'] else 'Created'
+        if not result.jobs:
+            raise CommandError(f'{len(result.errors)} invalid row(s); nothing imported.')
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb} {len(result.jobs)} job(s) for {poster.email}; {len(result.errors)} row(s) skipped.'
+        ))
@@ -0,0 +1,31 @@
+"""
+Create upcoming occurrences of recurring jobs.
+
+Usage:
+    python manage.py materialize_recurring_jobs
+    python manage.py materialize_recurring_jobs --horizon-days 28
+
+Meant to run on a schedule (cron, hourly is plenty). Only shifts starting
+within the horizon (RECURRENCE_HORIZON_DAYS by default) are created, and
+reruns skip occurrences that already exist. See matching.recurrence.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from matching.recurrence import materialize
+
+
+class Command(BaseCommand):
+    help = 'Materialize recurring job templates into concrete jobs within the horizon'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--horizon-days', type=int, help='Days ahead to materialize')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        created = materialize(horizon_days=options['horizon_days'], batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Materialized {created} occurrence(s) in {time.perf_counter() - start:.2f}s'
+        ))
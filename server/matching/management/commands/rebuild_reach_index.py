@@ -0,0 +1,31 @@
+"""
+Rebuild the volunteer reach index (matching.spatial) from UserProfile.
+
+Usage:
+    python manage.py rebuild_reach_index
+    python manage.py rebuild_reach_index --batch-size 5000
+
+update_location and revoke_location keep the index current; run this
+after loading profiles some other way or changing spatial.CELL_DEGREES.
+Each batch of profiles is swapped in its own transaction, so fan-out
+keeps working while it runs.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from matching.spatial import reindex_all
+
+
+class Command(BaseCommand):
+    help = 'Recompute every profile\'s reach cells'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Profiles per transaction')
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        profiles, cells = reindex_all(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Indexed {profiles} profile(s) into {cells} cell(s) in {time.perf_counter() - start:.2f}s'
+        ))
@@ -0,0 +1,91 @@
+"""
+Generate production-sized synthetic data for profiling.
+
+Usage:
+    python manage.py seed_scale --users 1000000 --jobs 200000
+    python manage.py seed_scale --users 200000 --metro detroit:3 --metro east-lansing --metro 41.88,-87.63
+    python manage.py seed_scale --users 2000000 --copy        # Postgres COPY instead of bulk_create
+
+Creates volunteers and posters (each with a profile), jobs, swipes
+(MatchingInterest), acceptances, completions, conversations and
+messages with matching.synthetic. The output is deterministic for a
+given --seed and set of options. Accounts are <prefix>volunteer<n>@example.com
+and <prefix>poster<n>@example.com with password synthetic.PASSWORD, which
+is what the loadtest command logs in with.
+
+Rows are inserted in --batch-size batches and only ids are kept between
+phases, so memory stays flat as the row count grows.
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from authentication.models import User
+from matching import synthetic
+
+
+class Command(BaseCommand):
+    help = 'Bulk-generate millions of users, jobs and activity rows around metro centres'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100000, help='Volunteer accounts')
+        parser.add_argument('--posters', type=int, help='Poster accounts (default: jobs / 20)')
+        parser.add_argument('--jobs', type=int, default=20000)
+        parser.add_argument('--swipes-per-user', type=int, default=10,
+                            help='Mean swipes per volunteer (uniform 0..2x)')
+        parser.add_argument('--messages-per-conversation', type=int, default=4,
+                            help='Mean messages per conversation (uniform 1..2x)')
+        parser.add_argument('--metro', action='append', dest='metros', metavar='NAME[:WEIGHT]',
+                            help=f'Metro centre, repeatable: {", ".join(synthetic.METROS)} '
+                                 'or "lat,lng" (default east-lansing)')
+        parser.add_argument('--spread', type=float, default=10,
+                            help='Std deviation in miles around each metro centre')
+        parser.add_argument('--prefix', default='', help='Username/email prefix, to seed more than once')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--copy', action='store_true', help='Load with COPY (PostgreSQL only)')
+
+    def handle(self, *args, **options):
+        try:
+            metros = [synthetic.parse_metro(spec) for spec in options['metros'] or ['east-lansing']]
+            writer_class = synthetic.CopyWriter if options['copy'] else synthetic.BulkWriter
+            writer = writer_class(batch_size=options['batch_size'])
+        except ValueError as e:
+            raise CommandError(e)
+
+        prefix = options['prefix']
+        if User.objects.filter(email__in=[f'{prefix}volunteer0@example.com', f'{prefix}poster0@example.com']).exists():
+            raise CommandError(f'Accounts with prefix {prefix!r} already exist; pass a different --prefix.')
+
+        generator = synthetic.Generator(
+            writer=writer, seed=options['seed'], metros=metros,
+            spread_miles=options['spread'], prefix=prefix,
+        )
+        posters = options['posters'] or max(1, options['jobs'] // 20)
+        started = time.perf_counter()
+
+        self._phase('posters', lambda: generator.create_users(posters, role='poster'), writer)
+        self._phase('volunteers', lambda: generator.create_users(options['users']), writer)
+        self._phase('jobs', lambda: generator.create_jobs(options['jobs']), writer)
+        self._phase('activity', lambda: generator.create_activity(
+            swipes_per_user=options['swipes_per_user'],
+            messages_per_conversation=options['messages_per_conversation'],
+        ), writer)
+
+        self.stdout.write('')
+        for label, count in writer.counts.items():
+            self.stdout.write(f'{label:<28} {count:>12,}')
+        total = sum(writer.counts.values())
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'Inserted {total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s). '
+            f'Password for all accounts: {synthetic.PASSWORD}'
+        ))
+
+    def _phase(self, name, func, writer):
+        before = sum(writer.counts.values())
+        start = time.perf_counter()
+        func()
+        rows = sum(writer.counts.values()) - before
+        elapsed = time.perf_counter() - start
+        self.stdout.write(f'{name:<12} {rows:>12,} rows in {elapsed:6.1f}s')
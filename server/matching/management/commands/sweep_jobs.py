@@ -0,0 +1,34 @@
+"""
+Expire jobs whose shift has ended and pending acceptances that can no
+longer be confirmed.
+
+Usage:
+    python manage.py sweep_jobs
+    python manage.py sweep_jobs --dry-run
+
+Meant to run on a schedule (cron, every few minutes). The feed already
+hides ended shifts; sweeping keeps them out of the open-job indexes and
+the posters' and volunteers' lists accurate. See matching.lifecycle.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from matching.lifecycle import sweep
+
+
+class Command(BaseCommand):
+    help = 'Expire past shifts and stale pending acceptances in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows per UPDATE')
+        parser.add_argument('--dry-run', action='store_true', help='Count matching rows without changing them')
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        counts = sweep(batch_size=options['batch_size'], dry_run=options['dry_run'])
+        for name, count in counts.items():
+            self.stdout.write(f'{name:<22} {count:>8}')
+        self.stdout.write(self.style.SUCCESS(
+            f'{"Dry run" if options["dry_run"] else "Sweep"} finished in {time.perf_counter() - start:.2f}s'
+        ))
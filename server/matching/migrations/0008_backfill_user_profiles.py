@@ -0,0 +1,23 @@
+from django.db import migrations
+
+
+def backfill_profiles(apps, schema_editor):
+    User = apps.get_model('authentication', 'User')
+    UserProfile = apps.get_model('matching', 'UserProfile')
+
+    missing = User.objects.filter(matching_profile__isnull=True).values_list('id', flat=True)
+    UserProfile.objects.bulk_create(
+        (UserProfile(user_id=user_id) for user_id in missing.iterator(chunk_size=1000)),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("matching", "0007_alter_job_latitude_alter_job_longitude"),
+        ("authentication", "0002_add_avatar_field"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_profiles, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.2 on 2026-10-19 06:46
+
+from django.db import migrations, models
+
+from matching import tags
+
+
+def backfill_masks(apps, schema_editor):
+    Job = apps.get_model("matching", "Job")
+    UserProfile = apps.get_model("matching", "UserProfile")
+
+    batch = []
+    for job in Job.objects.only(
+        "id", "skill_tags", "accessibility_requirements"
+    ).iterator(chunk_size=1000):
+        job.skill_mask = tags.skill_mask(job.skill_tags)
+        job.accessibility_mask = tags.accessibility_mask(job.accessibility_requirements)
+        batch.append(job)
+        if len(batch) >= 1000:
+            Job.objects.bulk_update(batch, ["skill_mask", "accessibility_mask"])
+            batch = []
+    Job.objects.bulk_update(batch, ["skill_mask", "accessibility_mask"])
+
+    batch = []
+    for profile in UserProfile.objects.only("id", "skill_tags", "limitations").iterator(
+        chunk_size=1000
+    ):
+        profile.skill_mask = tags.skill_mask(profile.skill_tags)
+        profile.limitation_mask = tags.accessibility_mask(profile.limitations)
+        batch.append(profile)
+        if len(batch) >= 1000:
+            UserProfile.objects.bulk_update(batch, ["skill_mask", "limitation_mask"])
+            batch = []
+    UserProfile.objects.bulk_update(batch, ["skill_mask", "limitation_mask"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("matching", "0009_add_query_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="accessibility_mask",
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="skill_mask",
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="userprofile",
+            name="limitation_mask",
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="userprofile",
+            name="skill_mask",
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_masks, migrations.RunPython.noop),
+    ]
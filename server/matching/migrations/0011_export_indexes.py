@@ -0,0 +1,31 @@
+# Generated by Django 5.2 on 2026-10-19 07:17
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("matching", "0010_tag_bitmasks"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(fields=["updated_at", "id"], name="job_updated_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="jobcompletion",
+            index=models.Index(
+                fields=["updated_at", "id"], name="completion_updated_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="matchinginterest",
+            index=models.Index(
+                fields=["updated_at", "id"], name="interest_updated_idx"
+            ),
+        ),
+    ]
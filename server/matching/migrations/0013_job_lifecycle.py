@@ -0,0 +1,55 @@
+# Generated by Django 5.2 on 2026-10-19 07:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("matching", "0012_job_recurrence"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="job",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("open", "Open"),
+                    ("filled", "Filled"),
+                    ("cancelled", "Cancelled"),
+                    ("expired", "Expired"),
+                    ("template", "Template"),
+                ],
+                default="open",
+                max_length=20,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="jobacceptance",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("confirmed", "Confirmed"),
+                    ("accepted", "Accepted"),
+                    ("in_progress", "In Progress"),
+                    ("completed", "Completed"),
+                    ("dropped", "Dropped"),
+                    ("expired", "Expired"),
+                ],
+                default="pending",
+                max_length=20,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                condition=models.Q(("status", "open")),
+                fields=["shift_end"],
+                name="job_open_shift_end_idx",
+            ),
+        ),
+    ]
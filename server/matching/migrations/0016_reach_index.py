@@ -0,0 +1,102 @@
+# Generated by Django 5.2 on 2026-10-19 07:44
+
+import math
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Frozen copy of matching.spatial as of this migration, so later changes to
+# the live grid don't change what it writes (rebuild_reach_index re-grids)
+CELL_DEGREES = 0.5
+ROWS = int(180 / CELL_DEGREES)
+COLUMNS = int(360 / CELL_DEGREES)
+MILES_PER_DEGREE = 69.0
+MAX_RADIUS_MILES = 100
+
+
+def cell_of(lat, lng):
+    row = min(int((lat + 90) // CELL_DEGREES), ROWS - 1)
+    col = int((lng + 180) // CELL_DEGREES) % COLUMNS
+    return row, col
+
+
+def reach_cells(lat, lng, radius_miles):
+    radius_miles = min(radius_miles, MAX_RADIUS_MILES)
+    lat_delta = radius_miles / MILES_PER_DEGREE
+    south, north = max(-90.0, lat - lat_delta), min(90.0, lat + lat_delta)
+    widest = min(max(abs(south), abs(north)), 89.9)
+    lng_delta = radius_miles / (MILES_PER_DEGREE * math.cos(math.radians(widest)))
+
+    first_row, _ = cell_of(south, lng)
+    last_row, _ = cell_of(north, lng)
+    if 2 * lng_delta >= 360 - CELL_DEGREES:
+        cols = range(COLUMNS)
+    else:
+        first_col = int((lng - lng_delta + 180) // CELL_DEGREES)
+        last_col = int((lng + lng_delta + 180) // CELL_DEGREES)
+        cols = [col % COLUMNS for col in range(first_col, last_col + 1)]
+    return [(row, col) for row in range(first_row, last_row + 1) for col in cols]
+
+
+def backfill_reach_cells(apps, schema_editor):
+    UserProfile = apps.get_model("matching", "UserProfile")
+    ProfileReachCell = apps.get_model("matching", "ProfileReachCell")
+
+    batch = []
+    for profile in UserProfile.objects.filter(latitude__isnull=False, longitude__isnull=False).only(
+        "id", "latitude", "longitude", "max_distance_miles"
+    ).iterator(chunk_size=1000):
+        batch.extend(
+            ProfileReachCell(profile_id=profile.pk, row=row, col=col)
+            for row, col in reach_cells(
+                profile.latitude, profile.longitude, profile.max_distance_miles
+            )
+        )
+        if len(batch) >= 5000:
+            ProfileReachCell.objects.bulk_create(batch)
+            batch = []
+    ProfileReachCell.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("matching", "0015_notifications"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProfileReachCell",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("row", models.SmallIntegerField()),
+                ("col", models.SmallIntegerField()),
+            ],
+        ),
+        migrations.RemoveIndex(
+            model_name="userprofile",
+            name="profile_location_idx",
+        ),
+        migrations.AddField(
+            model_name="profilereachcell",
+            name="profile",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="reach_cells",
+                to="matching.userprofile",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profilereachcell",
+            index=models.Index(fields=["row", "col", "profile"], name="reach_cell_idx"),
+        ),
+        migrations.RunPython(backfill_reach_cells, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2 on 2026-10-19 07:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("matching", "0016_reach_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CoverageCell",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("zoom", models.SmallIntegerField()),
+                ("row", models.SmallIntegerField()),
+                ("col", models.SmallIntegerField()),
+                ("open_jobs", models.IntegerField(default=0)),
+                ("filled_jobs", models.IntegerField(default=0)),
+                ("unfilled_jobs", models.IntegerField(default=0)),
+                ("active_volunteers", models.IntegerField(default=0)),
+                ("computed_at", models.DateTimeField()),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("zoom", "row", "col"), name="coverage_cell_unique"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2 on 2026-10-19 08:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("matching", "0017_coverage_rollup"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="archivedjob",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("open", "Open"),
+                    ("filled", "Filled"),
+                    ("completed", "Completed"),
+                    ("cancelled", "Cancelled"),
+                    ("expired", "Expired"),
+                    ("template", "Template"),
+                ],
+                max_length=20,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="job",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("open", "Open"),
+                    ("filled", "Filled"),
+                    ("completed", "Completed"),
+                    ("cancelled", "Cancelled"),
+                    ("expired", "Expired"),
+                    ("template", "Template"),
+                ],
+                default="open",
+                max_length=20,
+            ),
+        ),
+    ]
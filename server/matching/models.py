@@ -1,15 +1,30 @@
 from django.db import models
 from django.utils import timezone
 
-from core.models import BaseModel
+from core.models import ArchiveModel, BaseModel
 from authentication.models import User
+from . import tags
+
+
+def _with_mask_fields(update_fields, mapping):
+    """Extend save(update_fields=...) with the masks derived from changed tag fields."""
+    if update_fields is None:
+        return None
+    update_fields = set(update_fields)
+    for source, mask_field in mapping.items():
+        if source in update_fields:
+            update_fields.add(mask_field)
+    return update_fields
 
 
 class Job(BaseModel):
     STATUS_CHOICES = [
         ('open', 'Open'),
         ('filled', 'Filled'),
+        ('completed', 'Completed'),  # Poster marked the shift done (complete_job)
         ('cancelled', 'Cancelled'),
+        ('expired', 'Expired'),    # Shift ended while still open (see lifecycle.py)
+        ('template', 'Template'),  # Recurring job pattern; never shown in the feed
     ]
 
     title = models.CharField(max_length=255)
@@ -25,6 +40,22 @@ class Job(BaseModel):
     accessibility_requirements = models.JSONField(default=list, blank=True)
     image = models.CharField(max_length=500, blank=True, default='')
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='open')
+    # Denormalised from skill_tags / accessibility_requirements on save (see tags.py)
+    skill_mask = models.BigIntegerField(default=0, editable=False)
+    accessibility_mask = models.BigIntegerField(default=0, editable=False)
+    # Set on occurrences materialized from a recurring template (see recurrence.py)
+    template = models.ForeignKey(
+        'self', on_delete=models.SET_NULL, null=True, blank=True, related_name='occurrences'
+    )
+
+    def save(self, *args, **kwargs):
+        self.skill_mask = tags.skill_mask(self.skill_tags)
+        self.accessibility_mask = tags.accessibility_mask(self.accessibility_requirements)
+        kwargs['update_fields'] = _with_mask_fields(kwargs.get('update_fields'), {
+            'skill_tags': 'skill_mask',
+            'accessibility_requirements': 'accessibility_mask',
+        })
+        super().save(*args, **kwargs)
 
     @property
     def urgency_hours(self):
@@ -40,6 +71,32 @@ class Job(BaseModel):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # matched_jobs: open, active jobs inside a lat/lon bounding box
+            models.Index(
+                fields=['latitude', 'longitude'],
+                condition=models.Q(status='open', is_active=True),
+                name='job_open_location_idx',
+            ),
+            # my_posted_jobs: a poster's active jobs, newest first
+            models.Index(
+                fields=['poster', '-created_at'],
+                condition=models.Q(is_active=True),
+                name='job_poster_active_idx',
+            ),
+            # Incremental exports: rows changed since the last watermark
+            models.Index(fields=['updated_at', 'id'], name='job_updated_idx'),
+            # Lifecycle sweeper: open jobs whose shift has ended
+            models.Index(fields=['shift_end'], condition=models.Q(status='open'), name='job_open_shift_end_idx'),
+        ]
+        constraints = [
+            # One occurrence per template and start time, so materialization can be rerun
+            models.UniqueConstraint(
+                fields=['template', 'shift_start'],
+                condition=models.Q(template__isnull=False),
+                name='job_occurrence_unique',
+            ),
+        ]
 
 
 class UserProfile(BaseModel):
@@ -59,10 +116,22 @@ class UserProfile(BaseModel):
     limitations = models.JSONField(default=list, blank=True)
     jobs_completed = models.IntegerField(default=0)
     jobs_dropped = models.IntegerField(default=0)
+    # Denormalised from skill_tags / limitations on save (see tags.py)
+    skill_mask = models.BigIntegerField(default=0, editable=False)
+    limitation_mask = models.BigIntegerField(default=0, editable=False)
 
     def __str__(self):
         return f"Profile: {self.user.email}"
 
+    def save(self, *args, **kwargs):
+        self.skill_mask = tags.skill_mask(self.skill_tags)
+        self.limitation_mask = tags.accessibility_mask(self.limitations)
+        kwargs['update_fields'] = _with_mask_fields(kwargs.get('update_fields'), {
+            'skill_tags': 'skill_mask',
+            'limitations': 'limitation_mask',
+        })
+        super().save(*args, **kwargs)
+
     @property
     def display_location(self):
         """Return privacy-safe location string."""
@@ -73,10 +142,47 @@ class UserProfile(BaseModel):
         return "Location not set"
 
 
+class ProfileReachCell(models.Model):
+    """One grid cell a located profile's travel radius overlaps; maintained by matching.spatial."""
+    profile = models.ForeignKey(UserProfile, on_delete=models.CASCADE, related_name='reach_cells')
+    row = models.SmallIntegerField()
+    col = models.SmallIntegerField()
+
+    class Meta:
+        indexes = [
+            # Reverse radius lookup: every profile that can reach a cell, without touching the table
+            models.Index(fields=['row', 'col', 'profile'], name='reach_cell_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.profile_id} reaches ({self.row}, {self.col})"
+
+
+class JobRecurrence(BaseModel):
+    """RRULE-style repeat rule for a template job; occurrences start at the template's time of day."""
+    FREQUENCY_CHOICES = [
+        ('daily', 'Daily'),
+        ('weekly', 'Weekly'),
+    ]
+
+    template = models.OneToOneField(Job, on_delete=models.CASCADE, related_name='recurrence')
+    frequency = models.CharField(max_length=10, choices=FREQUENCY_CHOICES, default='weekly')
+    interval = models.PositiveSmallIntegerField(default=1)  # every N days/weeks
+    weekdays = models.JSONField(default=list, blank=True)  # weekly only, 0=Monday; empty = template's weekday
+    until = models.DateTimeField(null=True, blank=True)  # last possible shift start
+    count = models.PositiveIntegerField(null=True, blank=True)  # total occurrences, counted from the template
+    materialized_until = models.DateTimeField(null=True, blank=True)  # occurrences up to here exist
+
+    def __str__(self):
+        return f"{self.template.title} ({self.get_frequency_display()}, interval {self.interval})"
+
+
 class JobCompletion(BaseModel):
     """Tracks each completed/dropped job for badge computation."""
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='job_completions')
-    job = models.ForeignKey('Job', on_delete=models.CASCADE, related_name='completions')
+    # No database constraint: completions outlive their job when it is archived
+    # (see archive.py), and badges only read the snapshot fields below
+    job = models.ForeignKey('Job', on_delete=models.DO_NOTHING, db_constraint=False, related_name='completions')
     completed = models.BooleanField(default=True)  # False = dropped
     was_urgent = models.BooleanField(default=False)  # shift was within 24h at time of fill
     had_accessibility = models.BooleanField(default=False)  # job had accessibility requirements
@@ -84,10 +190,17 @@ class JobCompletion(BaseModel):
 
     class Meta:
         unique_together = ('user', 'job')
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='completion_updated_idx'),
+        ]
 
     def __str__(self):
         status = 'completed' if self.completed else 'dropped'
-        return f"{self.user.email} {status} {self.job.title}"
+        try:
+            title = self.job.title
+        except Job.DoesNotExist:  # Archived; see the job field
+            title = ArchivedJob.objects.filter(pk=self.job_id).values_list('title', flat=True).first() or self.job_id
+        return f"{self.user.email} {status} {title}"
 
 
 class Badge(BaseModel):
@@ -125,6 +238,9 @@ class MatchingInterest(BaseModel):
 
     class Meta:
         unique_together = ('user', 'job')
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='interest_updated_idx'),
+        ]
 
     def __str__(self):
         action = 'interested in' if self.interested else 'passed on'
@@ -139,6 +255,7 @@ class JobAcceptance(BaseModel):
         ('in_progress', 'In Progress'),
         ('completed', 'Completed'),
         ('dropped', 'Dropped'),
+        ('expired', 'Expired'),         # Still pending when the shift started or the job closed
     ]
 
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='job_acceptances')
@@ -150,3 +267,101 @@ class JobAcceptance(BaseModel):
 
     def __str__(self):
         return f"{self.user.email} {self.status} for {self.job.title}"
+
+
+class Notification(BaseModel):
+    """Inbox entry for one user, e.g. a newly posted job that matches them (see notifications.py)."""
+    KIND_CHOICES = [
+        ('new_job', 'New matching job'),
+    ]
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='notifications')
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='notifications')
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, default='new_job')
+    score = models.FloatField(default=0)
+    read_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'job', 'kind'], name='notification_unique'),
+        ]
+        indexes = [
+            # Inbox, newest first
+            models.Index(fields=['user', '-created_at'], name='notification_inbox_idx'),
+            # Unread count
+            models.Index(fields=['user'], condition=models.Q(read_at__isnull=True), name='notification_unread_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user.email}: {self.get_kind_display()} {self.job.title}"
+
+
+# ── Archive ───────────────────────────────────────────────────────────────────
+# Closed jobs and their interests/acceptances are moved here by archive.py so
+# the live tables (and their indexes) only hold jobs that can still change.
+
+class ArchivedJob(ArchiveModel):
+    title = models.CharField(max_length=255)
+    description = models.TextField()
+    short_description = models.CharField(max_length=200)
+    poster = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_jobs')
+    latitude = models.FloatField(null=True, blank=True)
+    longitude = models.FloatField(null=True, blank=True)
+    location_label = models.CharField(max_length=255, blank=True, default='')
+    shift_start = models.DateTimeField()
+    shift_end = models.DateTimeField()
+    skill_tags = models.JSONField(default=list, blank=True)
+    accessibility_requirements = models.JSONField(default=list, blank=True)
+    image = models.CharField(max_length=500, blank=True, default='')
+    status = models.CharField(max_length=20, choices=Job.STATUS_CHOICES)
+
+    # Same derived fields as a live job, so serializers treat both alike
+    urgency_hours = Job.urgency_hours
+    is_urgent = Job.is_urgent
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['poster', '-created_at'], name='archived_job_poster_idx'),
+        ]
+
+    def __str__(self):
+        return self.title
+
+
+class ArchivedMatchingInterest(ArchiveModel):
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_interests')
+    job = models.ForeignKey(ArchivedJob, on_delete=models.CASCADE, related_name='interests')
+    interested = models.BooleanField()
+
+
+class ArchivedJobAcceptance(ArchiveModel):
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_acceptances')
+    job = models.ForeignKey(ArchivedJob, on_delete=models.CASCADE, related_name='acceptances')
+    status = models.CharField(max_length=20, choices=JobAcceptance.STATUS_CHOICES)
+
+
+class CoverageCell(models.Model):
+    """Supply/demand rollup for one heatmap cell at one zoom level; rebuilt by matching.coverage."""
+    zoom = models.SmallIntegerField()
+    row = models.SmallIntegerField()
+    col = models.SmallIntegerField()
+    open_jobs = models.IntegerField(default=0)
+    filled_jobs = models.IntegerField(default=0)  # Within COVERAGE_WINDOW_DAYS
+    unfilled_jobs = models.IntegerField(default=0)  # Expired unfilled, within COVERAGE_WINDOW_DAYS
+    active_volunteers = models.IntegerField(default=0)
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['zoom', 'row', 'col'], name='coverage_cell_unique'),
+        ]
+
+    def __str__(self):
+        return f"z{self.zoom} ({self.row}, {self.col})"
+
+    @property
+    def fill_rate(self):
+        decided = self.filled_jobs + self.unfilled_jobs
+        return round(self.filled_jobs / decided, 3) if decided else None
@@ -0,0 +1,104 @@
+"""
+Fan-out of new jobs to nearby volunteers' notification inboxes.
+
+create_job calls schedule_fanout(job). Once the transaction commits, the
+job is handed to a small thread pool (NOTIFY_FANOUT_WORKERS), so posting
+never waits on it. fan_out() then:
+
+    1. loads volunteers whose own max_distance_miles can reach the job
+       from the reach index (matching.spatial, at most
+       NOTIFY_MAX_CANDIDATES profiles),
+    2. scores them in one pass with scoring.rank_candidates,
+    3. bulk-creates Notification rows for the best NOTIFY_MAX_RECIPIENTS
+       scoring at least NOTIFY_MIN_SCORE.
+
+Every stage is bounded. When NOTIFY_FANOUT_QUEUE fan-outs are already
+pending, new ones are dropped (and counted) rather than queued without
+limit. NOTIFY_FANOUT_ASYNC=False runs fan-out inline after commit, which
+is what tests use.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections, transaction
+
+from core import metrics
+from .models import Job, Notification
+from .scoring import rank_candidates
+from .spatial import can_reach, profiles_reaching
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+_pending = None
+
+
+def _pool():
+    global _executor, _pending
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.NOTIFY_FANOUT_WORKERS, thread_name_prefix='notify-fanout',
+            )
+            _pending = threading.BoundedSemaphore(settings.NOTIFY_FANOUT_QUEUE)
+    return _executor, _pending
+
+
+def fan_out(job_id):
+    """Notify matching volunteers about one job. Returns the number of notifications written."""
+    with metrics.timed(metrics.fanout_duration):
+        job = Job.objects.filter(id=job_id, status='open', is_active=True).first()
+        if job is None or job.latitude is None or job.longitude is None:
+            return 0
+
+        profiles = [
+            profile for profile in profiles_reaching(job.latitude, job.longitude)
+            .exclude(user_id=job.poster_id)
+            .filter(user__is_active=True)[:settings.NOTIFY_MAX_CANDIDATES]
+            if can_reach(profile, job.latitude, job.longitude)
+        ]
+        recipients = [
+            (profile, score) for profile, score, _ in rank_candidates(job, profiles)
+            if score >= settings.NOTIFY_MIN_SCORE
+        ][:settings.NOTIFY_MAX_RECIPIENTS]
+
+        Notification.objects.bulk_create(
+            [Notification(user_id=profile.user_id, job=job, kind='new_job', score=score)
+             for profile, score in recipients],
+            ignore_conflicts=True,
+        )
+    metrics.notifications_created.labels('new_job').inc(len(recipients))
+    return len(recipients)
+
+
+def _run(job_id, pending):
+    try:
+        fan_out(job_id)
+    except Exception:
+        logger.exception('Notification fan-out failed for job %s', job_id)
+    finally:
+        pending.release()
+        # Connections are per thread; don't leave this worker's open
+        connections.close_all()
+
+
+def _submit(job_id):
+    if not settings.NOTIFY_FANOUT_ASYNC:
+        fan_out(job_id)
+        return
+    executor, pending = _pool()
+    if not pending.acquire(blocking=False):
+        metrics.fanout_dropped.inc()
+        logger.warning('Notification fan-out queue full; skipping job %s', job_id)
+        return
+    executor.submit(_run, job_id, pending)
+
+
+def schedule_fanout(job):
+    """Fan the job out to nearby volunteers after the current transaction commits."""
+    if settings.NOTIFY_FANOUT_ENABLED:
+        job_id = job.id
+        transaction.on_commit(lambda: _submit(job_id))
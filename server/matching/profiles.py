@@ -0,0 +1,34 @@
+"""
+Request-scoped access to the current user's UserProfile.
+
+Every registered user gets a profile (RegisterSerializer.create, plus the
+0008 backfill migration for older accounts), so reads never need
+get_or_create. get_profile() never writes: a user that somehow has no row
+gets an unsaved default profile. Only write paths use
+get_profile_for_update(), which creates the row if it is missing.
+"""
+from .models import UserProfile
+
+_REQUEST_ATTR = '_matching_profile'
+
+
+def get_profile(request):
+    """Return the requesting user's profile without touching the database if possible."""
+    profile = getattr(request, _REQUEST_ATTR, None)
+    if profile is None:
+        try:
+            # Usually preloaded by CachedJWTAuthentication
+            profile = request.user.matching_profile
+        except UserProfile.DoesNotExist:
+            profile = UserProfile(user=request.user)
+        setattr(request, _REQUEST_ATTR, profile)
+    return profile
+
+
+def get_profile_for_update(request):
+    """Return a saved profile for the requesting user, creating it if needed."""
+    profile = get_profile(request)
+    if profile._state.adding:
+        profile, _ = UserProfile.objects.get_or_create(user=request.user)
+        setattr(request, _REQUEST_ATTR, profile)
+    return profile
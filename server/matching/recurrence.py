@@ -0,0 +1,124 @@
+"""
+Recurring jobs.
+
+A recurring job is a template Job (status 'template', so it never shows
+up in the feed) plus a JobRecurrence rule. materialize() creates the
+concrete occurrences whose shift starts within the next
+RECURRENCE_HORIZON_DAYS, so the jobs table only holds near-term shifts
+however long a series runs. Schedule `manage.py materialize_recurring_jobs`
+(e.g. hourly); reruns are harmless because occurrences are unique per
+(template, shift_start) and inserted with ignore_conflicts.
+
+Rules follow a small RRULE subset: FREQ=DAILY|WEEKLY, INTERVAL, BYDAY
+(weekdays), UNTIL and COUNT, with DTSTART being the template's shift
+start. Occurrences keep the template's local wall-clock time.
+"""
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Job, JobRecurrence
+
+# Template fields copied onto every occurrence
+COPIED_FIELDS = (
+    'title', 'description', 'short_description', 'poster_id', 'latitude', 'longitude',
+    'location_label', 'skill_tags', 'accessibility_requirements', 'image',
+    'skill_mask', 'accessibility_mask',
+)
+
+
+def _period_days(recurrence):
+    return recurrence.interval * (7 if recurrence.frequency == 'weekly' else 1)
+
+
+def occurrences(recurrence, after, end):
+    """Yield occurrence start times in (after, end], in order."""
+    first = timezone.localtime(recurrence.template.shift_start)
+    wall_time = first.time()
+    period = _period_days(recurrence)
+    if recurrence.frequency == 'weekly':
+        anchor = first.date() - timedelta(days=first.weekday())  # Monday of the first week
+        offsets = sorted(set(recurrence.weekdays)) or [first.weekday()]
+    else:
+        anchor = first.date()
+        offsets = [0]
+
+    # COUNT needs every occurrence since the first; otherwise skip ahead to `after`
+    step = 0
+    if recurrence.count is None and after > first:
+        step = max(0, (timezone.localtime(after).date() - anchor).days // period - 1)
+    produced = step * len(offsets)
+
+    while True:
+        for offset in offsets:
+            day = anchor + timedelta(days=step * period + offset)
+            start = timezone.make_aware(datetime.combine(day, wall_time))
+            if start < first:
+                continue
+            if recurrence.until and start > recurrence.until:
+                return
+            produced += 1
+            if recurrence.count and produced > recurrence.count:
+                return
+            if start > end:
+                return
+            if start > after:
+                yield start
+        step += 1
+
+
+def build_occurrence(template, start):
+    job = Job(
+        template=template,
+        status='open',
+        shift_start=start,
+        shift_end=start + (template.shift_end - template.shift_start),
+    )
+    for field in COPIED_FIELDS:
+        setattr(job, field, getattr(template, field))
+    return job
+
+
+def materialize(recurrences=None, now=None, horizon_days=None, batch_size=1000):
+    """
+    Create occurrences up to now + horizon for every live recurrence.
+
+    Returns the number of occurrences written (including any that already
+    existed and were skipped as conflicts).
+    """
+    now = now or timezone.now()
+    horizon = now + timedelta(days=horizon_days or settings.RECURRENCE_HORIZON_DAYS)
+    if recurrences is None:
+        recurrences = JobRecurrence.objects.all()
+    recurrences = recurrences.filter(
+        is_active=True, template__is_active=True, template__status='template',
+    ).filter(
+        Q(materialized_until__isnull=True) | Q(materialized_until__lt=horizon)
+    ).select_related('template')
+
+    total = 0
+    jobs, done = [], []
+    for recurrence in recurrences.iterator(chunk_size=500):
+        after = max(recurrence.materialized_until or now, now)
+        # Include a template starting exactly now
+        jobs.extend(build_occurrence(recurrence.template, start)
+                    for start in occurrences(recurrence, after - timedelta(microseconds=1), horizon))
+        recurrence.materialized_until = horizon
+        done.append(recurrence)
+        if len(jobs) >= batch_size:
+            total += _flush(jobs, done)
+            jobs, done = [], []
+    if done:
+        total += _flush(jobs, done)
+    return total
+
+
+def _flush(jobs, recurrences):
+    # Occurrences and their high-water marks commit together, so a crash never skips shifts
+    with transaction.atomic():
+        Job.objects.bulk_create(jobs, ignore_conflicts=True)
+        JobRecurrence.objects.bulk_update(recurrences, ['materialized_until'])
+    return len(jobs)
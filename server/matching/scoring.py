@@ -1,9 +1,15 @@
 import math
 
+from django.utils import timezone
+
+from . import tags
+
+EARTH_RADIUS_MILES = 3959
+
 
 def haversine_distance(lat1, lon1, lat2, lon2):
     """Calculate distance in miles between two lat/lng points."""
-    R = 3959  # Earth radius in miles
+    R = EARTH_RADIUS_MILES
     lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
     dlat = lat2 - lat1
     dlon = lon2 - lon1
@@ -12,6 +18,98 @@ def haversine_distance(lat1, lon1, lat2, lon2):
     return R * c
 
 
+class Scorer:
+    """
+    Scores jobs for one user.
+
+    Everything that depends only on the user (reliability, location in
+    radians, tag masks) is computed once, so scoring a batch of jobs only
+    does the per-job work. Tag comparisons use the bitmasks from tags.py
+    and fall back to the string lists when either side has unmapped tags.
+    """
+
+    def __init__(self, user_profile, radius=25):
+        self.profile = user_profile
+        self.radius = radius
+        self.now = timezone.now()
+
+        self.has_location = user_profile.latitude is not None and user_profile.longitude is not None
+        if self.has_location:
+            self.lat = math.radians(user_profile.latitude)
+            self.lon = math.radians(user_profile.longitude)
+            self.cos_lat = math.cos(self.lat)
+
+        self.limitation_mask = user_profile.limitation_mask
+        self.skill_mask = user_profile.skill_mask
+        self._limitations = None
+        self._skill_tags = None
+
+        # R_15: Reliability (max 15)
+        completed = user_profile.jobs_completed
+        dropped = user_profile.jobs_dropped
+        total = completed + dropped
+        if total == 0:
+            self.r_score = 15 * 0.5
+        else:
+            self.r_score = 15 * (completed / total)
+
+    def _distance(self, job):
+        lat2 = math.radians(job.latitude)
+        lon2 = math.radians(job.longitude)
+        a = (math.sin((lat2 - self.lat) / 2) ** 2
+             + self.cos_lat * math.cos(lat2) * math.sin((lon2 - self.lon) / 2) ** 2)
+        return EARTH_RADIUS_MILES * 2 * math.asin(math.sqrt(a))
+
+    def _conflicts(self, job):
+        if tags.is_exact(self.limitation_mask, job.accessibility_mask):
+            return bool(self.limitation_mask & job.accessibility_mask)
+        if self._limitations is None:
+            self._limitations = set(self.profile.limitations or [])
+        return bool(self._limitations & set(job.accessibility_requirements or []))
+
+    def _skill_overlap(self, job):
+        """Return (overlap, job_tag_count)."""
+        if tags.is_exact(job.skill_mask):
+            return (job.skill_mask & self.skill_mask).bit_count(), job.skill_mask.bit_count()
+        if self._skill_tags is None:
+            self._skill_tags = set(tag.lower() for tag in (self.profile.skill_tags or []))
+        job_tags = set(tag.lower() for tag in (job.skill_tags or []))
+        return len(job_tags & self._skill_tags), len(job_tags)
+
+    def score(self, job):
+        """Return (score, distance) for one job."""
+        # A_bool: Accessibility filter
+        if self._conflicts(job):
+            return 0, None
+
+        # D_35: Distance score (max 35)
+        if not self.has_location:
+            distance = 0
+            d_score = 17.5  # Half score if no location
+        else:
+            distance = self._distance(job)
+            if distance > self.radius:
+                return 0, distance
+            d_score = 35 * max(0, 1 - distance / self.radius)
+
+        # S_30: Skill overlap (max 30)
+        overlap, job_tag_count = self._skill_overlap(job)
+        if not job_tag_count:
+            s_score = 30
+        else:
+            s_score = 30 * (overlap / job_tag_count)
+
+        # U_20: Urgency (max 20), same as Job.urgency_hours with a shared "now"
+        hours = max(0, (job.shift_start - self.now).total_seconds() / 3600)
+        if hours <= 24:
+            u_score = 20
+        else:
+            u_score = 20 * max(0, 1 - hours / 168)
+
+        score = d_score + s_score + u_score + self.r_score
+        return round(score, 2), round(distance, 2) if distance else 0
+
+
 def calculate_score(user_profile, job, radius=25):
     """
     Calculate matching score for a user-job pair.
@@ -19,49 +117,36 @@ def calculate_score(user_profile, job, radius=25):
     Score = A_bool × (D_35 + S_30 + U_20 + R_15)
     Returns (score, distance) tuple.
     """
-    # A_bool: Accessibility filter
-    user_limitations = set(user_profile.limitations or [])
-    job_requirements = set(job.accessibility_requirements or [])
-    if user_limitations & job_requirements:
-        return 0, None
-
-    # D_35: Distance score (max 35)
-    if user_profile.latitude is None or user_profile.longitude is None:
-        distance = 0
-        d_score = 17.5  # Half score if no location
-    else:
-        distance = haversine_distance(
-            user_profile.latitude, user_profile.longitude,
-            job.latitude, job.longitude,
-        )
-        if distance > radius:
-            return 0, distance
-        d_score = 35 * max(0, 1 - distance / radius)
-
-    # S_30: Skill overlap (max 30)
-    job_tags = set(tag.lower() for tag in (job.skill_tags or []))
-    if not job_tags:
-        s_score = 30
-    else:
-        user_tags = set(tag.lower() for tag in (user_profile.skill_tags or []))
-        overlap = len(job_tags & user_tags)
-        s_score = 30 * (overlap / len(job_tags))
-
-    # U_20: Urgency (max 20)
-    hours = job.urgency_hours
-    if hours <= 24:
-        u_score = 20
-    else:
-        u_score = 20 * max(0, 1 - hours / 168)
-
-    # R_15: Reliability (max 15)
-    completed = user_profile.jobs_completed
-    dropped = user_profile.jobs_dropped
-    total = completed + dropped
-    if total == 0:
-        r_score = 15 * 0.5
-    else:
-        r_score = 15 * (completed / total)
-
-    score = d_score + s_score + u_score + r_score
-    return round(score, 2), round(distance, 2) if distance else 0
+    return Scorer(user_profile, radius=radius).score(job)
+
+
+def score_jobs(user_profile, jobs, radius=25):
+    """Score many jobs for one user. Returns [(job, score, distance)] for score > 0."""
+    scorer = Scorer(user_profile, radius=radius)
+    scored = []
+    for job in jobs:
+        score, distance = scorer.score(job)
+        if score > 0:
+            scored.append((job, score, distance))
+    return scored
+
+
+def rank_candidates(job, profiles):
+    """
+    Score volunteers' profiles against one job, best first: [(profile, score, distance)].
+
+    The poster-side view of the same weights: each volunteer is scored
+    with their own radius. Volunteers outside it or with an accessibility
+    conflict score 0 and sort last instead of being dropped, since they
+    asked for the job anyway.
+    """
+    job_located = job.latitude is not None and job.longitude is not None
+    ranked = []
+    for profile in profiles:
+        scorer = Scorer(profile, radius=profile.max_distance_miles or 25)
+        if not job_located:
+            scorer.has_location = False  # Half distance score, as for a volunteer without a location
+        score, distance = scorer.score(job)
+        ranked.append((profile, score, distance))
+    ranked.sort(key=lambda item: (-item[1], item[2] if item[2] is not None else math.inf))
+    return ranked
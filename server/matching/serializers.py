@@ -1,6 +1,10 @@
+from django.conf import settings
 from rest_framework import serializers
 
-from .models import Job, UserProfile, MatchingInterest, JobAcceptance
+from .models import (
+    ArchivedJob, ArchivedJobAcceptance, Job, JobRecurrence, UserProfile, MatchingInterest, JobAcceptance,
+    Notification, CoverageCell,
+)
 from .geocoding import format_distance
 
 
@@ -32,6 +36,13 @@ class JobMatchSerializer(serializers.ModelSerializer):
         return None
 
 
+class ArchivedJobSerializer(JobMatchSerializer):
+    """Same shape as JobMatchSerializer, for jobs moved to the archive."""
+
+    class Meta(JobMatchSerializer.Meta):
+        model = ArchivedJob
+
+
 class JobDetailSerializer(serializers.ModelSerializer):
     """Full job serializer for job owners (includes coordinates)."""
     is_urgent = serializers.BooleanField(read_only=True)
@@ -71,6 +82,8 @@ class UserProfileFullSerializer(serializers.ModelSerializer):
             'display_location', 'max_distance_miles', 'skill_tags', 'limitations',
         ]
         read_only_fields = ['display_location']
+        # Same bounds as LocationUpdateSerializer
+        extra_kwargs = {'max_distance_miles': {'min_value': 1, 'max_value': 100}}
 
 
 class LocationUpdateSerializer(serializers.Serializer):
@@ -149,6 +162,24 @@ class JobCreateSerializer(serializers.Serializer):
         return data
 
 
+class JobRecurrenceSerializer(serializers.ModelSerializer):
+    interval = serializers.IntegerField(min_value=1, max_value=52, default=1)
+    weekdays = serializers.ListField(
+        child=serializers.IntegerField(min_value=0, max_value=6), required=False, default=list
+    )
+    count = serializers.IntegerField(min_value=1, required=False, allow_null=True, default=None)
+
+    class Meta:
+        model = JobRecurrence
+        fields = ['id', 'frequency', 'interval', 'weekdays', 'until', 'count', 'materialized_until']
+        read_only_fields = ['id', 'materialized_until']
+
+    def validate(self, data):
+        if data.get('weekdays') and data.get('frequency', 'weekly') != 'weekly':
+            raise serializers.ValidationError('weekdays only apply to weekly recurrences.')
+        return data
+
+
 class JobAcceptanceSerializer(serializers.ModelSerializer):
     job = JobMatchSerializer(read_only=True)
     username = serializers.CharField(source='user.username', read_only=True)
@@ -158,6 +189,13 @@ class JobAcceptanceSerializer(serializers.ModelSerializer):
         fields = ['id', 'job', 'username', 'status', 'created_at']
 
 
+class ArchivedJobAcceptanceSerializer(JobAcceptanceSerializer):
+    job = ArchivedJobSerializer(read_only=True)
+
+    class Meta(JobAcceptanceSerializer.Meta):
+        model = ArchivedJobAcceptance
+
+
 class AcceptVolunteerSerializer(serializers.Serializer):
     user_id = serializers.IntegerField()
 
@@ -169,3 +207,47 @@ class InterestedUserSerializer(serializers.Serializer):
     first_name = serializers.CharField(source='user.first_name')
     last_name = serializers.CharField(source='user.last_name')
     interested_at = serializers.DateTimeField(source='created_at')
+
+
+class RankedCandidateSerializer(InterestedUserSerializer):
+    score = serializers.FloatField()
+    distance_display = serializers.CharField(allow_null=True)
+    jobs_completed = serializers.IntegerField(source='profile.jobs_completed')
+    jobs_dropped = serializers.IntegerField(source='profile.jobs_dropped')
+    skill_tags = serializers.ListField(source='profile.skill_tags', child=serializers.CharField())
+
+
+class NotificationSerializer(serializers.ModelSerializer):
+    job = JobMatchSerializer(read_only=True)
+    read = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Notification
+        fields = ['id', 'kind', 'job', 'score', 'read', 'created_at']
+
+    def get_read(self, obj):
+        return obj.read_at is not None
+
+
+class CoverageCellSerializer(serializers.ModelSerializer):
+    """One heatmap cell; context['degrees'] is the cell side at the requested zoom."""
+    south = serializers.SerializerMethodField()
+    west = serializers.SerializerMethodField()
+    fill_rate = serializers.FloatField(read_only=True)
+    active_volunteers = serializers.SerializerMethodField()
+
+    class Meta:
+        model = CoverageCell
+        fields = ['south', 'west', 'open_jobs', 'filled_jobs', 'unfilled_jobs', 'fill_rate', 'active_volunteers']
+
+    def get_south(self, obj):
+        return round(obj.row * self.context['degrees'] - 90, 4)
+
+    def get_west(self, obj):
+        return round(obj.col * self.context['degrees'] - 180, 4)
+
+    def get_active_volunteers(self, obj):
+        # Withheld (null) when so few volunteers that the count could identify them
+        if 0 < obj.active_volunteers < settings.COVERAGE_MIN_VOLUNTEERS:
+            return None
+        return obj.active_volunteers
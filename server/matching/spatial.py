@@ -0,0 +1,104 @@
+"""
+Reach index: which volunteers can reach a point within their own radius.
+
+The globe is cut into CELL_DEGREES x CELL_DEGREES cells. Each located
+profile gets one ProfileReachCell row per cell its travel circle
+(max_distance_miles around its location) overlaps: about 6 rows at the
+default 25 miles, at most ~80 at 100. "Who can reach this point" is then
+a single equality lookup on the point's cell (reach_cell_idx), followed
+by an exact haversine check on the profiles it returns. That stays cheap
+however many volunteers a metro holds and whatever radius each one picked,
+unlike a bounding-box scan sized for the largest radius.
+
+update_location, revoke_location and profile edits of max_distance_miles
+call reindex(). Writes that bypass them (seed scripts, raw SQL) can be
+repaired with `manage.py rebuild_reach_index`, which is also required
+after changing CELL_DEGREES.
+"""
+import math
+
+from django.db import transaction
+
+from .models import ProfileReachCell, UserProfile
+from .scoring import haversine_distance
+
+CELL_DEGREES = 0.5
+ROWS = int(180 / CELL_DEGREES)
+COLUMNS = int(360 / CELL_DEGREES)
+MILES_PER_DEGREE = 69.0
+MAX_RADIUS_MILES = 100  # The serializers' bound on max_distance_miles
+
+
+def cell_of(lat, lng):
+    """(row, col) of the cell containing a point; columns wrap at the antimeridian."""
+    row = min(int((lat + 90) // CELL_DEGREES), ROWS - 1)
+    col = int((lng + 180) // CELL_DEGREES) % COLUMNS
+    return row, col
+
+
+def reach_cells(lat, lng, radius_miles):
+    """Every cell that a circle of radius_miles around (lat, lng) overlaps (a superset)."""
+    # Clamped so an out-of-range radius written around the serializers can't flood the index
+    radius_miles = min(radius_miles, MAX_RADIUS_MILES)
+    lat_delta = radius_miles / MILES_PER_DEGREE
+    south, north = max(-90.0, lat - lat_delta), min(90.0, lat + lat_delta)
+    # A degree of longitude is shortest at the edge nearest the pole
+    widest = min(max(abs(south), abs(north)), 89.9)
+    lng_delta = radius_miles / (MILES_PER_DEGREE * math.cos(math.radians(widest)))
+
+    first_row, _ = cell_of(south, lng)
+    last_row, _ = cell_of(north, lng)
+    if 2 * lng_delta >= 360 - CELL_DEGREES:
+        cols = range(COLUMNS)
+    else:
+        first_col = int((lng - lng_delta + 180) // CELL_DEGREES)
+        last_col = int((lng + lng_delta + 180) // CELL_DEGREES)
+        cols = [col % COLUMNS for col in range(first_col, last_col + 1)]
+    return [(row, col) for row in range(first_row, last_row + 1) for col in cols]
+
+
+def index_rows(profile):
+    """Unsaved ProfileReachCell rows for a profile (none if it has no location)."""
+    if profile.latitude is None or profile.longitude is None:
+        return []
+    return [
+        ProfileReachCell(profile_id=profile.pk, row=row, col=col)
+        for row, col in reach_cells(profile.latitude, profile.longitude, profile.max_distance_miles)
+    ]
+
+
+def reindex(profile):
+    """Replace a profile's cells after its location or radius changed (or was revoked)."""
+    with transaction.atomic():
+        ProfileReachCell.objects.filter(profile_id=profile.pk).delete()
+        ProfileReachCell.objects.bulk_create(index_rows(profile))
+
+
+def reindex_all(batch_size=1000):
+    """Rebuild the whole index one batch of profiles per transaction; returns (profiles, cells)."""
+    profiles = UserProfile.objects.only('id', 'latitude', 'longitude', 'max_distance_miles').order_by('id')
+    total_profiles = total_cells = 0
+    last = None
+    while True:
+        batch = list((profiles.filter(id__gt=last) if last else profiles)[:batch_size])
+        if not batch:
+            return total_profiles, total_cells
+        rows = [row for profile in batch for row in index_rows(profile)]
+        with transaction.atomic():
+            ProfileReachCell.objects.filter(profile_id__in=[profile.pk for profile in batch]).delete()
+            ProfileReachCell.objects.bulk_create(rows)
+        total_profiles += len(batch)
+        total_cells += len(rows)
+        last = batch[-1].pk
+
+
+def profiles_reaching(lat, lng, queryset=None):
+    """Profiles whose reach covers the cell of (lat, lng); a superset, refine with can_reach()."""
+    row, col = cell_of(lat, lng)
+    queryset = UserProfile.objects.all() if queryset is None else queryset
+    return queryset.filter(reach_cells__row=row, reach_cells__col=col)
+
+
+def can_reach(profile, lat, lng):
+    """Exact check: (lat, lng) lies within the profile's own max_distance_miles."""
+    return haversine_distance(profile.latitude, profile.longitude, lat, lng) <= profile.max_distance_miles
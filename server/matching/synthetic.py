@@ -0,0 +1,350 @@
+"""
+Deterministic synthetic data for benchmarks, load tests and seed_scale.
+
+Everything is drawn from one seeded random.Random: users and jobs are
+spread normally around weighted metro centres, job content comes from the
+seed_jobs templates, and swipes produce the downstream interests,
+acceptances, completions, conversations and messages.
+
+Rows are written through a BulkWriter (bulk_create in batches) or, on
+Postgres, a CopyWriter (COPY FROM STDIN). Only ids and a few small
+attributes are kept between batches, so millions of rows fit in memory.
+bulk_create and COPY bypass Job.save and UserProfile.save, so the tag
+masks are computed here, and so are the profiles' reach cells (which
+update_location would otherwise maintain).
+"""
+import csv
+import io
+import json
+import random
+from collections import Counter, defaultdict, namedtuple
+from datetime import datetime, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection, models
+from django.utils import timezone
+
+from authentication.models import User
+from chat.models import Conversation, Message
+from . import spatial, tags
+from .management.commands.seed_jobs import BASE_LAT, BASE_LNG, SAMPLE_JOBS
+from .models import Job, JobAcceptance, JobCompletion, MatchingInterest, UserProfile
+
+BATCH_SIZE = 2000
+PASSWORD = 'bench1234'
+MILES_PER_DEGREE = 69.0
+
+Metro = namedtuple('Metro', 'name latitude longitude label weight')
+
+METROS = {
+    'east-lansing': Metro('east-lansing', BASE_LAT, BASE_LNG, 'East Lansing, MI', 1),
+    'lansing': Metro('lansing', 42.7325, -84.5555, 'Lansing, MI', 1),
+    'detroit': Metro('detroit', 42.3314, -83.0458, 'Detroit, MI', 1),
+    'ann-arbor': Metro('ann-arbor', 42.2808, -83.7430, 'Ann Arbor, MI', 1),
+    'grand-rapids': Metro('grand-rapids', 42.9634, -85.6681, 'Grand Rapids, MI', 1),
+    'chicago': Metro('chicago', 41.8781, -87.6298, 'Chicago, IL', 1),
+}
+
+# (weight, value) tables
+JOB_STATUSES = [(85, 'open'), (10, 'filled'), (5, 'cancelled')]
+ACCEPTANCE_STATUSES = [(50, 'pending'), (25, 'confirmed'), (20, 'completed'), (5, 'dropped')]
+
+CHAT_LINES = [
+    'Hi! Thanks for confirming me.',
+    'Where should I meet you?',
+    'See you tomorrow at the front entrance.',
+    'Running about 5 minutes late, sorry!',
+    'Thanks again for helping out.',
+    'Do I need to bring anything?',
+]
+
+# What later phases need to know about a job
+JobInfo = namedtuple('JobInfo', 'id poster_id metro skill_tags requirements')
+
+
+def parse_metro(spec):
+    """Parse 'name', 'name:weight', 'lat,lng' or 'lat,lng:weight' into a Metro."""
+    spec, _, weight = spec.partition(':')
+    weight = float(weight) if weight else 1
+    if spec in METROS:
+        return METROS[spec]._replace(weight=weight)
+    try:
+        lat, lng = (float(part) for part in spec.split(','))
+    except ValueError:
+        raise ValueError(f'Unknown metro {spec!r}; use one of {", ".join(METROS)} or "lat,lng"')
+    return Metro(spec, lat, lng, 'Nearby', weight)
+
+
+def _weighted(table):
+    return [value for weight, value in table for _ in range(weight)]
+
+
+class BulkWriter:
+    """
+    Buffers model instances and inserts them with bulk_create.
+
+    All buffers are flushed together, in the order their models were first
+    added, so parents (conversations) are always written before children
+    (messages) and foreign keys hold without a transaction.
+    """
+
+    def __init__(self, batch_size=BATCH_SIZE):
+        self.batch_size = batch_size
+        self.counts = Counter()
+        self._buffers = {}
+
+    def add(self, obj):
+        buffer = self._buffers.setdefault(type(obj), [])
+        buffer.append(obj)
+        if len(buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        for model, buffer in self._buffers.items():
+            if buffer:
+                self._insert(model, buffer)
+                self.counts[model._meta.label] += len(buffer)
+                buffer.clear()
+
+    def _insert(self, model, objs):
+        model.objects.bulk_create(objs)
+        if model is User and objs[0].pk is None:  # Backend cannot return ids from bulk inserts
+            ids = dict(model.objects.filter(username__in=[o.username for o in objs])
+                       .values_list('username', 'pk'))
+            for obj in objs:
+                obj.pk = ids[obj.username]
+
+
+class CopyWriter(BulkWriter):
+    """BulkWriter that loads each batch with Postgres COPY ... FROM STDIN (CSV)."""
+
+    NULL = r'\N'
+
+    def __init__(self, batch_size=BATCH_SIZE):
+        if connection.vendor != 'postgresql':
+            raise ValueError('COPY is only available on PostgreSQL')
+        super().__init__(batch_size)
+
+    def _value(self, field, obj):
+        value = field.pre_save(obj, add=True)
+        if value is None:
+            return self.NULL
+        if isinstance(field, models.JSONField):
+            return json.dumps(value)
+        if isinstance(value, bool):
+            return 't' if value else 'f'
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return str(value)
+
+    def _insert(self, model, objs):
+        opts = model._meta
+        qn = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            if isinstance(opts.pk, models.AutoField) and objs[0].pk is None:
+                # Reserve ids from the sequence so callers get pks, as with bulk_create
+                cursor.execute(
+                    'SELECT nextval(pg_get_serial_sequence(%s, %s)) FROM generate_series(1, %s)',
+                    [opts.db_table, opts.pk.column, len(objs)],
+                )
+                for obj, (pk,) in zip(objs, cursor.fetchall()):
+                    obj.pk = pk
+
+            fields = opts.concrete_fields
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for obj in objs:
+                writer.writerow([self._value(field, obj) for field in fields])
+            buffer.seek(0)
+
+            columns = ', '.join(qn(field.column) for field in fields)
+            sql = f"COPY {qn(opts.db_table)} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{self.NULL}')"
+            raw = cursor.cursor
+            if hasattr(raw, 'copy_expert'):  # psycopg2
+                raw.copy_expert(sql, buffer)
+            else:  # psycopg 3
+                with raw.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
+
+
+class Generator:
+    """
+    Builds a consistent dataset phase by phase.
+
+    Call create_users, create_jobs, then create_activity; each phase only
+    needs the ids (and metros) recorded by the previous ones.
+    """
+
+    def __init__(self, writer=None, seed=42, metros=None, spread_miles=10, prefix=''):
+        self.writer = writer or BulkWriter()
+        self.rng = random.Random(seed)
+        self.metros = list(metros or [METROS['east-lansing']])
+        self.spread = spread_miles / MILES_PER_DEGREE
+        self.prefix = prefix
+        self.now = timezone.now()
+        self.password = make_password(PASSWORD)
+        self.volunteers = []  # [(user_id, metro_index)]
+        self.posters = []
+        self.jobs = []  # [JobInfo]
+        self.jobs_by_metro = defaultdict(list)
+        self._read_conversations = []
+
+    def _metro(self):
+        return self.rng.choices(range(len(self.metros)), weights=[m.weight for m in self.metros])[0]
+
+    def _point(self, metro_index):
+        """Normally distributed point; ~68% within spread_miles of the metro centre."""
+        metro = self.metros[metro_index]
+        return (round(metro.latitude + self.rng.gauss(0, self.spread), 6),
+                round(metro.longitude + self.rng.gauss(0, self.spread), 6))
+
+    def create_users(self, count, role='volunteer', located=0.9):
+        """Users <prefix><role><n>@example.com (password PASSWORD), each with a profile."""
+        rng = self.rng
+        created = self.volunteers if role == 'volunteer' else self.posters
+        start = len(created)
+        for offset in range(0, count, self.writer.batch_size):
+            batch = []
+            for i in range(start + offset, start + min(count, offset + self.writer.batch_size)):
+                username = f'{self.prefix}{role}{i}'
+                user = User(email=f'{username}@example.com', username=username, password=self.password,
+                            date_joined=self.now - timedelta(days=rng.randint(0, 400)))
+                batch.append((user, self._metro()))
+                self.writer.add(user)
+            self.writer.flush()
+
+            for user, metro_index in batch:
+                skill_tags = rng.sample(tags.SKILL_TAGS, rng.randint(0, 4))
+                limitations = rng.sample(tags.ACCESSIBILITY_TAGS, 1) if rng.random() < 0.15 else []
+                has_location = rng.random() < located
+                lat, lng = self._point(metro_index) if has_location else (None, None)
+                profile = UserProfile(
+                    user_id=user.pk,
+                    latitude=lat,
+                    longitude=lng,
+                    location_label=self.metros[metro_index].label if has_location else '',
+                    max_distance_miles=rng.choice([5, 10, 25, 25, 25, 50]),
+                    skill_tags=skill_tags,
+                    limitations=limitations,
+                    skill_mask=tags.skill_mask(skill_tags),
+                    limitation_mask=tags.accessibility_mask(limitations),
+                )
+                self.writer.add(profile)
+                for row in spatial.index_rows(profile):
+                    self.writer.add(row)
+                created.append((user.pk, metro_index))
+        self.writer.flush()
+
+    def create_jobs(self, count):
+        """Jobs from the seed_jobs templates in their poster's metro, shifts over the next ten days."""
+        if not self.posters:
+            raise ValueError('create_users(role="poster") must run before create_jobs')
+        rng = self.rng
+        statuses = _weighted(JOB_STATUSES)
+        for i in range(len(self.jobs), len(self.jobs) + count):
+            template = SAMPLE_JOBS[i % len(SAMPLE_JOBS)]
+            skill_tags = list(template['skill_tags'])
+            if rng.random() < 0.3:
+                extra = rng.choice(tags.SKILL_TAGS)
+                if extra not in skill_tags:
+                    skill_tags.append(extra)
+            requirements = list(template['accessibility_requirements'])
+            poster_id, metro_index = rng.choice(self.posters)
+            lat, lng = self._point(metro_index)
+            shift_start = self.now + timedelta(minutes=rng.randint(60, 10 * 24 * 60))
+            job = Job(
+                title=f"{template['title']} #{i}",
+                description=template['description'],
+                short_description=template['short_description'],
+                poster_id=poster_id,
+                latitude=lat,
+                longitude=lng,
+                location_label=self.metros[metro_index].label,
+                shift_start=shift_start,
+                shift_end=shift_start + timedelta(hours=rng.randint(1, 6)),
+                skill_tags=skill_tags,
+                accessibility_requirements=requirements,
+                status=rng.choice(statuses),
+                skill_mask=tags.skill_mask(skill_tags),
+                accessibility_mask=tags.accessibility_mask(requirements),
+            )
+            self.writer.add(job)
+            self.jobs_by_metro[metro_index].append(len(self.jobs))
+            self.jobs.append(JobInfo(job.id, poster_id, metro_index, skill_tags, requirements))
+        self.writer.flush()
+
+    def create_activity(self, swipes_per_user=10, messages_per_conversation=4, interested=0.35):
+        """
+        Swipes on jobs in each volunteer's metro, and what follows from them.
+
+        Each volunteer swipes 0..2*swipes_per_user jobs. Right swipes get a
+        JobAcceptance (pending/confirmed/completed/dropped); completed and
+        dropped ones a JobCompletion; confirmed and completed ones a
+        Conversation with 1..2*messages_per_conversation messages, 70% of
+        them read by both sides.
+        """
+        rng = self.rng
+        statuses = _weighted(ACCEPTANCE_STATUSES)
+        for user_id, metro_index in self.volunteers:
+            candidates = self.jobs_by_metro.get(metro_index)
+            if not candidates:
+                continue
+            swipes = min(len(candidates), rng.randint(0, 2 * swipes_per_user))
+            for job_index in rng.sample(candidates, swipes):
+                job = self.jobs[job_index]
+                right = rng.random() < interested
+                self.writer.add(MatchingInterest(user_id=user_id, job_id=job.id, interested=right))
+                if not right:
+                    continue
+
+                status = rng.choice(statuses)
+                self.writer.add(JobAcceptance(user_id=user_id, job_id=job.id, status=status))
+                if status in ('completed', 'dropped'):
+                    self.writer.add(JobCompletion(
+                        user_id=user_id,
+                        job_id=job.id,
+                        completed=status == 'completed',
+                        was_urgent=rng.random() < 0.25,
+                        had_accessibility=bool(job.requirements),
+                        skill_tags_snapshot=job.skill_tags,
+                    ))
+                if status in ('confirmed', 'completed'):
+                    self._conversation(user_id, job, messages_per_conversation)
+        self.writer.flush()
+        self._mark_read()
+
+    def _conversation(self, volunteer_id, job, messages_per_conversation):
+        rng = self.rng
+        conversation = Conversation(job_id=job.id, volunteer_id=volunteer_id, poster_id=job.poster_id)
+        self.writer.add(conversation)
+        if rng.random() < 0.7:
+            self._read_conversations.append(conversation.id)
+        senders = (volunteer_id, job.poster_id)
+        for n in range(rng.randint(1, 2 * messages_per_conversation)):
+            self.writer.add(Message(
+                conversation_id=conversation.id,
+                sender_id=senders[n % 2],
+                content=rng.choice(CHAT_LINES),
+            ))
+
+    def _mark_read(self):
+        """Bulk inserts stamp created_at at insert time, so mark conversations read afterwards."""
+        ids, self._read_conversations = self._read_conversations, []
+        now = timezone.now()
+        for start in range(0, len(ids), self.writer.batch_size):
+            Conversation.objects.filter(id__in=ids[start:start + self.writer.batch_size]).update(
+                volunteer_last_read=now, poster_last_read=now,
+            )
+
+
+def generate(jobs, users, seed=42, posters=None, swipes_per_user=10, metros=None, writer=None):
+    """
+    Create `users` volunteers, posters (default one per 20 jobs) and `jobs` jobs,
+    plus swipes and everything downstream. Returns the Generator.
+    """
+    generator = Generator(writer=writer, seed=seed, metros=metros)
+    generator.create_users(posters or max(1, jobs // 20), role='poster')
+    generator.create_users(users)
+    generator.create_jobs(jobs)
+    generator.create_activity(swipes_per_user=swipes_per_user)
+    return generator
@@ -0,0 +1,52 @@
+"""
+Canonical tag registry and bitmask encoding.
+
+Skill tags and accessibility flags are stored as JSON lists of strings,
+but each model also keeps a denormalised integer mask (see Job.save and
+UserProfile.save) so scoring can use AND/popcount instead of building
+sets for every user-job pair.
+
+Bit positions are persisted: only ever append to these lists. Tags that
+are not in the vocabulary set UNMAPPED_BIT, which tells callers to fall
+back to comparing the string lists.
+"""
+
+# Bit position == list index. Append only.
+SKILL_TAGS = [
+    'Teaching', 'Programming', 'First Aid', 'Physical Labor', 'Driving', 'Cooking',
+    'Cleaning', 'Gardening', 'Photography', 'Graphic Design', 'Event Planning',
+    'Animal Care', 'Mechanical', 'Communication', 'Organization', 'Healthcare',
+    'Web Development', 'Marketing', 'Editing', 'Errands', 'Tutoring', 'Music', 'Childcare',
+    'Teamwork', 'Math', 'Moving', 'Heavy Lifting', 'Tech Help', 'Pet Care',
+]
+
+ACCESSIBILITY_TAGS = ['heavy_lifting', 'standing_long', 'driving_required', 'outdoor_work']
+
+# Highest bit that still fits a signed 64-bit BigIntegerField
+UNMAPPED_BIT = 1 << 62
+
+_SKILL_BITS = {tag.lower(): 1 << i for i, tag in enumerate(SKILL_TAGS)}
+_ACCESSIBILITY_BITS = {tag: 1 << i for i, tag in enumerate(ACCESSIBILITY_TAGS)}
+
+assert len(SKILL_TAGS) < 62 and len(ACCESSIBILITY_TAGS) < 62
+
+
+def skill_mask(tags) -> int:
+    """Encode skill tags case-insensitively, as scoring compares them."""
+    mask = 0
+    for tag in tags or []:
+        mask |= _SKILL_BITS.get(str(tag).lower(), UNMAPPED_BIT)
+    return mask
+
+
+def accessibility_mask(tags) -> int:
+    """Encode accessibility requirements or limitations (exact keys)."""
+    mask = 0
+    for tag in tags or []:
+        mask |= _ACCESSIBILITY_BITS.get(tag, UNMAPPED_BIT)
+    return mask
+
+
+def is_exact(*masks) -> bool:
+    """True when none of the masks contain tags outside the vocabulary."""
+    return not any(mask & UNMAPPED_BIT for mask in masks)
@@ -0,0 +1,105 @@
+import io
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from chat.models import Conversation, Message
+from matching.archive import archive_jobs
+from matching.badges import compute_badges, record_completion
+from matching.models import (
+    ArchivedJob, ArchivedJobAcceptance, ArchivedMatchingInterest, Job, JobAcceptance, JobCompletion,
+    MatchingInterest,
+)
+
+
+class ArchiveTests(TestCase):
+    def setUp(self):
+        self.poster = User.objects.create_user(
+            email='poster@example.com', username='poster', password='StrongPass123!'
+        )
+        self.volunteer = User.objects.create_user(
+            email='vol@example.com', username='vol', password='StrongPass123!'
+        )
+        self.done = self._job('Done', status='filled', skill_tags=['Teaching'])
+        MatchingInterest.objects.create(user=self.volunteer, job=self.done, interested=True)
+        JobAcceptance.objects.create(user=self.volunteer, job=self.done, status='completed')
+        record_completion(self.volunteer, self.done)
+
+        self.chatted = self._job('Chatted', status='filled')
+        self.conversation = Conversation.objects.create(job=self.chatted, volunteer=self.volunteer, poster=self.poster)
+        Message.objects.create(conversation=self.conversation, sender=self.poster, content='Thanks!')
+        self.completed = self._job('Completed', status='completed')
+        self.open = self._job('Open')
+        self.recent = self._job('Recent', status='cancelled')
+
+        old = timezone.now() - timezone.timedelta(days=120)
+        Job.objects.exclude(pk=self.recent.pk).update(updated_at=old)
+
+    def _job(self, title, status='open', **fields):
+        return Job.objects.create(
+            title=title, description='Desc', short_description='Short', poster=self.poster,
+            shift_start=timezone.now() + timezone.timedelta(hours=1),
+            shift_end=timezone.now() + timezone.timedelta(hours=3), status=status, **fields,
+        )
+
+    def test_moves_closed_jobs_with_their_rows(self):
+        badges_before = compute_badges(self.volunteer, persist=False)
+        expected = {'job': 3, 'matchinginterest': 1, 'jobacceptance': 1, 'conversation': 1}
+        self.assertEqual(archive_jobs(dry_run=True), expected)
+
+        counts = archive_jobs(batch_size=1)
+        self.assertEqual(counts, expected)
+        self.assertEqual(ArchivedJob.objects.get(pk=self.completed.pk).status, 'completed')
+        self.assertFalse(Job.objects.filter(pk=self.done.pk).exists())
+        self.assertEqual(set(Job.objects.values_list('title', flat=True)), {'Open', 'Recent'})
+
+        archived = ArchivedJob.objects.get(pk=self.done.pk)
+        self.assertEqual((archived.title, archived.status, archived.skill_tags), ('Done', 'filled', ['Teaching']))
+        self.assertEqual(archived.created_at, self.done.created_at)
+        self.assertTrue(ArchivedMatchingInterest.objects.filter(job=archived, user=self.volunteer).exists())
+        self.assertTrue(ArchivedJobAcceptance.objects.filter(job=archived, status='completed').exists())
+
+        # Completions stay put, so badges do not change
+        self.assertTrue(JobCompletion.objects.filter(job_id=self.done.pk).exists())
+        self.assertEqual(compute_badges(self.volunteer, persist=False), badges_before)
+        completion = JobCompletion.objects.get(job_id=self.done.pk)
+        self.assertEqual(str(completion), 'vol@example.com completed Done')
+        self.assertEqual(archive_jobs(), {'job': 0, 'matchinginterest': 0, 'jobacceptance': 0, 'conversation': 0})
+
+    def test_history_reads_include_archive(self):
+        client = APIClient()
+        client.force_authenticate(user=self.poster)
+        before = {job['id'] for job in client.get('/api/matching/jobs/my-posted').data}
+        client.force_authenticate(user=self.volunteer)
+        accepted_before = client.get('/api/matching/jobs/accepted').data
+        interested_before = client.get('/api/matching/jobs/interested').data
+
+        call_command('archive_jobs', stdout=io.StringIO())
+
+        client.force_authenticate(user=self.poster)
+        self.assertEqual({job['id'] for job in client.get('/api/matching/jobs/my-posted').data}, before)
+        client.force_authenticate(user=self.volunteer)
+        accepted = client.get('/api/matching/jobs/accepted').data
+        self.assertEqual(accepted, accepted_before)
+        self.assertEqual(client.get('/api/matching/jobs/interested').data, interested_before)
+
+    def test_conversations_follow_the_archived_job(self):
+        client = APIClient()
+        client.force_authenticate(user=self.volunteer)
+        url = f'/api/chat/job/{self.chatted.pk}/conversation'
+        before = client.get(url).data
+
+        archive_jobs()
+        conversation = Conversation.objects.get(pk=self.conversation.pk)
+        self.assertIsNone(conversation.job_id)
+        self.assertEqual(conversation.archived_job_id, self.chatted.pk)
+        self.assertIn('Chatted', str(conversation))
+
+        self.assertEqual(client.get(url).data, before)
+        listed = client.get('/api/chat/conversations').data
+        self.assertEqual([c['job']['title'] for c in listed], ['Chatted'])
+        messages = client.get(f'/api/chat/conversations/{conversation.pk}/messages').data['messages']
+        self.assertEqual([m['content'] for m in messages], ['Thanks!'])
@@ -0,0 +1,95 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from matching.models import Job, JobAcceptance, MatchingInterest, UserProfile
+
+
+class JobCandidatesTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.poster = User.objects.create_user(
+            email='poster@example.com', username='poster', password='StrongPass123!'
+        )
+        self.job = Job.objects.create(
+            title='Tutor', description='Desc', short_description='Short', poster=self.poster,
+            latitude=42.73, longitude=-84.55, skill_tags=['Teaching', 'Mentoring'],
+            shift_start=timezone.now() + timezone.timedelta(days=2),
+            shift_end=timezone.now() + timezone.timedelta(days=2, hours=2),
+        )
+        # (skills, latitude, completed, dropped)
+        self.volunteers = {}
+        for name, skills, lat, completed, dropped in [
+            ('near_skilled', ['Teaching', 'Mentoring'], 42.73, 5, 0),
+            ('near_unskilled', [], 42.74, 0, 3),
+            ('far', ['Teaching'], 44.0, 2, 0),
+        ]:
+            user = User.objects.create_user(email=f'{name}@example.com', username=name, password='StrongPass123!')
+            UserProfile.objects.create(user=user, latitude=lat, longitude=-84.55, skill_tags=skills,
+                                       jobs_completed=completed, jobs_dropped=dropped)
+            MatchingInterest.objects.create(user=user, job=self.job, interested=True)
+            self.volunteers[name] = user
+        passed = User.objects.create_user(email='pass@example.com', username='pass', password='StrongPass123!')
+        MatchingInterest.objects.create(user=passed, job=self.job, interested=False)
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.poster)
+        self.url = f'/api/matching/jobs/{self.job.id}/candidates'
+
+    def test_ranked_and_paginated(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 3)
+        results = response.data['results']
+        self.assertEqual([r['username'] for r in results], ['near_skilled', 'near_unskilled', 'far'])
+        self.assertGreater(results[0]['score'], results[1]['score'])
+        self.assertEqual(results[2]['score'], 0)  # Outside their own radius
+        self.assertEqual(results[0]['jobs_completed'], 5)
+        self.assertIsNotNone(results[0]['distance_display'])
+
+        page = self.client.get(self.url, {'limit': 2, 'offset': 1}).data
+        self.assertEqual([r['username'] for r in page['results']], ['near_unskilled', 'far'])
+        self.assertIsNone(page['next_offset'])
+        self.assertEqual(self.client.get(self.url, {'limit': 'x'}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_cached_until_new_interest(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(2):  # Job lookup and the interests' version
+            self.client.get(self.url)
+
+        newcomer = User.objects.create_user(email='new@example.com', username='new', password='StrongPass123!')
+        MatchingInterest.objects.create(user=newcomer, job=self.job, interested=True)
+        with self.assertNumQueries(3):  # Job, version, then interests + users + profiles in one query
+            response = self.client.get(self.url)
+        self.assertEqual(response.data['count'], 4)
+        self.assertIsNone(next(r for r in response.data['results'] if r['username'] == 'new')['distance_display'])
+
+    def test_version_sees_writes_that_skip_signals(self):
+        self.client.get(self.url)
+        # As from another process or a bulk update(): no local cache eviction happens
+        MatchingInterest.objects.filter(user=self.volunteers['far']).update(
+            interested=False, updated_at=timezone.now(),
+        )
+        self.assertEqual(self.client.get(self.url).data['count'], 2)
+        MatchingInterest.objects.filter(user=self.volunteers['near_unskilled']).delete()
+        self.assertEqual(self.client.get(self.url).data['count'], 1)
+
+    def test_only_poster(self):
+        self.client.force_authenticate(user=self.volunteers['far'])
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_retracted_volunteer_leaves_cached_ranking(self):
+        self.assertEqual(self.client.get(self.url).data['count'], 3)
+        volunteer = self.volunteers['near_skilled']
+        JobAcceptance.objects.create(user=volunteer, job=self.job, status='pending')
+
+        volunteer_client = APIClient()
+        volunteer_client.force_authenticate(user=volunteer)
+        response = volunteer_client.post(f'/api/matching/jobs/{self.job.id}/retract')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        results = self.client.get(self.url).data['results']
+        self.assertNotIn('near_skilled', [r['username'] for r in results])
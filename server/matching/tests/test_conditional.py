@@ -0,0 +1,79 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from matching.models import Job, JobCompletion, UserProfile
+
+
+class ConditionalRequestTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='poster@example.com', username='poster', password='StrongPass123!'
+        )
+        UserProfile.objects.create(user=self.user, latitude=42.73, longitude=-84.48)
+        self.client.force_authenticate(user=self.user)
+        self.job = Job.objects.create(
+            title='Food bank', description='Sort donations', short_description='Sort',
+            poster=self.user, latitude=42.73, longitude=-84.48,
+            shift_start=timezone.now() + timedelta(days=3),
+            shift_end=timezone.now() + timedelta(days=3, hours=2),
+        )
+
+    def _revalidate(self, url):
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertIn('ETag', first)
+        self.assertIn('private', first['Cache-Control'])
+        return first['ETag'], self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+
+    def test_unchanged_resources_return_304(self):
+        for url in ['/api/matching/profile', f'/api/matching/users/{self.user.id}/badges',
+                    '/api/matching/jobs/my-posted']:
+            with self.subTest(url=url):
+                _, response = self._revalidate(url)
+                self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+                self.assertEqual(response.content, b'')
+
+    def test_304_skips_badge_computation(self):
+        etag, _ = self._revalidate('/api/matching/profile')
+        with mock.patch('matching.views.compute_badges') as compute:
+            response = self.client.get('/api/matching/profile', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        compute.assert_not_called()
+
+    def test_profile_update_changes_etag(self):
+        etag, _ = self._revalidate('/api/matching/profile')
+        self.client.patch('/api/matching/profile', {'max_distance_miles': 40}, format='json')
+        response = self.client.get('/api/matching/profile', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['profile']['max_distance_miles'], 40)
+
+    def test_completion_changes_badges_etag(self):
+        url = f'/api/matching/users/{self.user.id}/badges'
+        etag, _ = self._revalidate(url)
+        JobCompletion.objects.create(user=self.user, job=self.job, completed=True, skill_tags_snapshot=['Cooking'])
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_job_edits_and_urgency_change_posted_etag(self):
+        url = '/api/matching/jobs/my-posted'
+        etag, _ = self._revalidate(url)
+        self.client.patch(f'/api/matching/jobs/{self.job.id}/update', {'title': 'Pantry'}, format='json')
+        new_etag, response = self._revalidate(url)
+        self.assertNotEqual(new_etag, etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # Shift now within 24 hours without any row being written
+        with mock.patch('matching.views.timezone.now', return_value=timezone.now() + timedelta(days=2, hours=12)):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=new_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_missing_user_badges_still_404(self):
+        response = self.client.get('/api/matching/users/999999/badges', HTTP_IF_NONE_MATCH='"x"')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,125 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from matching import coverage
+from matching.models import CoverageCell, Job, UserProfile
+
+LANSING = (42.73, -84.55)
+DETROIT = (42.33, -83.05)
+NORTH_LANSING = (42.85, -84.55)  # Next 0.1 degree cell north of LANSING, same 0.5 degree cell
+
+
+@override_settings(COVERAGE_MIN_VOLUNTEERS=2)
+class CoverageTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        now = timezone.now()
+        self.poster = User.objects.create_user(email='poster@example.com', username='poster', password='StrongPass123!')
+        # (point, status, shift start offset in days)
+        for point, job_status, days in [
+            (LANSING, 'open', 1),
+            (LANSING, 'open', 2),
+            (LANSING, 'filled', -3),
+            (LANSING, 'completed', -4),
+            (LANSING, 'expired', -5),
+            (LANSING, 'expired', -60),  # Outside COVERAGE_WINDOW_DAYS
+            (LANSING, 'template', 1),
+            (DETROIT, 'open', 1),
+        ]:
+            start = now + timezone.timedelta(days=days)
+            Job.objects.create(
+                title='Job', description='Desc', short_description='Short', poster=self.poster,
+                latitude=point[0], longitude=point[1], status=job_status,
+                shift_start=start, shift_end=start + timezone.timedelta(hours=2),
+            )
+        for i, point in enumerate([LANSING, LANSING, DETROIT, NORTH_LANSING]):
+            user = User.objects.create_user(email=f'v{i}@example.com', username=f'v{i}', password='StrongPass123!')
+            UserProfile.objects.create(user=user, latitude=point[0], longitude=point[1])
+        coverage.rebuild()
+
+        self.staff = User.objects.create_user(
+            email='staff@example.com', username='staff', password='StrongPass123!', is_staff=True,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.staff)
+
+    def _cell(self, data, point):
+        degrees = data['cell_degrees']
+        return next(
+            cell for cell in data['cells']
+            if cell['south'] <= point[0] < cell['south'] + degrees and cell['west'] <= point[1] < cell['west'] + degrees
+        )
+
+    def test_finest_zoom(self):
+        response = self.client.get('/api/matching/coverage', {'zoom': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['cells']), 3)
+        lansing = self._cell(response.data, LANSING)
+        self.assertEqual(lansing['open_jobs'], 2)
+        self.assertEqual(lansing['fill_rate'], 0.667)
+        self.assertEqual(lansing['active_volunteers'], 2)
+        detroit = self._cell(response.data, DETROIT)
+        self.assertIsNone(detroit['fill_rate'])
+        self.assertIsNone(detroit['active_volunteers'])  # Below COVERAGE_MIN_VOLUNTEERS
+        self.assertNotIn('latitude', detroit)
+
+    def test_coarse_zoom_sums_cells(self):
+        data = self.client.get('/api/matching/coverage').data
+        self.assertEqual(data['zoom'], 0)
+        self.assertEqual(len(data['cells']), 2)  # Lansing and Detroit are in different degree columns
+        self.assertEqual(sum(cell['open_jobs'] for cell in data['cells']), 3)
+        self.assertEqual(
+            CoverageCell.objects.filter(zoom=0).values_list('active_volunteers', flat=True).order_by('col')[0], 2,
+        )
+
+    def test_cached_until_rebuild(self):
+        self.client.get('/api/matching/coverage', {'zoom': 2})
+        with self.assertNumQueries(1):  # Rollup version only
+            self.client.get('/api/matching/coverage', {'zoom': 2})
+
+        Job.objects.filter(status='open').update(status='filled')
+        out = StringIO()
+        call_command('build_coverage', stdout=out)
+        self.assertIn('Coverage rebuilt', out.getvalue())
+        data = self.client.get('/api/matching/coverage', {'zoom': 2}).data
+        self.assertEqual(self._cell(data, LANSING)['open_jobs'], 0)
+
+    def test_rebuild_in_another_process_is_picked_up(self):
+        self.client.get('/api/matching/coverage', {'zoom': 2})
+        # A cron process's rebuild can't touch this process's cache
+        with mock.patch.object(cache, 'delete_many'), mock.patch.object(cache, 'delete'), \
+                mock.patch.object(cache, 'clear'):
+            Job.objects.filter(status='open').update(status='filled')
+            coverage.rebuild()
+        data = self.client.get('/api/matching/coverage', {'zoom': 2}).data
+        self.assertEqual(self._cell(data, LANSING)['open_jobs'], 0)
+
+    def test_withheld_counts_not_recoverable_from_coarser_zoom(self):
+        fine = self.client.get('/api/matching/coverage', {'zoom': 2}).data
+        coarse = self.client.get('/api/matching/coverage', {'zoom': 1}).data
+        self.assertIsNone(self._cell(fine, NORTH_LANSING)['active_volunteers'])
+        for parent in coarse['cells']:
+            children = [
+                cell['active_volunteers'] or 0 for cell in fine['cells']
+                if parent['south'] <= cell['south'] < parent['south'] + coarse['cell_degrees']
+                and parent['west'] <= cell['west'] < parent['west'] + coarse['cell_degrees']
+            ]
+            # Each parent is exactly the sum of its visible children
+            self.assertEqual(parent['active_volunteers'] or 0, sum(children))
+        self.assertEqual(self._cell(coarse, LANSING)['active_volunteers'], 2)
+
+    def test_staff_only_and_zoom_validation(self):
+        self.assertEqual(self.client.get('/api/matching/coverage', {'zoom': 9}).status_code,
+                         status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get('/api/matching/coverage', {'zoom': 'x'}).status_code,
+                         status.HTTP_400_BAD_REQUEST)
+        self.client.force_authenticate(user=self.poster)
+        self.assertEqual(self.client.get('/api/matching/coverage').status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,106 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from authentication.models import User
+from matching.models import Job, UserProfile
+from matching.scoring import calculate_score
+from matching.serializers import JobMatchSerializer
+from matching.views import _exclude_accessibility_conflicts
+
+
+class MatchedJobsFeedTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.poster = User.objects.create_user(
+            email='poster@example.com', username='poster', password='StrongPass123!'
+        )
+        self.user = User.objects.create_user(
+            email='vol@example.com', username='volunteer', password='StrongPass123!'
+        )
+        self.profile = UserProfile.objects.create(
+            user=self.user, latitude=42.73, longitude=-84.55,
+            skill_tags=['Teaching'], limitations=['heavy_lifting'],
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def _make_job(self, **kwargs):
+        defaults = {
+            'title': 'Test',
+            'description': 'Desc',
+            'short_description': 'Short',
+            'poster': self.poster,
+            'latitude': 42.73,
+            'longitude': -84.55,
+            'shift_start': timezone.now() + timezone.timedelta(hours=30),
+            'shift_end': timezone.now() + timezone.timedelta(hours=32),
+        }
+        defaults.update(kwargs)
+        return Job.objects.create(**defaults)
+
+    def _feed_ids(self):
+        response = self.client.get('/api/matching/jobs')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {item['id'] for item in response.data}
+
+    def test_conflicting_jobs_excluded_in_sql(self):
+        ok = self._make_job(title='Tutoring', accessibility_requirements=['standing_long'])
+        conflict = self._make_job(title='Moving', accessibility_requirements=['heavy_lifting', 'outdoor_work'])
+
+        self.assertEqual(self._feed_ids(), {str(ok.id)})
+        # The conflicting job never leaves the database
+        prefiltered = _exclude_accessibility_conflicts(Job.objects.all(), self.profile)
+        self.assertEqual(list(prefiltered), [ok])
+        self.assertNotIn(conflict, prefiltered)
+
+    def test_unmapped_limitations_still_filtered(self):
+        self.profile.limitations = ['loud_noise']
+        self.profile.save()
+        ok = self._make_job(title='Quiet')
+        self._make_job(title='Concert', accessibility_requirements=['loud_noise'])
+        self.assertEqual(self._feed_ids(), {str(ok.id)})
+
+    def test_no_limitations_sees_all_jobs(self):
+        self.profile.limitations = []
+        self.profile.save()
+        a = self._make_job(accessibility_requirements=['heavy_lifting'])
+        b = self._make_job()
+        self.assertEqual(self._feed_ids(), {str(a.id), str(b.id)})
+
+    def test_feed_json_matches_model_serializer(self):
+        self.profile.limitations = []
+        self.profile.save()
+        self._make_job(title='Urgent', skill_tags=['Teaching'], location_label='Lansing, MI',
+                       shift_start=timezone.now() + timezone.timedelta(hours=3))
+        self._make_job(title='Later', skill_tags=['Knitting'], latitude=42.8, image='/media/x.png',
+                       accessibility_requirements=['outdoor_work'])
+        self._make_job(title='Exact spot', description='A much longer description. ' * 20)
+
+        response = self.client.get('/api/matching/jobs')
+
+        expected = []
+        for item in response.data:
+            job = Job.objects.select_related('poster').get(id=item['id'])
+            score, distance = calculate_score(self.profile, job)
+            job._distance = distance
+            data = JobMatchSerializer(job).data
+            data['score'] = score
+            data['distance'] = round(distance, 1) if distance else None
+            expected.append(data)
+
+        self.assertEqual(len(expected), 3)
+        self.assertEqual(response.content, JSONRenderer().render(expected))
+
+    def test_feed_skips_description_for_candidates(self):
+        for i in range(5):
+            self._make_job(title=f'Job {i}')
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/matching/jobs?limit=2')
+        self.assertEqual(len(response.data), 2)
+        job_queries = [q['sql'] for q in ctx.captured_queries if 'FROM "matching_job"' in q['sql']]
+        self.assertEqual(len(job_queries), 2)
+        self.assertNotIn('"description"', job_queries[0])
@@ -0,0 +1,70 @@
+"""
+EXPLAIN-based checks that the hot queries keep using their indexes.
+
+Tables are tiny in tests, so on PostgreSQL sequential scans are disabled
+for the transaction to make the planner show which index it would pick.
+"""
+from django.db import connection
+from django.db.models import Q
+from django.test import TestCase
+from django.utils import timezone
+
+from authentication.models import User
+from chat.models import Conversation, Message
+from matching.models import Job
+
+
+class QueryIndexTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com', username='testuser', password='pass123'
+        )
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan, f'{index_name} not used:\n{plan}')
+
+    def assertNoFullScan(self, queryset, table):
+        plan = queryset.explain()
+        self.assertNotIn(f'SCAN {table}\n', plan + '\n')
+        self.assertNotIn(f'Seq Scan on {table}', plan)
+
+    def test_feed_uses_open_location_index(self):
+        queryset = Job.objects.filter(
+            status='open', is_active=True,
+            latitude__gte=42.0, latitude__lte=43.0,
+            longitude__gte=-85.0, longitude__lte=-84.0,
+        )
+        self.assertUsesIndex(queryset, 'job_open_location_idx')
+
+    def test_posted_jobs_use_poster_index(self):
+        queryset = Job.objects.filter(poster=self.user, is_active=True)
+        self.assertUsesIndex(queryset, 'job_poster_active_idx')
+
+    def test_inbox_avoids_full_scan(self):
+        queryset = Conversation.objects.filter(
+            Q(volunteer=self.user) | Q(poster=self.user), is_active=True,
+        )
+        self.assertNoFullScan(queryset, 'chat_conversation')
+
+    def _make_conversation(self):
+        job = Job.objects.create(
+            title='Test', description='Desc', short_description='Short', poster=self.user,
+            shift_start=timezone.now(), shift_end=timezone.now() + timezone.timedelta(hours=2),
+        )
+        return Conversation.objects.create(job=job, volunteer=self.user, poster=self.user)
+
+    def test_unread_count_uses_unread_index(self):
+        conversation = self._make_conversation()
+        queryset = Message.objects.filter(
+            conversation=conversation, sender=self.user, created_at__gt=timezone.now(),
+        )
+        self.assertUsesIndex(queryset, 'msg_unread_idx')
+
+    def test_last_message_uses_conversation_time_index(self):
+        conversation = self._make_conversation()
+        queryset = conversation.messages.order_by('-created_at')[:1]
+        self.assertUsesIndex(queryset, 'msg_conversation_time_idx')
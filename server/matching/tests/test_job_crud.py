@@ -1,4 +1,11 @@
-from django.test import TestCase
+import io
+import os
+import tempfile
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
 from django.utils import timezone
 from rest_framework.test import APIClient
 from rest_framework import status
@@ -112,6 +119,98 @@ class JobUpdateDeleteTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
 
+class JobBulkCreateTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='poster@example.com', username='poster', password='StrongPass123!'
+        )
+        self.client.force_authenticate(user=self.user)
+        patcher = mock.patch('matching.job_import.reverse_geocode', return_value='East Lansing, MI')
+        self.geocode = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _row(self, n, **overrides):
+        start = timezone.now() + timezone.timedelta(days=n + 1)
+        row = {
+            'title': f'Shift {n}',
+            'description': 'Sorting donations.',
+            'short_description': 'Sort donations',
+            'skill_tags': ['Organization'],
+            'accessibility_flags': {'standing_long': True},
+            'latitude': 42.7301 + n * 0.0001,
+            'longitude': -84.5501,
+            'shift_start': start.isoformat(),
+            'shift_end': (start + timezone.timedelta(hours=3)).isoformat(),
+        }
+        row.update(overrides)
+        return row
+
+    def test_bulk_create_geocodes_each_cell_once(self):
+        rows = [self._row(n) for n in range(20)] + [self._row(20, latitude=43.0, longitude=-85.0)]
+        response = self.client.post('/api/matching/jobs/bulk-create', rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['created'], 21)
+        self.assertEqual([job['row'] for job in response.data['jobs']], list(range(21)))
+        self.assertEqual(self.geocode.call_count, 2)
+
+        job = Job.objects.get(id=response.data['jobs'][0]['id'])
+        self.assertEqual(job.poster, self.user)
+        self.assertEqual(job.location_label, 'East Lansing, MI')
+        self.assertEqual(job.accessibility_requirements, ['standing_long'])
+        self.assertNotEqual(job.skill_mask, 0)
+        self.assertNotEqual(job.accessibility_mask, 0)
+
+    def test_invalid_row_rejects_batch(self):
+        rows = [self._row(0), self._row(1, title=''), self._row(2, shift_end=timezone.now().isoformat())]
+        response = self.client.post('/api/matching/jobs/bulk-create', {'jobs': rows}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([error['row'] for error in response.data['errors']], [1, 2])
+        self.assertIn('title', response.data['errors'][0]['errors'])
+        self.assertFalse(Job.objects.exists())
+
+    def test_partial_creates_valid_rows(self):
+        rows = [self._row(0), self._row(1, title='')]
+        response = self.client.post('/api/matching/jobs/bulk-create', {'jobs': rows, 'partial': True},
+                                    format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['created'], 1)
+        self.assertEqual(response.data['errors'][0]['row'], 1)
+        self.assertEqual(Job.objects.count(), 1)
+
+    @override_settings(JOB_IMPORT_MAX_ROWS=2)
+    def test_batch_limits(self):
+        response = self.client.post('/api/matching/jobs/bulk-create', [self._row(n) for n in range(3)],
+                                    format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post('/api/matching/jobs/bulk-create', [], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Job.objects.exists())
+
+    def test_import_command(self):
+        csv_text = (
+            'title,description,short_description,skill_tags,accessibility,latitude,longitude,shift_start\n'
+            'Pantry,Stock shelves.,Stock shelves,Organization; Teamwork,heavy_lifting,42.73,-84.55,\n'
+            ',Missing title.,No title,,,,,\n'
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'shifts.csv')
+            with open(path, 'w') as f:
+                f.write(csv_text)
+            err = io.StringIO()
+            with self.assertRaises(CommandError):
+                call_command('import_jobs', path, '--poster', self.user.email, stdout=io.StringIO(), stderr=err)
+            self.assertIn('line 3', err.getvalue())
+            self.assertFalse(Job.objects.exists())
+
+            call_command('import_jobs', path, '--poster', self.user.email, '--partial',
+                         stdout=io.StringIO(), stderr=io.StringIO())
+        job = Job.objects.get()
+        self.assertEqual(job.skill_tags, ['Organization', 'Teamwork'])
+        self.assertEqual(job.accessibility_requirements, ['heavy_lifting'])
+        self.assertEqual(job.shift_end - job.shift_start, timezone.timedelta(hours=2))
+
+
 class MyPostedJobsTests(TestCase):
     def setUp(self):
         self.client = APIClient()
@@ -0,0 +1,78 @@
+import io
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from matching import lifecycle
+from matching.lifecycle import sweep
+from matching.models import Job, JobAcceptance
+
+
+class LifecycleSweepTests(TestCase):
+    def setUp(self):
+        self.poster = User.objects.create_user(
+            email='poster@example.com', username='poster', password='StrongPass123!'
+        )
+        self.volunteer = User.objects.create_user(
+            email='vol@example.com', username='vol', password='StrongPass123!'
+        )
+        now = timezone.now()
+        self.past = self._job('Past', now - timezone.timedelta(hours=5), now - timezone.timedelta(hours=1))
+        self.started = self._job('Started', now - timezone.timedelta(hours=1), now + timezone.timedelta(hours=1))
+        self.future = self._job('Future', now + timezone.timedelta(hours=5), now + timezone.timedelta(hours=7))
+        self.filled = self._job('Filled', now + timezone.timedelta(hours=5), now + timezone.timedelta(hours=7),
+                                status='filled')
+        for job in (self.past, self.started, self.future, self.filled):
+            JobAcceptance.objects.create(user=self.volunteer, job=job, status='pending')
+
+    def _job(self, title, start, end, status='open'):
+        return Job.objects.create(
+            title=title, description='Desc', short_description='Short', poster=self.poster,
+            latitude=42.73, longitude=-84.55, shift_start=start, shift_end=end, status=status,
+        )
+
+    def test_sweep_expires_jobs_and_stale_acceptances(self):
+        before = Job.objects.get(pk=self.past.pk).updated_at
+        self.assertEqual(sweep(dry_run=True), {'jobs_expired': 1, 'acceptances_expired': 3})
+        self.assertEqual(Job.objects.filter(status='expired').count(), 0)
+
+        self.assertEqual(sweep(batch_size=1), {'jobs_expired': 1, 'acceptances_expired': 3})
+        past = Job.objects.get(pk=self.past.pk)
+        self.assertEqual(past.status, 'expired')
+        self.assertGreater(past.updated_at, before)
+        self.assertEqual(
+            set(JobAcceptance.objects.filter(status='pending').values_list('job__title', flat=True)),
+            {'Future'},
+        )
+        self.assertEqual(sweep(), {'jobs_expired': 0, 'acceptances_expired': 0})
+
+    def test_rows_changed_after_select_are_left_alone(self):
+        next_ids = lifecycle._next_ids
+
+        def confirm_after_select(queryset, batch_size):
+            ids = next_ids(queryset, batch_size)
+            # The poster confirms the started shift's volunteer while the sweep runs
+            JobAcceptance.objects.filter(job=self.started).update(status='confirmed')
+            return ids
+
+        with mock.patch.object(lifecycle, '_next_ids', side_effect=confirm_after_select):
+            lifecycle.expire_acceptances()
+        self.assertEqual(JobAcceptance.objects.get(job=self.started).status, 'confirmed')
+        self.assertEqual(JobAcceptance.objects.get(job=self.past).status, 'expired')
+
+    def test_feed_hides_ended_shifts_before_sweep(self):
+        client = APIClient()
+        client.force_authenticate(user=self.volunteer)
+        titles = {job['title'] for job in client.get('/api/matching/jobs').data}
+        self.assertNotIn('Past', titles)
+        self.assertIn('Future', titles)
+
+    def test_command(self):
+        out = io.StringIO()
+        call_command('sweep_jobs', stdout=out)
+        self.assertIn('jobs_expired', out.getvalue())
+        self.assertEqual(Job.objects.get(pk=self.past.pk).status, 'expired')
@@ -0,0 +1,95 @@
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from matching.models import Notification, UserProfile
+from matching import spatial
+from matching.notifications import fan_out
+
+
+@override_settings(NOTIFY_FANOUT_ASYNC=False, NOTIFY_MIN_SCORE=60)
+class NotificationFanoutTests(TestCase):
+    def setUp(self):
+        self.poster = User.objects.create_user(
+            email='poster@example.com', username='poster', password='StrongPass123!'
+        )
+        UserProfile.objects.create(user=self.poster, latitude=42.73, longitude=-84.55, skill_tags=['Teaching'])
+        # (skills, latitude, radius)
+        self.volunteers = {}
+        for name, skills, lat, radius in [
+            ('near_skilled', ['Teaching'], 42.73, 25),
+            ('wide_radius', ['Teaching'], 43.5, 100),  # ~53 miles away, but willing to travel
+            ('near_unskilled', [], 42.9, 25),          # Reachable, scores below NOTIFY_MIN_SCORE
+            ('far', ['Teaching'], 43.5, 25),           # Outside their own radius
+        ]:
+            user = User.objects.create_user(email=f'{name}@example.com', username=name, password='StrongPass123!')
+            spatial.reindex(UserProfile.objects.create(
+                user=user, latitude=lat, longitude=-84.55, skill_tags=skills, max_distance_miles=radius,
+            ))
+            self.volunteers[name] = user
+        User.objects.create_user(email='unlocated@example.com', username='unlocated', password='StrongPass123!')
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.poster)
+
+    def _post_job(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/matching/jobs/create', {
+                'title': 'Tutor',
+                'description': 'Desc',
+                'short_description': 'Short',
+                'skill_tags': ['Teaching'],
+                'latitude': 42.73,
+                'longitude': -84.55,
+                'shift_start': (timezone.now() + timezone.timedelta(hours=12)).isoformat(),
+                'shift_end': (timezone.now() + timezone.timedelta(hours=14)).isoformat(),
+            }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data['id']
+
+    def test_new_job_notifies_matching_volunteers(self):
+        job_id = self._post_job()
+        notified = set(Notification.objects.filter(job_id=job_id).values_list('user__username', flat=True))
+        self.assertEqual(notified, {'near_skilled', 'wide_radius'})
+
+        # Reruns don't duplicate
+        fan_out(job_id)
+        self.assertEqual(Notification.objects.filter(job_id=job_id).count(), 2)
+
+    @override_settings(NOTIFY_MAX_RECIPIENTS=1)
+    def test_recipient_cap_keeps_best_scores(self):
+        job_id = self._post_job()
+        self.assertEqual(
+            list(Notification.objects.filter(job_id=job_id).values_list('user__username', flat=True)),
+            ['near_skilled'],
+        )
+
+    @override_settings(NOTIFY_FANOUT_ENABLED=False)
+    def test_disabled(self):
+        self._post_job()
+        self.assertFalse(Notification.objects.exists())
+
+    def test_inbox_and_mark_read(self):
+        job_id = self._post_job()
+        self.client.force_authenticate(user=self.volunteers['near_skilled'])
+
+        inbox = self.client.get('/api/matching/notifications')
+        self.assertEqual(inbox.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(inbox.data), 1)
+        self.assertEqual(str(inbox.data[0]['job']['id']), job_id)
+        self.assertFalse(inbox.data[0]['read'])
+        self.assertEqual(self.client.get('/api/matching/notifications/unread-count').data, {'unread': 1})
+
+        response = self.client.post('/api/matching/notifications/read', {'ids': [inbox.data[0]['id']]}, format='json')
+        self.assertEqual(response.data, {'marked_read': 1})
+        self.assertEqual(self.client.get('/api/matching/notifications/unread-count').data, {'unread': 0})
+        self.assertTrue(self.client.get('/api/matching/notifications').data[0]['read'])
+
+    def test_mark_read_validation(self):
+        url = '/api/matching/notifications/read'
+        self.assertEqual(self.client.post(url, {}, format='json').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.post(url, {'ids': ['nope']}, format='json').status_code,
+                         status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.post(url, {'all': True}, format='json').data, {'marked_read': 0})
@@ -0,0 +1,44 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from authentication.models import User
+from matching.models import Badge, UserProfile
+
+
+class ProfileReadOnlyTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@example.com', username='testuser', password='StrongPass123!'
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_get_profile_does_not_create_rows(self):
+        response = self.client.get('/api/matching/profile')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['profile']['max_distance_miles'], 25)
+        self.assertFalse(UserProfile.objects.filter(user=self.user).exists())
+        self.assertFalse(Badge.objects.filter(user=self.user).exists())
+
+    def test_get_location_does_not_create_rows(self):
+        response = self.client.get('/api/matching/location')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.data['has_location'])
+        self.assertFalse(UserProfile.objects.filter(user=self.user).exists())
+
+    def test_matched_jobs_without_profile(self):
+        response = self.client.get('/api/matching/jobs')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(UserProfile.objects.filter(user=self.user).exists())
+
+    def test_update_creates_missing_profile(self):
+        response = self.client.patch('/api/matching/profile', {'max_distance_miles': 40}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(UserProfile.objects.get(user=self.user).max_distance_miles, 40)
+
+    def test_get_profile_reads_existing_row(self):
+        UserProfile.objects.create(user=self.user, skill_tags=['Teaching'])
+        self.user.refresh_from_db()
+        response = self.client.get('/api/matching/profile')
+        self.assertEqual(response.data['profile']['skill_tags'], ['Teaching'])
@@ -0,0 +1,129 @@
+import io
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from matching.models import Job, JobAcceptance, JobRecurrence
+from matching.recurrence import materialize, occurrences
+
+# A Monday
+NOW = datetime(2026, 3, 2, 8, 0, tzinfo=dt_timezone.utc)
+
+
+class RecurrenceTestMixin:
+    def setUp(self):
+        self.poster = User.objects.create_user(
+            email='poster@example.com', username='poster', password='StrongPass123!'
+        )
+        self.template = Job.objects.create(
+            title='Food Bank Shift',
+            description='Pack boxes.',
+            short_description='Pack boxes',
+            poster=self.poster,
+            latitude=42.73,
+            longitude=-84.55,
+            skill_tags=['Teamwork'],
+            shift_start=NOW + timedelta(hours=1),
+            shift_end=NOW + timedelta(hours=4),
+            status='template',
+        )
+
+    def rule(self, **kwargs):
+        return JobRecurrence.objects.create(template=self.template, **kwargs)
+
+
+class OccurrenceTests(RecurrenceTestMixin, TestCase):
+    def test_weekly_on_weekdays(self):
+        rule = self.rule(frequency='weekly', weekdays=[0, 2, 4])
+        starts = list(occurrences(rule, NOW, NOW + timedelta(days=14)))
+        self.assertEqual([s.strftime('%a %d') for s in starts],
+                         ['Mon 02', 'Wed 04', 'Fri 06', 'Mon 09', 'Wed 11', 'Fri 13'])
+        self.assertTrue(all(s.hour == 9 for s in starts))
+
+    def test_interval_count_and_until(self):
+        rule = self.rule(frequency='daily', interval=3, count=4)
+        starts = list(occurrences(rule, NOW, NOW + timedelta(days=60)))
+        self.assertEqual([s.day for s in starts], [2, 5, 8, 11])
+
+        rule.count = None
+        rule.until = NOW + timedelta(days=7)
+        self.assertEqual(len(list(occurrences(rule, NOW, NOW + timedelta(days=60)))), 3)
+
+    def test_skips_ahead_without_count(self):
+        rule = self.rule(frequency='weekly', interval=2)
+        later = NOW + timedelta(days=400)
+        starts = list(occurrences(rule, later, later + timedelta(days=28)))
+        self.assertEqual(len(starts), 2)
+        self.assertTrue(all((s - self.template.shift_start).days % 14 == 0 for s in starts))
+
+
+class MaterializeTests(RecurrenceTestMixin, TestCase):
+    def test_materializes_within_horizon_and_is_idempotent(self):
+        self.rule(frequency='daily')
+        self.assertEqual(materialize(now=NOW, horizon_days=7), 7)
+        jobs = Job.objects.filter(template=self.template).order_by('shift_start')
+        self.assertEqual(jobs.count(), 7)
+        self.assertEqual(jobs[0].shift_end - jobs[0].shift_start, timedelta(hours=3))
+        self.assertEqual(jobs[0].status, 'open')
+        self.assertEqual(jobs[0].skill_mask, self.template.skill_mask)
+
+        # Already covered: nothing to do; a day later only the new day is added
+        self.assertEqual(materialize(now=NOW, horizon_days=7), 0)
+        self.assertEqual(materialize(now=NOW + timedelta(days=1), horizon_days=7), 1)
+        self.assertEqual(Job.objects.filter(template=self.template).count(), 8)
+
+    def test_command(self):
+        self.rule(frequency='weekly')
+        call_command('materialize_recurring_jobs', '--horizon-days', '400', stdout=io.StringIO())
+        self.assertGreater(Job.objects.filter(template=self.template).count(), 0)
+
+
+class JobRecurrenceAPITests(RecurrenceTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.template.status = 'open'
+        self.template.shift_start = timezone.now() + timedelta(hours=2)
+        self.template.shift_end = self.template.shift_start + timedelta(hours=3)
+        self.template.save()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.poster)
+        self.url = f'/api/matching/jobs/{self.template.id}/recurrence'
+
+    def test_make_recurring_and_stop(self):
+        response = self.client.post(self.url, {'frequency': 'daily'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['materialized'], 14)
+        self.template.refresh_from_db()
+        self.assertEqual(self.template.status, 'template')
+
+        volunteer = User.objects.create_user(
+            email='vol@example.com', username='vol', password='StrongPass123!'
+        )
+        self.client.force_authenticate(user=volunteer)
+        feed_ids = {job['id'] for job in self.client.get('/api/matching/jobs').data}
+        self.assertNotIn(str(self.template.id), feed_ids)
+
+        self.client.force_authenticate(user=self.poster)
+        response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(JobRecurrence.objects.exists())
+        self.assertEqual(materialize(), 0)
+
+    def test_rejects_invalid_rules_and_jobs_with_volunteers(self):
+        response = self.client.post(self.url, {'frequency': 'daily', 'weekdays': [1]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(self.url, {'frequency': 'weekly', 'weekdays': [7]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        volunteer = User.objects.create_user(
+            email='vol@example.com', username='vol', password='StrongPass123!'
+        )
+        JobAcceptance.objects.create(user=volunteer, job=self.template)
+        response = self.client.post(self.url, {'frequency': 'weekly'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(JobRecurrence.objects.exists())
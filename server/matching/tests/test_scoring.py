@@ -3,7 +3,8 @@ from django.utils import timezone
 
 from authentication.models import User
 from matching.models import Job, UserProfile
-from matching.scoring import calculate_score, haversine_distance
+from matching.scoring import calculate_score, haversine_distance, score_jobs
+from matching import tags
 
 
 class HaversineTests(TestCase):
@@ -117,3 +118,58 @@ class ScoringTests(TestCase):
         job = self._make_job()
         score, distance = calculate_score(self.profile, job)
         self.assertGreater(score, 0)  # Should still score (half distance points)
+
+    def test_skill_match_is_case_insensitive(self):
+        job = self._make_job(skill_tags=['teaching', 'COOKING'])
+        job_exact = self._make_job(skill_tags=['Teaching', 'Cooking'])
+        self.assertEqual(calculate_score(self.profile, job), calculate_score(self.profile, job_exact))
+
+    def test_unmapped_tags_fall_back_to_lists(self):
+        self.profile.skill_tags = ['Teaching', 'Knitting']
+        self.profile.limitations = ['loud_noise']
+        self.profile.save()
+        job_knitting = self._make_job(skill_tags=['Knitting'])
+        job_noise = self._make_job(accessibility_requirements=['loud_noise'])
+        job_other = self._make_job(skill_tags=['Welding'])
+
+        score_knitting, _ = calculate_score(self.profile, job_knitting)
+        score_other, _ = calculate_score(self.profile, job_other)
+        score_noise, _ = calculate_score(self.profile, job_noise)
+
+        self.assertGreater(score_knitting, score_other)
+        self.assertEqual(score_noise, 0)
+
+    def test_score_jobs_matches_calculate_score(self):
+        jobs = [
+            self._make_job(skill_tags=['Teaching']),
+            self._make_job(skill_tags=['Programming'], latitude=42.8),
+            self._make_job(latitude=30.0, longitude=-90.0),
+        ]
+        scored = score_jobs(self.profile, jobs)
+        self.assertEqual(len(scored), 2)
+        for job, score, distance in scored:
+            self.assertEqual((score, distance), calculate_score(self.profile, job))
+
+
+class TagMaskTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com', username='testuser', password='pass123'
+        )
+
+    def test_masks_kept_in_sync_on_save(self):
+        profile = UserProfile.objects.create(
+            user=self.user, skill_tags=['Teaching'], limitations=['heavy_lifting'],
+        )
+        self.assertEqual(profile.skill_mask, tags.skill_mask(['Teaching']))
+        self.assertEqual(profile.limitation_mask, tags.accessibility_mask(['heavy_lifting']))
+
+        profile.skill_tags = ['Cooking', 'Driving']
+        profile.save(update_fields=['skill_tags'])
+        profile.refresh_from_db()
+        self.assertEqual(profile.skill_mask, tags.skill_mask(['cooking', 'driving']))
+
+    def test_unmapped_tag_sets_marker_bit(self):
+        self.assertTrue(tags.is_exact(tags.skill_mask(['Teaching', 'first aid'])))
+        self.assertFalse(tags.is_exact(tags.skill_mask(['Teaching', 'Knitting'])))
+        self.assertFalse(tags.is_exact(tags.accessibility_mask(['loud_noise'])))
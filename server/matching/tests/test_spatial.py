@@ -0,0 +1,84 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from matching import spatial
+from matching.models import ProfileReachCell, UserProfile
+
+JOB_POINT = (42.73, -84.55)
+
+
+class ReachCellTests(TestCase):
+    def test_cells_cover_the_circle(self):
+        lat, lng, radius = 42.73, -84.55, 25
+        cells = set(spatial.reach_cells(lat, lng, radius))
+        self.assertIn(spatial.cell_of(lat, lng), cells)
+        for d_lat, d_lng in [(0.36, 0), (-0.36, 0), (0, 0.49), (0, -0.49), (0.25, 0.34)]:
+            self.assertIn(spatial.cell_of(lat + d_lat, lng + d_lng), cells)
+        self.assertLessEqual(len(cells), 9)
+        self.assertGreater(len(spatial.reach_cells(lat, lng, 100)), len(cells))
+
+    def test_radius_clamped(self):
+        self.assertEqual(spatial.reach_cells(42.73, -84.55, 100000), spatial.reach_cells(42.73, -84.55, 100))
+
+    def test_wraps_at_antimeridian(self):
+        cells = spatial.reach_cells(0, 179.9, 25)
+        self.assertIn(spatial.cell_of(0, -179.9), cells)
+        # Near a pole the circle spans every longitude
+        self.assertEqual(len({col for _, col in spatial.reach_cells(89.9, 0, 100)}), spatial.COLUMNS)
+
+
+class ReachIndexTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email='vol@example.com', username='vol', password='StrongPass123!')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def _reaching(self):
+        return [
+            profile.user_id for profile in spatial.profiles_reaching(*JOB_POINT)
+            if spatial.can_reach(profile, *JOB_POINT)
+        ]
+
+    def test_kept_current_by_location_endpoints(self):
+        self.assertEqual(self._reaching(), [])
+
+        self.client.put('/api/matching/location', {
+            'location_source': 'gps', 'latitude': 42.9, 'longitude': -84.55, 'max_distance_miles': 25,
+        }, format='json')
+        self.assertEqual(self._reaching(), [self.user.id])
+
+        # Shrinking the radius takes the job (~12 miles away) out of reach
+        self.client.patch('/api/matching/profile', {'max_distance_miles': 5}, format='json')
+        self.assertEqual(self._reaching(), [])
+
+        self.client.put('/api/matching/location', {
+            'location_source': 'gps', 'latitude': 42.74, 'longitude': -84.55,
+        }, format='json')
+        self.assertEqual(self._reaching(), [self.user.id])
+
+        self.client.delete('/api/matching/location/revoke')
+        self.assertEqual(self._reaching(), [])
+        self.assertFalse(ProfileReachCell.objects.exists())
+
+    def test_profile_radius_bounded(self):
+        response = self.client.patch('/api/matching/profile', {'max_distance_miles': 100000}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.client.patch('/api/matching/profile', {'max_distance_miles': 0},
+                                           format='json').status_code, 400)
+        self.assertFalse(ProfileReachCell.objects.exists())
+
+    def test_rebuild_command(self):
+        profile = UserProfile.objects.create(user=self.user, latitude=42.74, longitude=-84.55)
+        unlocated = User.objects.create_user(email='x@example.com', username='x', password='StrongPass123!')
+        UserProfile.objects.create(user=unlocated)
+        self.assertEqual(self._reaching(), [])  # Written directly, so not indexed yet
+
+        out = StringIO()
+        call_command('rebuild_reach_index', '--batch-size', '1', stdout=out)
+        self.assertIn('Indexed 2 profile(s)', out.getvalue())
+        self.assertEqual(self._reaching(), [self.user.id])
+        self.assertEqual(ProfileReachCell.objects.count(), len(spatial.index_rows(profile)))
@@ -0,0 +1,65 @@
+from django.test import TestCase
+
+from authentication.models import User
+from matching import synthetic, tags
+from chat.models import Conversation, Message
+from matching.models import Job, JobAcceptance, JobCompletion, MatchingInterest, UserProfile
+
+
+class SyntheticDataTests(TestCase):
+    def test_generate_counts(self):
+        generator = synthetic.generate(jobs=60, users=40, seed=1)
+        self.assertEqual(len(generator.posters), 3)
+        self.assertEqual(Job.objects.count(), 60)
+        self.assertEqual(User.objects.count(), 43)
+        self.assertEqual(UserProfile.objects.count(), 43)
+        for model in (MatchingInterest, JobAcceptance, JobCompletion, Conversation, Message):
+            self.assertTrue(model.objects.exists(), model.__name__)
+
+    def test_bulk_rows_have_tag_masks(self):
+        synthetic.generate(jobs=30, users=30, seed=2)
+        for job in Job.objects.all():
+            self.assertEqual(job.skill_mask, tags.skill_mask(job.skill_tags))
+            self.assertEqual(job.accessibility_mask, tags.accessibility_mask(job.accessibility_requirements))
+        for profile in UserProfile.objects.all():
+            self.assertEqual(profile.skill_mask, tags.skill_mask(profile.skill_tags))
+            self.assertEqual(profile.limitation_mask, tags.accessibility_mask(profile.limitations))
+
+    def test_same_seed_same_data(self):
+        synthetic.generate(jobs=20, users=10, seed=3)
+        first = list(Job.objects.order_by('title').values_list('title', 'latitude', 'longitude', 'skill_tags'))
+        Job.objects.all().delete()
+        User.objects.all().delete()
+        synthetic.generate(jobs=20, users=10, seed=3)
+        second = list(Job.objects.order_by('title').values_list('title', 'latitude', 'longitude', 'skill_tags'))
+        self.assertEqual(first, second)
+
+    def test_synthetic_users_can_log_in(self):
+        synthetic.generate(jobs=5, users=2, seed=4)
+        user = User.objects.get(email='volunteer0@example.com')
+        self.assertTrue(user.check_password(synthetic.PASSWORD))
+
+    def test_activity_is_consistent(self):
+        synthetic.generate(jobs=40, users=60, seed=5)
+        right_swipes = MatchingInterest.objects.filter(interested=True).count()
+        self.assertEqual(JobAcceptance.objects.count(), right_swipes)
+        self.assertEqual(
+            JobCompletion.objects.count(),
+            JobAcceptance.objects.filter(status__in=['completed', 'dropped']).count(),
+        )
+        self.assertEqual(
+            Conversation.objects.count(),
+            JobAcceptance.objects.filter(status__in=['confirmed', 'completed']).count(),
+        )
+        for conversation in Conversation.objects.select_related('job'):
+            self.assertEqual(conversation.poster_id, conversation.job.poster_id)
+
+    def test_metros(self):
+        metros = [synthetic.parse_metro('detroit'), synthetic.parse_metro('41.88,-87.63:3')]
+        self.assertEqual(metros[1].weight, 3)
+        generator = synthetic.Generator(seed=6, metros=metros, spread_miles=5)
+        generator.create_users(50)
+        for profile in UserProfile.objects.exclude(latitude=None):
+            self.assertTrue(any(abs(profile.latitude - m.latitude) < 1 for m in metros))
+        with self.assertRaises(ValueError):
+            synthetic.parse_metro('atlantis')
@@ -11,9 +11,11 @@ urlpatterns = [
 
     # Job CRUD
     path('jobs/create', views.create_job, name='job-create'),
+    path('jobs/bulk-create', views.bulk_create_jobs, name='job-bulk-create'),
     path('jobs/my-posted', views.my_posted_jobs, name='my-posted-jobs'),
     path('jobs/<uuid:job_id>/update', views.update_job, name='job-update'),
     path('jobs/<uuid:job_id>/delete', views.delete_job, name='job-delete'),
+    path('jobs/<uuid:job_id>/recurrence', views.job_recurrence, name='job-recurrence'),
 
     # Acceptance
     path('jobs/accepted', views.my_accepted_jobs, name='my-accepted-jobs'),
@@ -22,10 +24,19 @@ urlpatterns = [
     path('jobs/<uuid:job_id>/confirm', views.confirm_volunteer, name='confirm-volunteer'),
     path('jobs/<uuid:job_id>/retract', views.retract_application, name='retract-application'),
     path('jobs/<uuid:job_id>/interested', views.job_interested_users, name='job-interested-users'),
+    path('jobs/<uuid:job_id>/candidates', views.job_candidates, name='job-candidates'),
 
     # Profile
     path('profile', views.get_or_update_profile, name='profile'),
 
+    # Staff analytics
+    path('coverage', views.coverage_heatmap, name='coverage'),
+
+    # Notifications
+    path('notifications', views.notifications, name='notifications'),
+    path('notifications/unread-count', views.unread_notification_count, name='notifications-unread-count'),
+    path('notifications/read', views.mark_notifications_read, name='notifications-read'),
+
     # Location (privacy-preserving)
     path('location', views.update_location, name='location'),
     path('location/revoke', views.revoke_location, name='revoke-location'),
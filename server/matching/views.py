@@ -1,21 +1,55 @@
+import time
+
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Count, F, Max, Q
 from django.utils import timezone
 
 from authentication.models import User
-from .models import Job, UserProfile, MatchingInterest, JobAcceptance
+from core import metrics
+from core.conditional import conditional
+from .models import (
+    ArchivedJob, ArchivedJobAcceptance, ArchivedMatchingInterest, Job, JobRecurrence,
+    MatchingInterest, JobAcceptance, Notification,
+)
 from .serializers import (
     JobMatchSerializer, JobDetailSerializer, MatchingInterestSerializer,
     JobCompletionSerializer, JobCreateSerializer, UserProfileSerializer,
     UserProfileFullSerializer, LocationUpdateSerializer, BadgeSerializer,
     JobAcceptanceSerializer, AcceptVolunteerSerializer, InterestedUserSerializer,
+    JobRecurrenceSerializer, ArchivedJobSerializer, ArchivedJobAcceptanceSerializer,
+    NotificationSerializer,
 )
-from .scoring import calculate_score
-from .badges import compute_badges, record_completion
+from .scoring import score_jobs
+from . import candidates, coverage, spatial, tags
+from .badges import badges_version, compute_badges, record_completion
 from .geocoding import reverse_geocode, forward_geocode
+from .profiles import get_profile, get_profile_for_update
+from .feed import build_cards, load_candidates
+from .job_import import build_job, flags_to_requirements, import_jobs
+from .recurrence import materialize
+from .notifications import schedule_fanout
+
+
+def _exclude_accessibility_conflicts(jobs, profile):
+    """
+    Drop jobs whose requirements overlap the user's limitations in SQL.
+
+    Only vocabulary bits are compared; limitations outside the vocabulary
+    are still caught by the scorer's list fallback.
+    """
+    limitation_bits = profile.limitation_mask & ~tags.UNMAPPED_BIT
+    if not limitation_bits:
+        return jobs
+    return jobs.alias(
+        accessibility_conflict=F('accessibility_mask').bitand(limitation_bits),
+    ).filter(accessibility_conflict=0)
 
 
 @api_view(['GET'])
@@ -23,13 +57,15 @@ from .geocoding import reverse_geocode, forward_geocode
 def matched_jobs(request):
     limit = int(request.query_params.get('limit', 20))
 
-    profile, _ = UserProfile.objects.get_or_create(user=request.user)
+    profile = get_profile(request)
 
     # Use user's max_distance preference, or default to 25
     radius = profile.max_distance_miles or 25
 
-    # Pre-filter: open, active jobs
-    jobs = Job.objects.filter(status='open', is_active=True).select_related('poster')
+    # Pre-filter: open, active jobs the user is able to do. Shifts that have
+    # ended would otherwise rank as most urgent until the sweeper expires them.
+    jobs = Job.objects.filter(status='open', is_active=True, shift_end__gt=timezone.now())
+    jobs = _exclude_accessibility_conflicts(jobs, profile)
 
     # Bounding box pre-filter if user has location
     if profile.latitude is not None and profile.longitude is not None:
@@ -43,26 +79,18 @@ def matched_jobs(request):
             longitude__lte=profile.longitude + lon_delta,
         )
 
-    # Score and rank
-    scored = []
-    for job in jobs:
-        score, distance = calculate_score(profile, job, radius=radius)
-        if score > 0:
-            scored.append((job, score, distance))
-
+    # Score and rank, loading only the columns scoring needs
+    job_rows = load_candidates(jobs)
+    start = time.perf_counter()
+    scored = score_jobs(profile, job_rows, radius=radius)
     scored.sort(key=lambda x: x[1], reverse=True)
     scored = scored[:limit]
+    metrics.scoring_duration.observe(time.perf_counter() - start)
+    metrics.feed_candidates_scanned.inc(len(job_rows))
+    metrics.feed_jobs_returned.inc(len(scored))
 
     # Serialize with injected score/distance (privacy-safe: no raw coords)
-    results = []
-    for job, score, distance in scored:
-        job._distance = distance  # Attach for serializer
-        data = JobMatchSerializer(job).data
-        data['score'] = score
-        data['distance'] = round(distance, 1) if distance else None
-        results.append(data)
-
-    return Response(results)
+    return Response(build_cards(scored))
 
 
 @api_view(['POST'])
@@ -100,15 +128,28 @@ def swipe_interest(request):
     })
 
 
+def _user_stamp(user):
+    """Fields of the user that appear in profile and job payloads."""
+    return user.pk, user.email, user.username, user.first_name, user.last_name, user.avatar.name
+
+
+def _badges_stamp(request, user_id):
+    user = User.objects.only('id', 'username', 'date_joined').filter(id=user_id).first()
+    if user is None:
+        return None
+    return user.username, badges_version(user)
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@conditional(_badges_stamp)
 def user_badges(request, user_id):
     try:
         user = User.objects.get(id=user_id)
     except User.DoesNotExist:
         return Response({'error': 'User not found'}, status=status.HTTP_404_NOT_FOUND)
 
-    badges = compute_badges(user)
+    badges = compute_badges(user, persist=False)
     return Response({
         'user_id': str(user.id),
         'username': user.username,
@@ -146,7 +187,7 @@ def complete_job(request):
     # If poster is marking the job complete, update job status too
     if job.poster == request.user:
         job.status = 'completed'
-        job.save(update_fields=['status'])
+        job.save(update_fields=['status', 'updated_at'])
 
     badges = record_completion(request.user, job, completed=completed)
     return Response({
@@ -158,13 +199,6 @@ def complete_job(request):
 
 # ── Job CRUD ──────────────────────────────────────────────────────────────────
 
-def _accessibility_flags_to_requirements(flags):
-    """Convert {heavy_lifting: true, ...} dict to ['heavy_lifting', ...] list."""
-    if not flags or not isinstance(flags, dict):
-        return []
-    return [key for key, val in flags.items() if val]
-
-
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def create_job(request):
@@ -180,38 +214,58 @@ def create_job(request):
     if lat is not None and lng is not None:
         location_label = reverse_geocode(lat, lng)
 
-    defaults = {
-        'title': data['title'],
-        'description': data['description'],
-        'short_description': data['short_description'],
-        'poster': request.user,
-        'skill_tags': data.get('skill_tags', []),
-        'accessibility_requirements': _accessibility_flags_to_requirements(data.get('accessibility_flags', {})),
-        'latitude': lat,
-        'longitude': lng,
-        'location_label': location_label,
-        'image': data.get('image', ''),
-    }
+    job = build_job(data, request.user, location_label)
+    job.save()
+    schedule_fanout(job)
+    return Response(JobDetailSerializer(job).data, status=status.HTTP_201_CREATED)
 
-    if data.get('shift_start'):
-        defaults['shift_start'] = data['shift_start']
-    else:
-        defaults['shift_start'] = timezone.now() + timezone.timedelta(hours=24)
 
-    if data.get('shift_end'):
-        defaults['shift_end'] = data['shift_end']
-    else:
-        defaults['shift_end'] = defaults['shift_start'] + timezone.timedelta(hours=2)
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def bulk_create_jobs(request):
+    """
+    Create up to JOB_IMPORT_MAX_ROWS jobs in one request.
+
+    Body: a list of create_job payloads, or {"jobs": [...], "partial": bool}.
+    Without partial, any invalid row rejects the whole batch.
+    """
+    data = request.data
+    rows = data.get('jobs') if isinstance(data, dict) else data
+    if not isinstance(rows, list) or not rows:
+        return Response({'error': 'Expected a non-empty list of jobs.'}, status=status.HTTP_400_BAD_REQUEST)
+    max_rows = settings.JOB_IMPORT_MAX_ROWS
+    if len(rows) > max_rows:
+        return Response({'error': f'At most {max_rows} jobs per request.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    partial = isinstance(data, dict) and bool(data.get('partial'))
+    result = import_jobs(rows, request.user, partial=partial)
+    body = {
+        'created': len(result.jobs),
+        'jobs': [{'row': index, 'id': job.id} for index, job in result.jobs],
+        'errors': result.errors,
+    }
+    if not result.jobs:
+        return Response(body, status=status.HTTP_400_BAD_REQUEST)
+    return Response(body, status=status.HTTP_201_CREATED)
 
-    job = Job.objects.create(**defaults)
-    return Response(JobDetailSerializer(job).data, status=status.HTTP_201_CREATED)
+
+def _posted_jobs_stamp(request):
+    # is_urgent flips as shifts come within 24 hours, so count those too
+    stats = Job.objects.filter(poster=request.user, is_active=True).aggregate(
+        count=Count('id'),
+        latest=Max('updated_at'),
+        urgent=Count('id', filter=Q(shift_start__lte=timezone.now() + timezone.timedelta(hours=24))),
+    )
+    return _user_stamp(request.user), stats['count'], stats['latest'], stats['urgent']
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@conditional(_posted_jobs_stamp)
 def my_posted_jobs(request):
     jobs = Job.objects.filter(poster=request.user, is_active=True).select_related('poster')
-    data = JobMatchSerializer(jobs, many=True).data
+    archived = ArchivedJob.objects.filter(poster=request.user, is_active=True).select_related('poster')
+    data = JobMatchSerializer(jobs, many=True).data + ArchivedJobSerializer(archived, many=True).data
     return Response(data)
 
 
@@ -232,7 +286,7 @@ def update_job(request, job_id):
             setattr(job, field, request.data[field])
 
     if 'accessibility_flags' in request.data:
-        job.accessibility_requirements = _accessibility_flags_to_requirements(request.data['accessibility_flags'])
+        job.accessibility_requirements = flags_to_requirements(request.data['accessibility_flags'])
 
     job.save()
     return Response(JobMatchSerializer(job).data)
@@ -254,16 +308,68 @@ def delete_job(request, job_id):
     return Response({'status': 'Job deleted.'}, status=status.HTTP_200_OK)
 
 
+@api_view(['POST', 'DELETE'])
+@permission_classes([IsAuthenticated])
+def job_recurrence(request, job_id):
+    """
+    POST turns an open job into a recurring template (or replaces its rule)
+    and materializes the first occurrences. DELETE stops the series. Either
+    way, shifts already materialized stay posted.
+    """
+    try:
+        job = Job.objects.get(id=job_id, is_active=True)
+    except Job.DoesNotExist:
+        return Response({'error': 'Job not found'}, status=status.HTTP_404_NOT_FOUND)
+
+    if job.poster != request.user:
+        return Response({'error': 'Only the poster can change this job.'}, status=status.HTTP_403_FORBIDDEN)
+
+    if request.method == 'DELETE':
+        if job.status != 'template':
+            return Response({'error': 'Job is not recurring.'}, status=status.HTTP_400_BAD_REQUEST)
+        with transaction.atomic():
+            JobRecurrence.objects.filter(template=job).delete()
+            job.is_active = False
+            job.save(update_fields=['is_active', 'updated_at'])
+        return Response({'status': 'Recurrence stopped.'})
+
+    if job.status != 'template' and (job.status != 'open' or job.acceptances.exists()):
+        return Response(
+            {'error': 'Only open jobs without volunteers can be made recurring.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    serializer = JobRecurrenceSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    with transaction.atomic():
+        JobRecurrence.objects.filter(template=job).delete()
+        recurrence = serializer.save(template=job)
+        if job.status != 'template':
+            job.status = 'template'
+            job.save(update_fields=['status', 'updated_at'])
+    # Post the near-term shifts now rather than at the next scheduled run
+    created = materialize(JobRecurrence.objects.filter(pk=recurrence.pk))
+    recurrence.refresh_from_db()
+    return Response({**JobRecurrenceSerializer(recurrence).data, 'materialized': created},
+                    status=status.HTTP_201_CREATED)
+
+
 # ── Profile ───────────────────────────────────────────────────────────────────
 
+def _profile_stamp(request):
+    # An unsaved default profile has no updated_at and a fresh random pk
+    profile = get_profile(request)
+    return _user_stamp(request.user), profile.updated_at, badges_version(request.user)
+
+
 @api_view(['GET', 'PUT', 'PATCH'])
 @permission_classes([IsAuthenticated])
+@conditional(_profile_stamp)
 def get_or_update_profile(request):
-    profile, _ = UserProfile.objects.get_or_create(user=request.user)
-
     if request.method == 'GET':
         from authentication.serializers import UserSerializer
-        badges = compute_badges(request.user)
+        profile = get_profile(request)
+        badges = compute_badges(request.user, persist=False)
         return Response({
             'user': UserSerializer(request.user, context={'request': request}).data,
             'profile': UserProfileFullSerializer(profile).data,
@@ -271,15 +377,18 @@ def get_or_update_profile(request):
         })
 
     # PUT / PATCH - update skills, limitations, max_distance
+    profile = get_profile_for_update(request)
     allowed_fields = ['skill_tags', 'limitations', 'max_distance_miles']
     update_data = {k: v for k, v in request.data.items() if k in allowed_fields}
 
     serializer = UserProfileFullSerializer(profile, data=update_data, partial=True)
     serializer.is_valid(raise_exception=True)
     serializer.save()
+    if 'max_distance_miles' in update_data:
+        spatial.reindex(profile)
 
     from authentication.serializers import UserSerializer
-    badges = compute_badges(request.user)
+    badges = compute_badges(request.user, persist=False)
     return Response({
         'user': UserSerializer(request.user, context={'request': request}).data,
         'profile': UserProfileFullSerializer(profile).data,
@@ -294,9 +403,8 @@ def update_location(request):
     GET: Return current location info
     PUT: Update location (GPS or manual)
     """
-    profile, _ = UserProfile.objects.get_or_create(user=request.user)
-
     if request.method == 'GET':
+        profile = get_profile(request)
         return Response({
             'location_source': profile.location_source,
             'location_label': profile.location_label,
@@ -311,6 +419,8 @@ def update_location(request):
     serializer.is_valid(raise_exception=True)
     data = serializer.validated_data
 
+    profile = get_profile_for_update(request)
+
     source = data.get('location_source', 'gps')
     profile.location_source = source
 
@@ -340,6 +450,7 @@ def update_location(request):
 
     profile.last_location_update = timezone.now()
     profile.save()
+    spatial.reindex(profile)
 
     return Response({
         'location_source': profile.location_source,
@@ -355,7 +466,7 @@ def update_location(request):
 @permission_classes([IsAuthenticated])
 def revoke_location(request):
     """Remove location data (user revoking permission)."""
-    profile, _ = UserProfile.objects.get_or_create(user=request.user)
+    profile = get_profile_for_update(request)
 
     profile.latitude = None
     profile.longitude = None
@@ -363,6 +474,7 @@ def revoke_location(request):
     profile.location_source = 'manual'
     profile.last_location_update = None
     profile.save()
+    spatial.reindex(profile)
 
     return Response({
         'message': 'Location data removed',
@@ -436,7 +548,11 @@ def my_accepted_jobs(request):
     acceptances = JobAcceptance.objects.filter(
         user=request.user, is_active=True,
     ).select_related('job', 'job__poster')
-    data = JobAcceptanceSerializer(acceptances, many=True).data
+    archived = ArchivedJobAcceptance.objects.filter(
+        user=request.user, is_active=True,
+    ).select_related('job', 'job__poster')
+    data = (JobAcceptanceSerializer(acceptances, many=True).data
+            + ArchivedJobAcceptanceSerializer(archived, many=True).data)
     return Response(data)
 
 
@@ -458,6 +574,37 @@ def job_interested_users(request, job_id):
     return Response(data)
 
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def job_candidates(request, job_id):
+    """
+    Interested volunteers ranked by match score, paginated with limit/offset.
+
+    Unlike job_interested_users, every volunteer is scored against the job
+    with the feed's weights (distance, skill overlap, reliability).
+    """
+    try:
+        job = Job.objects.get(id=job_id, is_active=True)
+    except Job.DoesNotExist:
+        return Response({'error': 'Job not found'}, status=status.HTTP_404_NOT_FOUND)
+
+    if job.poster_id != request.user.id:
+        return Response({'error': 'Only the poster can view candidates.'}, status=status.HTTP_403_FORBIDDEN)
+
+    try:
+        limit = min(max(int(request.query_params.get('limit', 20)), 1), 100)
+        offset = max(int(request.query_params.get('offset', 0)), 0)
+    except ValueError:
+        return Response({'error': 'limit and offset must be integers.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    ranked = candidates.ranked_candidates(job)
+    return Response({
+        'count': len(ranked),
+        'next_offset': offset + limit if offset + limit < len(ranked) else None,
+        'results': ranked[offset:offset + limit],
+    })
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def my_interested_jobs(request):
@@ -465,7 +612,10 @@ def my_interested_jobs(request):
         user=request.user, interested=True,
     ).select_related('job', 'job__poster')
     jobs = [i.job for i in interests]
-    data = JobMatchSerializer(jobs, many=True).data
+    archived = [i.job for i in ArchivedMatchingInterest.objects.filter(
+        user=request.user, interested=True,
+    ).select_related('job', 'job__poster')]
+    data = JobMatchSerializer(jobs, many=True).data + ArchivedJobSerializer(archived, many=True).data
     return Response(data)
 
 
@@ -495,10 +645,77 @@ def retract_application(request, job_id):
     acceptance.delete()
 
     # Also update the MatchingInterest to not interested
-    MatchingInterest.objects.filter(user=request.user, job=job).update(interested=False)
+    # update() skips auto_now; incremental exports need updated_at to move
+    MatchingInterest.objects.filter(user=request.user, job=job).update(interested=False, updated_at=timezone.now())
 
     return Response({
         'status': 'Application retracted',
         'job_id': str(job_id),
         'job_title': job.title,
     })
+
+
+# ── Notifications ─────────────────────────────────────────────────────────────
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def notifications(request):
+    """Newest-first inbox, paginated with limit/offset."""
+    try:
+        limit = min(max(int(request.query_params.get('limit', 20)), 1), 100)
+        offset = max(int(request.query_params.get('offset', 0)), 0)
+    except ValueError:
+        return Response({'error': 'limit and offset must be integers.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    entries = Notification.objects.filter(user=request.user).select_related('job', 'job__poster')
+    data = NotificationSerializer(entries[offset:offset + limit], many=True).data
+    return Response(data)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def unread_notification_count(request):
+    """Badge count for clients to poll; served from the partial unread index."""
+    count = Notification.objects.filter(user=request.user, read_at__isnull=True).count()
+    return Response({'unread': count})
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def mark_notifications_read(request):
+    """Mark the given notification ids read, or all of them with {"all": true}."""
+    unread = Notification.objects.filter(user=request.user, read_at__isnull=True)
+    if not request.data.get('all'):
+        ids = request.data.get('ids')
+        if not isinstance(ids, list):
+            return Response({'error': 'Provide ids or all.'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            unread = unread.filter(id__in=ids)
+        except ValidationError:
+            return Response({'error': 'Invalid notification id.'}, status=status.HTTP_400_BAD_REQUEST)
+    now = timezone.now()
+    updated = unread.update(read_at=now, updated_at=now)
+    return Response({'marked_read': updated})
+
+
+# ── Coverage analytics ────────────────────────────────────────────────────────
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def coverage_heatmap(request):
+    """
+    Staff heatmap of open jobs vs. active volunteers per grid cell.
+
+    Served from the CoverageCell rollup (manage.py build_coverage); ?zoom=
+    picks the cell size, from 0 (1 degree) to 2 (0.1 degree).
+    """
+    try:
+        zoom = int(request.query_params.get('zoom', 0))
+    except ValueError:
+        zoom = None
+    if zoom not in coverage.ZOOM_LEVELS:
+        return Response(
+            {'error': f'zoom must be one of {", ".join(map(str, coverage.ZOOM_LEVELS))}.'},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return Response(coverage.heatmap(zoom))